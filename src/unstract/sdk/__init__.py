@@ -1,3 +1,9 @@
+from unstract.sdk import profiler
+
+if profiler.is_enabled_by_env():
+    # Enabled first so that the imports of the SDK are timed
+    profiler.enable()
+
 __version__ = "v0.79.0"
 
 
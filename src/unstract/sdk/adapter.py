@@ -1,27 +1,53 @@
+import copy
 import json
 import logging
+import os
 from typing import Any
 
-import requests
 from requests.exceptions import ConnectionError, HTTPError
 from unstract.sdk.adapters.utils import AdapterUtils
 from unstract.sdk.constants import AdapterKeys, LogLevel, ToolEnv
 from unstract.sdk.exceptions import SdkError
 from unstract.sdk.helper import SdkHelper
-from unstract.sdk.platform import PlatformBase
+from unstract.sdk.platform import PlatformBase, get_http_session
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.utils.retry_utils import retry_platform_service_call
+from unstract.sdk.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+class Constants:
+    CONFIG_CACHE_TTL = "ADAPTER_CONFIG_CACHE_TTL"
+    CONFIG_CACHE_MAX_SIZE = "ADAPTER_CONFIG_CACHE_MAX_SIZE"
+    DEFAULT_CONFIG_CACHE_TTL = 300
+    DEFAULT_CONFIG_CACHE_MAX_SIZE = 256
+    # Status codes from platforms which don't serve the bulk endpoint
+    BULK_UNSUPPORTED_STATUS_CODES = (404, 405)
+
+
 class ToolAdapter(PlatformBase):
     """Class to handle Adapters for Unstract Tools.
 
+    Configs fetched from the platform are cached in-process for
+    ADAPTER_CONFIG_CACHE_TTL seconds (default 300, 0 disables it), holding
+    at most ADAPTER_CONFIG_CACHE_MAX_SIZE (default 256) configs.
+
     Notes:
         - PLATFORM_SERVICE_API_KEY environment variable is required.
     """
 
+    _config_cache = TTLCache(
+        maxsize=int(
+            os.environ.get(
+                Constants.CONFIG_CACHE_MAX_SIZE, Constants.DEFAULT_CONFIG_CACHE_MAX_SIZE
+            )
+        ),
+        ttl=float(
+            os.environ.get(Constants.CONFIG_CACHE_TTL, Constants.DEFAULT_CONFIG_CACHE_TTL)
+        ),
+    )
+
     def __init__(
         self,
         tool: BaseTool,
@@ -67,44 +93,96 @@ class ToolAdapter(PlatformBase):
         query_params = {AdapterKeys.ADAPTER_INSTANCE_ID: adapter_instance_id}
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
         try:
-            response = requests.get(url, headers=headers, params=query_params)
+            response = get_http_session().get(
+                url, headers=headers, params=query_params
+            )
             response.raise_for_status()
             adapter_data: dict[str, Any] = response.json()
+        except HTTPError as e:
+            raise self._parse_adapter_err(e) from e
+        return self._process_adapter_data(adapter_instance_id, adapter_data)
 
-            # Removing name and type to avoid migration for already indexed records
-            adapter_name = adapter_data.pop("adapter_name", "")
-            adapter_type = adapter_data.pop("adapter_type", "")
-            provider = adapter_data.get("adapter_id", "").split("|")[0]
-            # TODO: Print metadata after redacting sensitive information
-            self.tool.stream_log(
-                f"Retrieved config for '{adapter_instance_id}', type: "
-                f"'{adapter_type}', provider: '{provider}', name: '{adapter_name}'",
-                level=LogLevel.DEBUG,
+    @retry_platform_service_call
+    def _get_adapter_configurations(
+        self,
+        adapter_instance_ids: list[str],
+    ) -> dict[str, dict[str, Any]] | None:
+        """Get the configs of several adapters in a single request.
+
+        Args:
+            adapter_instance_ids (list[str]): Adapter instance IDs
+
+        Returns:
+            Optional[dict[str, dict[str, Any]]]: Config against each adapter
+                instance ID or None if the platform doesn't support fetching
+                configs in bulk
+        """
+        url = f"{self.base_url}/adapter_instances"
+        query_params = {AdapterKeys.ADAPTER_INSTANCE_IDS: ",".join(adapter_instance_ids)}
+        headers = {"Authorization": f"Bearer {self.bearer_token}"}
+        try:
+            response = get_http_session().get(
+                url, headers=headers, params=query_params
             )
+            if response.status_code in Constants.BULK_UNSUPPORTED_STATUS_CODES:
+                return None
+            response.raise_for_status()
+            adapters_data: dict[str, dict[str, Any]] = response.json()
         except HTTPError as e:
-            default_err = (
-                "Error while calling the platform service, please contact the admin."
-            )
-            msg = AdapterUtils.get_msg_from_request_exc(
-                err=e, message_key="error", default_err=default_err
+            raise self._parse_adapter_err(e) from e
+        return {
+            adapter_instance_id: self._process_adapter_data(
+                adapter_instance_id, adapter_data
             )
-            raise SdkError(f"Error retrieving adapter. {msg}") from e
+            for adapter_instance_id, adapter_data in adapters_data.items()
+        }
+
+    def _process_adapter_data(
+        self, adapter_instance_id: str, adapter_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        # Removing name and type to avoid migration for already indexed records
+        adapter_name = adapter_data.pop("adapter_name", "")
+        adapter_type = adapter_data.pop("adapter_type", "")
+        provider = adapter_data.get("adapter_id", "").split("|")[0]
+        # TODO: Print metadata after redacting sensitive information
+        self.tool.stream_log(
+            f"Retrieved config for '{adapter_instance_id}', type: "
+            f"'{adapter_type}', provider: '{provider}', name: '{adapter_name}'",
+            level=LogLevel.DEBUG,
+        )
         return adapter_data
 
+    @staticmethod
+    def _parse_adapter_err(e: HTTPError) -> SdkError:
+        default_err = (
+            "Error while calling the platform service, please contact the admin."
+        )
+        msg = AdapterUtils.get_msg_from_request_exc(
+            err=e, message_key="error", default_err=default_err
+        )
+        return SdkError(f"Error retrieving adapter. {msg}")
+
+    def _get_cache_key(self, adapter_instance_id: str) -> tuple[str, str, str]:
+        # Scoped to the platform and API key since configs are per organization
+        return (self.base_url, self.bearer_token, adapter_instance_id)
+
     @staticmethod
     def get_adapter_config(
-        tool: BaseTool, adapter_instance_id: str
+        tool: BaseTool, adapter_instance_id: str, use_cache: bool = True
     ) -> dict[str, Any] | None:
         """Get adapter spec by the help of unstract DB tool.
 
         This method first checks if the adapter_instance_id matches
         any of the public adapter keys. If it matches, the configuration
         is fetched from environment variables. Otherwise, it connects to the
-        platform service to retrieve the configuration.
+        platform service to retrieve the configuration, unless a cached
+        copy is available.
 
         Args:
             tool (AbstractTool): Instance of AbstractTool
             adapter_instance_id (str): ID of the adapter instance
+            use_cache (bool, optional): Serve the config from the in-process
+                cache if available. Defaults to True.
         Required env variables:
             PLATFORM_HOST: Host of platform service
             PLATFORM_PORT: Port of platform service
@@ -116,22 +194,128 @@ class ToolAdapter(PlatformBase):
             adapter_metadata_config = tool.get_env_or_die(adapter_instance_id)
             adapter_metadata = json.loads(adapter_metadata_config)
             return adapter_metadata
-        platform_host = tool.get_env_or_die(ToolEnv.PLATFORM_HOST)
-        platform_port = tool.get_env_or_die(ToolEnv.PLATFORM_PORT)
+
+        tool_adapter = ToolAdapter._from_tool(tool)
+        cache_key = tool_adapter._get_cache_key(adapter_instance_id)
+        if use_cache:
+            cached_config = ToolAdapter._config_cache.get(cache_key)
+            if cached_config is not None:
+                # Copied since callers modify the config they receive
+                return copy.deepcopy(cached_config)
 
         tool.stream_log(
             f"Retrieving config from DB for '{adapter_instance_id}'",
             level=LogLevel.DEBUG,
         )
-        tool_adapter = ToolAdapter(
-            tool=tool,
-            platform_host=platform_host,
-            platform_port=platform_port,
-        )
-
         try:
-            return tool_adapter._get_adapter_configuration(adapter_instance_id)
+            adapter_config = tool_adapter._get_adapter_configuration(adapter_instance_id)
         except ConnectionError as e:
             raise SdkError(
                 "Unable to connect to platform service, please contact the admin."
             ) from e
+        ToolAdapter._config_cache.set(cache_key, copy.deepcopy(adapter_config))
+        return adapter_config
+
+    @staticmethod
+    def get_adapter_configs(
+        tool: BaseTool, adapter_instance_ids: list[str], use_cache: bool = True
+    ) -> dict[str, dict[str, Any]]:
+        """Get the configs of several adapters with as few requests as possible.
+
+        Public adapters are read from the environment and cached configs are
+        reused. The rest are fetched from the platform in a single request,
+        falling back to a request per adapter if the platform doesn't support
+        fetching them in bulk.
+
+        Args:
+            tool (AbstractTool): Instance of AbstractTool
+            adapter_instance_ids (list[str]): IDs of the adapter instances
+            use_cache (bool, optional): Serve configs from the in-process
+                cache if available. Defaults to True.
+
+        Returns:
+            dict[str, dict[str, Any]]: Config against each adapter instance ID
+        """
+        adapter_configs: dict[str, dict[str, Any]] = {}
+        to_fetch: list[str] = []
+        tool_adapter: ToolAdapter | None = None
+        for adapter_instance_id in dict.fromkeys(adapter_instance_ids):
+            if SdkHelper.is_public_adapter(adapter_id=adapter_instance_id):
+                adapter_configs[adapter_instance_id] = ToolAdapter.get_adapter_config(
+                    tool, adapter_instance_id
+                )
+                continue
+            tool_adapter = tool_adapter or ToolAdapter._from_tool(tool)
+            cached_config = (
+                ToolAdapter._config_cache.get(
+                    tool_adapter._get_cache_key(adapter_instance_id)
+                )
+                if use_cache
+                else None
+            )
+            if cached_config is not None:
+                adapter_configs[adapter_instance_id] = copy.deepcopy(cached_config)
+            else:
+                to_fetch.append(adapter_instance_id)
+
+        if not to_fetch:
+            return adapter_configs
+
+        fetched_configs: dict[str, dict[str, Any]] | None = None
+        if len(to_fetch) > 1:
+            tool.stream_log(
+                f"Retrieving configs from DB for {len(to_fetch)} adapters",
+                level=LogLevel.DEBUG,
+            )
+            try:
+                fetched_configs = tool_adapter._get_adapter_configurations(to_fetch)
+            except ConnectionError as e:
+                raise SdkError(
+                    "Unable to connect to platform service, please contact the admin."
+                ) from e
+        if fetched_configs is None:
+            fetched_configs = {
+                adapter_instance_id: ToolAdapter.get_adapter_config(
+                    tool, adapter_instance_id, use_cache=False
+                )
+                for adapter_instance_id in to_fetch
+            }
+        else:
+            missing_ids = set(to_fetch) - set(fetched_configs)
+            if missing_ids:
+                raise SdkError(
+                    f"Error retrieving adapter. Configs not found for {missing_ids}"
+                )
+            for adapter_instance_id, adapter_config in fetched_configs.items():
+                ToolAdapter._config_cache.set(
+                    tool_adapter._get_cache_key(adapter_instance_id),
+                    copy.deepcopy(adapter_config),
+                )
+        adapter_configs.update(fetched_configs)
+        return adapter_configs
+
+    @staticmethod
+    def invalidate_adapter_config(adapter_instance_id: str | None = None) -> None:
+        """Drops cached adapter configs.
+
+        Needs to be called when an adapter is modified within the TTL of the
+        cache, for the change to be picked up by this process.
+
+        Args:
+            adapter_instance_id (Optional[str], optional): Adapter whose
+                config is dropped. Drops all configs if None. Defaults to None.
+        """
+        if adapter_instance_id is None:
+            ToolAdapter._config_cache.clear()
+            return
+        ToolAdapter._config_cache.delete_matching(
+            lambda cache_key: cache_key[-1] == adapter_instance_id
+        )
+
+    @staticmethod
+    def _from_tool(tool: BaseTool) -> "ToolAdapter":
+        return ToolAdapter(
+            tool=tool,
+            platform_host=tool.get_env_or_die(ToolEnv.PLATFORM_HOST),
+            platform_port=tool.get_env_or_die(ToolEnv.PLATFORM_PORT),
+        )
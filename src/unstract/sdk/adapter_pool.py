@@ -0,0 +1,280 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from unstract.sdk.adapter import ToolAdapter
+from unstract.sdk.embedding import Embedding
+from unstract.sdk.index_registry import IndexRegistry
+from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.utils import ToolUtils
+from unstract.sdk.utils.cache_backends import CacheBackend
+from unstract.sdk.vector_db import VectorDB
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    DEFAULT_MAX_IDLE = 16
+    DEFAULT_IDLE_TIMEOUT = 300.0
+    DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+
+
+@dataclass
+class _PooledInstance:
+    value: Any
+    close: Callable[[Any], None] | None = None
+    health_check: Callable[[Any], bool] | None = None
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+class AdapterPool:
+    """Thread safe pool of adapter instances, reused across calls.
+
+    Creating an adapter instance can involve connecting to a provider and
+    checking its collections, which dominates the time taken for small
+    documents. Instances are leased exclusively to one caller at a time,
+    and returned to the pool after use, keyed by adapter instance ID and a
+    hash of its config so that config changes get a fresh instance.
+
+    Idle instances are closed once they've been idle for `idle_timeout`, or
+    when more than `max_idle` are held, least recently used first. Instances
+    idle for longer than `health_check_interval` are health checked before
+    being leased again. Meant to be shared by a long-lived worker process,
+    and closed on shutdown.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = Constants.DEFAULT_MAX_IDLE,
+        idle_timeout: float = Constants.DEFAULT_IDLE_TIMEOUT,
+        health_check_interval: float = Constants.DEFAULT_HEALTH_CHECK_INTERVAL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Creates an empty pool.
+
+        Args:
+            max_idle (int, optional): Maximum number of idle instances held.
+                Defaults to 16.
+            idle_timeout (float, optional): Seconds after which an idle
+                instance is closed. Defaults to 300.
+            health_check_interval (float, optional): Seconds an instance can be
+                idle for before it's health checked on lease. Defaults to 30.
+            timer (Callable[[], float], optional): Clock used for idle times.
+                Defaults to time.monotonic.
+        """
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._timer = timer
+        self._lock = threading.Lock()
+        # Idle instances, least recently returned first
+        self._idle: OrderedDict[tuple[Hashable, int], _PooledInstance] = OrderedDict()
+        self._counter = 0
+        self._closed = False
+
+    def __enter__(self) -> "AdapterPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    @staticmethod
+    def _close_instance(instance: _PooledInstance) -> None:
+        if instance.close is None:
+            return
+        try:
+            instance.close(instance.value)
+        except Exception as e:
+            logger.warning(f"Error while closing pooled adapter instance: {e}")
+
+    def _pop_expired(self, now: float) -> list[_PooledInstance]:
+        expired = [
+            entry_key
+            for entry_key, instance in self._idle.items()
+            if now - instance.idle_since >= self.idle_timeout
+        ]
+        return [self._idle.pop(entry_key) for entry_key in expired]
+
+    def _take_idle(self, key: Hashable) -> _PooledInstance | None:
+        to_close: list[_PooledInstance] = []
+        taken = None
+        with self._lock:
+            to_close.extend(self._pop_expired(self._timer()))
+            # The most recently returned instance is the warmest
+            for entry_key in reversed(self._idle):
+                if entry_key[0] == key:
+                    taken = self._idle.pop(entry_key)
+                    break
+        for instance in to_close:
+            self._close_instance(instance)
+        return taken
+
+    def _is_healthy(self, instance: _PooledInstance) -> bool:
+        idle_for = self._timer() - instance.idle_since
+        if instance.health_check is None or idle_for < self.health_check_interval:
+            return True
+        try:
+            return instance.health_check(instance.value)
+        except Exception as e:
+            logger.warning(f"Pooled adapter instance failed its health check: {e}")
+            return False
+
+    def _acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        close: Callable[[Any], None] | None,
+        health_check: Callable[[Any], bool] | None,
+    ) -> _PooledInstance:
+        if self._closed:
+            raise RuntimeError("Adapter pool is closed")
+        while True:
+            instance = self._take_idle(key)
+            if instance is None:
+                return _PooledInstance(
+                    value=factory(), close=close, health_check=health_check
+                )
+            if self._is_healthy(instance):
+                return instance
+            self._close_instance(instance)
+
+    def _release(self, key: Hashable, instance: _PooledInstance) -> None:
+        to_close: list[_PooledInstance] = []
+        with self._lock:
+            if self._closed or self.max_idle <= 0:
+                to_close.append(instance)
+            else:
+                instance.idle_since = self._timer()
+                self._counter += 1
+                self._idle[(key, self._counter)] = instance
+                while len(self._idle) > self.max_idle:
+                    to_close.append(self._idle.popitem(last=False)[1])
+        for stale in to_close:
+            self._close_instance(stale)
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        close: Callable[[Any], None] | None = None,
+        health_check: Callable[[Any], bool] | None = None,
+    ) -> Iterator[Any]:
+        """Leases an idle instance for a key, else one created by `factory`.
+
+        The instance is returned to the pool on exit. It's closed instead if
+        an error was raised while leased, since it might be unusable.
+
+        Args:
+            key (Hashable): Key of interchangeable instances
+            factory (Callable[[], Any]): Creates an instance when none is idle
+            close (Optional[Callable[[Any], None]], optional): Closes an
+                instance evicted from the pool. Defaults to None.
+            health_check (Optional[Callable[[Any], bool]], optional): Whether
+                an instance is still usable. Defaults to None, for no check.
+
+        Yields:
+            Any: Instance leased to the caller
+        """
+        instance = self._acquire(key, factory, close, health_check)
+        failed = False
+        try:
+            yield instance.value
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed:
+                self._close_instance(instance)
+            else:
+                self._release(key, instance)
+
+    @contextmanager
+    def lease_vector_db(
+        self,
+        tool: BaseTool,
+        embedding_instance_id: str,
+        vector_db_instance_id: str,
+        usage_kwargs: dict[Any, Any] | None = None,
+        embedding_cache: CacheBackend | None = None,
+        registry: IndexRegistry | None = None,
+    ) -> Iterator[tuple[Embedding, VectorDB]]:
+        """Leases a vector DB along with the embedding it was created with.
+
+        The embedding reports usage with the `usage_kwargs` of the lease.
+
+        Args:
+            tool (BaseTool): Tool creating the instances, which keep it for
+                as long as they're pooled
+            embedding_instance_id (str): UUID of the embedding service configured
+            vector_db_instance_id (str): UUID of the vector DB configured
+            usage_kwargs (Optional[dict[Any, Any]], optional): Dict to capture
+                usage. Defaults to None.
+            embedding_cache (Optional[CacheBackend], optional): Store of
+                previously computed embeddings. Defaults to None.
+            registry (Optional[IndexRegistry], optional): Registry of indexed
+                documents kept up to date by the vector DB. Defaults to None.
+
+        Yields:
+            tuple[Embedding, VectorDB]: Embedding and vector DB leased
+        """
+        usage_kwargs = dict(usage_kwargs or {})
+        key = (
+            "vector_db",
+            vector_db_instance_id,
+            self._get_config_hash(tool, vector_db_instance_id),
+            embedding_instance_id,
+            self._get_config_hash(tool, embedding_instance_id),
+            id(embedding_cache) if embedding_cache is not None else None,
+            id(registry) if registry is not None else None,
+        )
+
+        def _create() -> tuple[Embedding, VectorDB]:
+            embedding = Embedding(
+                tool=tool,
+                adapter_instance_id=embedding_instance_id,
+                usage_kwargs=usage_kwargs.copy(),
+                cache_backend=embedding_cache,
+            )
+            vector_db = VectorDB(
+                tool=tool,
+                adapter_instance_id=vector_db_instance_id,
+                embedding=embedding,
+                registry=registry,
+            )
+            return embedding, vector_db
+
+        with self.lease(
+            key,
+            factory=_create,
+            close=lambda pair: pair[1].close(),
+            health_check=lambda pair: pair[1].is_healthy(),
+        ) as (embedding, vector_db):
+            embedding.set_usage_kwargs(usage_kwargs)
+            yield embedding, vector_db
+
+    @staticmethod
+    def _get_config_hash(tool: BaseTool, adapter_instance_id: str) -> str:
+        # Served from the adapter config cache, see ToolAdapter
+        config = ToolAdapter.get_adapter_config(tool, adapter_instance_id)
+        return ToolUtils.hash_str(json.dumps(config, sort_keys=True))
+
+    def close(self) -> None:
+        """Closes every idle instance, and leased ones once returned."""
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle.values())
+            self._idle.clear()
+        for instance in idle:
+            self._close_instance(instance)
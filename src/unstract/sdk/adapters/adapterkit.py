@@ -7,6 +7,8 @@ from unstract.sdk.adapters.base import Adapter
 from unstract.sdk.adapters.constants import Common
 from unstract.sdk.adapters.embedding import adapters as embedding_adapters
 from unstract.sdk.adapters.llm import adapters as llm_adapters
+from unstract.sdk.adapters.manifest import Constants as ManifestKeys
+from unstract.sdk.adapters.manifest import LazyAdapter
 from unstract.sdk.adapters.ocr import adapters as ocr_adapters
 from unstract.sdk.adapters.vectordb import adapters as vectordb_adapters
 from unstract.sdk.adapters.x2text import adapters as x2text_adapters
@@ -56,8 +58,19 @@ class Adapterkit:
         return adapter_class(*args, **kwargs)
 
     def get_adapters_list(self) -> list[dict[str, Any]]:
+        """Lists the adapters with their details.
+
+        Adapters registered from the manifest are listed without being
+        imported.
+        """
         adapters = []
-        for adapter_id, adapter_registry_metadata in self._adapters.items():
+        for adapter_registry_metadata in self._adapters.values():
+            if (
+                isinstance(adapter_registry_metadata, LazyAdapter)
+                and not adapter_registry_metadata.loaded
+            ):
+                adapters.append(self._describe_lazy_adapter(adapter_registry_metadata))
+                continue
             m: Adapter = adapter_registry_metadata[Common.METADATA][Common.ADAPTER]
             _id = m.get_id()
             name = m.get_name()
@@ -77,3 +90,16 @@ class Adapterkit:
                 }
             )
         return adapters
+
+    @staticmethod
+    def _describe_lazy_adapter(adapter: LazyAdapter) -> dict[str, Any]:
+        entry = adapter.entry
+        return {
+            "id": entry[ManifestKeys.ID],
+            "name": entry[ManifestKeys.NAME],
+            "class_name": entry[ManifestKeys.CLASS_NAME],
+            "description": entry[ManifestKeys.DESCRIPTION],
+            "icon": entry[ManifestKeys.ICON],
+            "adapter_type": entry[ManifestKeys.ADAPTER_TYPE],
+            "json_schema": adapter.get_json_schema(),
+        }
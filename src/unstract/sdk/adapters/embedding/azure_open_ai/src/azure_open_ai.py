@@ -48,6 +48,11 @@ class AzureOpenAI(EmbeddingAdapter):
     def get_icon() -> str:
         return "/icons/adapter-icons/AzureopenAI.png"
 
+    def get_embedding_dimension(self) -> int | None:
+        return EmbeddingHelper.get_embedding_dimension(
+            self.config, model=self.config.get(Constants.MODEL)
+        )
+
     def get_embedding_instance(self) -> BaseEmbedding:
         try:
             embedding_batch_size = EmbeddingHelper.get_embedding_batch_size(
@@ -47,6 +47,16 @@ class EmbeddingAdapter(Adapter, ABC):
         """
         return MockEmbedding(embed_dim=1)
 
+    def get_embedding_dimension(self) -> int | None:
+        """Gets the dimension of the embeddings without calling the model.
+
+        Returns:
+            Optional[int]: Dimension declared in the adapter metadata with
+                `embedding_dimension`, None if it needs to be determined by
+                embedding a text
+        """
+        return EmbeddingHelper.get_embedding_dimension(getattr(self, "config", {}))
+
     def test_connection(self) -> bool:
         embedding = self.get_embedding_instance()
         test_result: bool = EmbeddingHelper.test_embedding_instance(embedding)
@@ -10,6 +10,13 @@ logger = logging.getLogger(__name__)
 class EmbeddingConstants:
     DEFAULT_EMBED_BATCH_SIZE = 10
     EMBED_BATCH_SIZE = "embed_batch_size"
+    EMBEDDING_DIMENSION = "embedding_dimension"
+    # Default output dimension of well known models
+    KNOWN_MODEL_DIMENSIONS = {
+        "text-embedding-ada-002": 1536,
+        "text-embedding-3-small": 1536,
+        "text-embedding-3-large": 3072,
+    }
 
 
 class EmbeddingHelper:
@@ -26,6 +33,25 @@ class EmbeddingHelper:
             )
         return embedding_batch_size
 
+    @staticmethod
+    def get_embedding_dimension(
+        config: dict[str, Any], model: str | None = None
+    ) -> int | None:
+        """Gets the embedding dimension declared in the config or known for a model.
+
+        Args:
+            config (dict[str, Any]): Adapter config
+            model (Optional[str], optional): Model name to look up among well
+                known models. Defaults to None.
+
+        Returns:
+            Optional[int]: Embedding dimension, None if it isn't known
+        """
+        embedding_dimension = config.get(EmbeddingConstants.EMBEDDING_DIMENSION)
+        if embedding_dimension:
+            return int(embedding_dimension)
+        return EmbeddingConstants.KNOWN_MODEL_DIMENSIONS.get(model)
+
     @staticmethod
     def test_embedding_instance(embedding: BaseEmbedding | None) -> bool:
         try:
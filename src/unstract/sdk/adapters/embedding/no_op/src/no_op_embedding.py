@@ -37,6 +37,9 @@ class NoOpEmbedding(EmbeddingAdapter):
     def get_provider() -> str:
         return "NoOp"
 
+    def get_embedding_dimension(self) -> int | None:
+        return 1
+
     def get_embedding_instance(self) -> BaseEmbedding:
         embedding: BaseEmbedding = NoOpCustomEmbedding(
             embed_dim=1, wait_time=self.config.get("wait_time")
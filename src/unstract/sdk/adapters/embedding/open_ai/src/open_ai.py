@@ -5,6 +5,7 @@ import httpx
 from llama_index.core.embeddings import BaseEmbedding
 from llama_index.embeddings.openai import OpenAIEmbedding
 from unstract.sdk.adapters.embedding.embedding_adapter import EmbeddingAdapter
+from unstract.sdk.adapters.embedding.helper import EmbeddingHelper
 from unstract.sdk.adapters.exceptions import AdapterError
 
 
@@ -47,6 +48,12 @@ class OpenAI(EmbeddingAdapter):
     def get_icon() -> str:
         return "/icons/adapter-icons/OpenAI.png"
 
+    def get_embedding_dimension(self) -> int | None:
+        return EmbeddingHelper.get_embedding_dimension(
+            self.config,
+            model=self.config.get(Constants.MODEL, Constants.DEFAULT_MODEL),
+        )
+
     def get_embedding_instance(self) -> BaseEmbedding:
         try:
             timeout = int(self.config.get(Constants.TIMEOUT, Constants.DEFAULT_TIMEOUT))
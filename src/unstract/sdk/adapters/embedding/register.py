@@ -5,6 +5,7 @@ from typing import Any
 
 from unstract.sdk.adapters.constants import Common
 from unstract.sdk.adapters.embedding.embedding_adapter import EmbeddingAdapter
+from unstract.sdk.adapters.manifest import register_lazy_adapters
 from unstract.sdk.adapters.registry import AdapterRegistry
 
 logger = logging.getLogger(__name__)
@@ -15,12 +16,18 @@ class EmbeddingRegistry(AdapterRegistry):
     def register_adapters(adapters: dict[str, Any]) -> None:
         current_directory = os.path.dirname(os.path.abspath(__file__))
         package = "unstract.sdk.adapters.embedding"
+        # Adapters in the manifest are only imported when first used
+        registered = register_lazy_adapters(package, current_directory, adapters)
 
         for adapter in os.listdir(current_directory):
             adapter_path = os.path.join(current_directory, adapter, Common.SRC_FOLDER)
             # Check if the item is a directory and not
             # a special directory like __pycache__
-            if os.path.isdir(adapter_path) and not adapter.startswith("__"):
+            if (
+                os.path.isdir(adapter_path)
+                and not adapter.startswith("__")
+                and adapter not in registered
+            ):
                 EmbeddingRegistry._build_adapter_list(adapter, package, adapters)
         if len(adapters) == 0:
             logger.warning("No embedding adapter found.")
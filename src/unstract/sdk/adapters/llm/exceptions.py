@@ -1,16 +1,63 @@
-from anthropic import APIError as AnthropicAPIError
-from google.api_core.exceptions import GoogleAPICallError
-from mistralai.models import SDKError as MistralError
-from openai import APIError as OpenAIAPIError
-from vertexai.generative_models import ResponseValidationError
+from importlib import import_module
 
 from unstract.sdk.adapters.exceptions import LLMError
-from unstract.sdk.adapters.llm.anthropic.src import AnthropicLLM
 from unstract.sdk.adapters.llm.llm_adapter import LLMAdapter
-from unstract.sdk.adapters.llm.mistral.src import MistralLLM
-from unstract.sdk.adapters.llm.open_ai.src import OpenAILLM
-from unstract.sdk.adapters.llm.palm.src import PaLMLLM
-from unstract.sdk.adapters.llm.vertex_ai.src import VertexAILLM
+
+# Client errors parsed by adapters, as root package of the client, module and
+# name of the error class, then module and name of the adapter class
+_CLIENT_ERRORS = (
+    (
+        "vertexai",
+        "vertexai.generative_models",
+        "ResponseValidationError",
+        "unstract.sdk.adapters.llm.vertex_ai.src",
+        "VertexAILLM",
+    ),
+    (
+        "openai",
+        "openai",
+        "APIError",
+        "unstract.sdk.adapters.llm.open_ai.src",
+        "OpenAILLM",
+    ),
+    (
+        "anthropic",
+        "anthropic",
+        "APIError",
+        "unstract.sdk.adapters.llm.anthropic.src",
+        "AnthropicLLM",
+    ),
+    (
+        "mistralai",
+        "mistralai.models",
+        "SDKError",
+        "unstract.sdk.adapters.llm.mistral.src",
+        "MistralLLM",
+    ),
+    (
+        "google",
+        "google.api_core.exceptions",
+        "GoogleAPICallError",
+        "unstract.sdk.adapters.llm.palm.src",
+        "PaLMLLM",
+    ),
+)
+
+
+def _parse_client_err(e: Exception) -> LLMError | None:
+    """Parses the error of a provider's client, if it's known.
+
+    Adapters and clients are only imported for errors raised by them, so that
+    using one adapter doesn't import all of them.
+    """
+    packages = {cls.__module__.split(".")[0] for cls in type(e).__mro__}
+    for package, error_module, error_name, adapter_module, adapter_name in _CLIENT_ERRORS:
+        if package not in packages:
+            continue
+        if isinstance(e, getattr(import_module(error_module), error_name)):
+            adapter: LLMAdapter = getattr(import_module(adapter_module), adapter_name)
+            return adapter.parse_llm_err(e)
+    return None
 
 
 def parse_llm_err(e: Exception, llm_adapter: LLMAdapter) -> LLMError:
@@ -29,17 +76,8 @@ def parse_llm_err(e: Exception, llm_adapter: LLMAdapter) -> LLMError:
     if isinstance(e, LLMError):
         return e
 
-    if isinstance(e, ResponseValidationError):
-        err = VertexAILLM.parse_llm_err(e)
-    elif isinstance(e, OpenAIAPIError):
-        err = OpenAILLM.parse_llm_err(e)
-    elif isinstance(e, AnthropicAPIError):
-        err = AnthropicLLM.parse_llm_err(e)
-    elif isinstance(e, MistralError):
-        err = MistralLLM.parse_llm_err(e)
-    elif isinstance(e, GoogleAPICallError):
-        err = PaLMLLM.parse_llm_err(e)
-    else:
+    err = _parse_client_err(e)
+    if err is None:
         err = LLMError(str(e), actual_err=e)
 
     msg = f"Error from LLM provider '{llm_adapter.get_name()}'."
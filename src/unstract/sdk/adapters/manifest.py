@@ -0,0 +1,235 @@
+"""Prebuilt manifest of the adapters, to import them only when used.
+
+Registering adapters used to import every adapter of every type, pulling in
+the clients of all providers. The manifest maps adapter IDs to the module
+and details of each adapter, so that registries only import an adapter on
+first use and `Adapterkit.get_adapters_list()` is served without imports.
+
+The manifest is generated when building an image with
+`unstract-adapter-manifest`. Adapters missing from it, such as ones added
+since, are imported on registration as before.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from typing import Any
+
+from unstract.sdk.adapters import AdapterDict
+from unstract.sdk.adapters.constants import Common
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    MANIFEST_FILE = "adapter_manifest.json"
+    VERSION = 1
+    ADAPTERS_PACKAGE = "unstract.sdk.adapters"
+    ADAPTER_PACKAGES = ("llm", "embedding", "vectordb", "x2text", "ocr")
+    # Set to "false" to import all adapters on registration
+    USE_MANIFEST_ENV = "ADAPTER_MANIFEST_ENABLED"
+    # Keys of a manifest entry
+    VERSION_KEY = "version"
+    ADAPTERS = "adapters"
+    INACTIVE = "inactive"
+    ID = "id"
+    NAME = "name"
+    CLASS_NAME = "class_name"
+    DESCRIPTION = "description"
+    ICON = "icon"
+    ADAPTER_TYPE = "adapter_type"
+    SCHEMA_PATH = "schema_path"
+    ADAPTER_DIR = "adapter_dir"
+
+
+ADAPTERS_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(ADAPTERS_DIR, Constants.MANIFEST_FILE)
+
+_manifest: dict[str, Any] | None = None
+_manifest_lock = threading.Lock()
+
+
+class LazyAdapter(Mapping[str, Any]):
+    """Registry entry of an adapter which is imported on first access.
+
+    Reads like the entries of eagerly registered adapters, with the adapter's
+    module and metadata.
+    """
+
+    def __init__(self, package: str, entry: dict[str, Any]) -> None:
+        """Creates an entry from the manifest.
+
+        Args:
+            package (str): Package of the adapter type, such as
+                "unstract.sdk.adapters.llm"
+            entry (dict[str, Any]): Manifest entry of the adapter
+        """
+        self.package = package
+        self.entry = entry
+        self._registered: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._registered is not None
+
+    def _load(self) -> dict[str, Any]:
+        if self._registered is not None:
+            return self._registered
+        with self._lock:
+            if self._registered is None:
+                module = import_module(
+                    f"{self.package}.{self.entry[Constants.ADAPTER_DIR]}."
+                    f"{Common.SRC_FOLDER}"
+                )
+                logger.debug(f"Imported adapter {self.entry[Constants.ID]}")
+                self._registered = {
+                    Common.MODULE: module,
+                    Common.METADATA: getattr(module, Common.METADATA, {}),
+                }
+        return self._registered
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter((Common.MODULE, Common.METADATA))
+
+    def __len__(self) -> int:
+        return 2
+
+    def get_json_schema(self) -> str:
+        with open(os.path.join(ADAPTERS_DIR, self.entry[Constants.SCHEMA_PATH])) as f:
+            return f.read()
+
+
+def _use_manifest() -> bool:
+    return os.environ.get(Constants.USE_MANIFEST_ENV, "true").lower() != "false"
+
+
+def load_manifest() -> dict[str, Any]:
+    """Loads the manifest once per process.
+
+    Returns:
+        dict[str, Any]: Manifest, empty if there's none usable
+    """
+    global _manifest
+    with _manifest_lock:
+        if _manifest is not None:
+            return _manifest
+        _manifest = {}
+        if not _use_manifest() or not os.path.exists(MANIFEST_PATH):
+            return _manifest
+        try:
+            with open(MANIFEST_PATH) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable adapter manifest: {e}")
+            return _manifest
+        if manifest.get(Constants.VERSION_KEY) != Constants.VERSION:
+            logger.warning("Ignoring adapter manifest of another version")
+            return _manifest
+        _manifest = manifest
+        return _manifest
+
+
+def get_lazy_adapters(package: str, directory: str) -> dict[str, LazyAdapter]:
+    """Gets the adapters of a type listed in the manifest.
+
+    Adapters whose directory no longer exists are left out.
+
+    Args:
+        package (str): Package of the adapter type, such as
+            "unstract.sdk.adapters.llm"
+        directory (str): Directory of the package
+
+    Returns:
+        dict[str, LazyAdapter]: Entries by adapter ID
+    """
+    entries = load_manifest().get(Constants.ADAPTERS, {}).get(package, {})
+    return {
+        adapter_id: LazyAdapter(package, entry)
+        for adapter_id, entry in entries.items()
+        if os.path.isdir(os.path.join(directory, entry[Constants.ADAPTER_DIR]))
+    }
+
+
+def _describe(adapter_class: Any, adapter_dir: str) -> dict[str, Any]:
+    schema_path = os.path.relpath(adapter_class.SCHEMA_PATH, ADAPTERS_DIR)
+    return {
+        Constants.ID: adapter_class.get_id(),
+        Constants.NAME: adapter_class.get_name(),
+        Constants.CLASS_NAME: adapter_class.__name__,
+        Constants.DESCRIPTION: adapter_class.get_description(),
+        Constants.ICON: adapter_class.get_icon(),
+        Constants.ADAPTER_TYPE: adapter_class.get_adapter_type().name,
+        Constants.SCHEMA_PATH: schema_path,
+        Constants.ADAPTER_DIR: adapter_dir,
+    }
+
+
+def build_manifest() -> dict[str, Any]:
+    """Imports every active adapter to describe it in a manifest.
+
+    Adapters which fail to import are left out, and so are imported on
+    registration at runtime. Inactive adapters are listed so that they're
+    skipped at runtime.
+    """
+    adapters: dict[str, dict[str, Any]] = {}
+    inactive: dict[str, list[str]] = {}
+    for adapter_package in Constants.ADAPTER_PACKAGES:
+        package = f"{Constants.ADAPTERS_PACKAGE}.{adapter_package}"
+        directory = os.path.join(ADAPTERS_DIR, adapter_package)
+        entries: dict[str, Any] = {}
+        inactive[package] = []
+        for adapter_dir in sorted(os.listdir(directory)):
+            if adapter_dir.startswith("__") or not os.path.isdir(
+                os.path.join(directory, adapter_dir, Common.SRC_FOLDER)
+            ):
+                continue
+            try:
+                module = import_module(f"{package}.{adapter_dir}.{Common.SRC_FOLDER}")
+            except Exception as e:
+                # Such as a missing optional dependency
+                logger.warning(f"Leaving out adapter {adapter_dir}: {e}")
+                continue
+            metadata = getattr(module, Common.METADATA, {})
+            if not metadata.get("is_active", False):
+                inactive[package].append(adapter_dir)
+                continue
+            entry = _describe(metadata[Common.ADAPTER], adapter_dir)
+            entries[entry[Constants.ID]] = entry
+        adapters[package] = entries
+    return {
+        Constants.VERSION_KEY: Constants.VERSION,
+        Constants.ADAPTERS: adapters,
+        Constants.INACTIVE: inactive,
+    }
+
+
+def write_manifest(path: str = MANIFEST_PATH) -> dict[str, Any]:
+    """Builds the manifest and writes it where registries read it from."""
+    manifest = build_manifest()
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def register_lazy_adapters(
+    package: str, directory: str, adapters: AdapterDict
+) -> set[str]:
+    """Registers the adapters of a type listed in the manifest.
+
+    Returns:
+        set[str]: Directories of the adapters registered or known to be
+            inactive, which don't need to be imported
+    """
+    lazy_adapters = get_lazy_adapters(package, directory)
+    adapters.update(lazy_adapters)
+    inactive = load_manifest().get(Constants.INACTIVE, {}).get(package, [])
+    return {
+        adapter.entry[Constants.ADAPTER_DIR] for adapter in lazy_adapters.values()
+    } | set(inactive)
@@ -4,3 +4,9 @@ class VectorDbConstants:
     DEFAULT_VECTOR_DB_NAME = "unstract"
     DEFAULT_EMBEDDING_SIZE = 2
     WAIT_TIME = "wait_time"
+    # Metadata key holding the ref_doc_id of a node, set by llama-index and
+    # used to filter the nodes of a document
+    DOC_ID = "doc_id"
+    # Metadata key holding the position of a node in its document, set on
+    # incremental indexing and used to list the nodes in document order
+    CHUNK_INDEX = "chunk_index"
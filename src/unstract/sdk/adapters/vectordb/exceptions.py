@@ -1,6 +1,3 @@
-from qdrant_client.http.exceptions import ApiException as QdrantAPIException
-
-from unstract.sdk.adapters.vectordb.qdrant.src import Qdrant
 from unstract.sdk.adapters.vectordb.vectordb_adapter import VectorDBAdapter
 from unstract.sdk.exceptions import VectorDBError
 
@@ -21,9 +18,16 @@ def parse_vector_db_err(e: Exception, vector_db: VectorDBAdapter) -> VectorDBErr
     if isinstance(e, VectorDBError):
         return e
 
-    if isinstance(e, QdrantAPIException):
-        err = Qdrant.parse_vector_db_err(e)
-    else:
+    err = None
+    # Only import the adapter for its errors, so using another doesn't load it
+    if type(e).__module__.startswith("qdrant_client"):
+        from qdrant_client.http.exceptions import ApiException as QdrantAPIException
+
+        if isinstance(e, QdrantAPIException):
+            from unstract.sdk.adapters.vectordb.qdrant.src import Qdrant
+
+            err = Qdrant.parse_vector_db_err(e)
+    if err is None:
         err = VectorDBError(str(e), actual_err=e)
 
     msg = f"Error from vector DB '{vector_db.get_name()}'."
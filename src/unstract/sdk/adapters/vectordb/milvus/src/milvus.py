@@ -1,3 +1,4 @@
+import json
 import os
 from typing import Any
 
@@ -78,3 +79,13 @@ class Milvus(VectorDBAdapter):
     def close(self, **kwargs: Any) -> None:
         if self._client:
             self._client.close()
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        if not self._client.has_collection(self._collection_name):
+            return 0
+        result = self._client.query(
+            collection_name=self._collection_name,
+            filter=f"{VectorDbConstants.DOC_ID} == {json.dumps(ref_doc_id)}",
+            output_fields=["count(*)"],
+        )
+        return result[0]["count(*)"] if result else 0
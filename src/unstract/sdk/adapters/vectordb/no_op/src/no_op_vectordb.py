@@ -73,3 +73,13 @@ class NoOpVectorDB(VectorDBAdapter):
         mock_result: list[str] = []
         time.sleep(self._config.get("wait_time"))
         return mock_result
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        # Mirrors the dummy node returned by NoOpCustomVectorDB.query()
+        return 1
+
+    def get_nodes(self, ref_doc_id: str) -> list[BaseNode]:
+        return []
+
+    def delete_nodes(self, node_ids: list[str]) -> None:
+        pass
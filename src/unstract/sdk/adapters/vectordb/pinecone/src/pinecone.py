@@ -1,9 +1,11 @@
 import logging
 import os
+from collections.abc import Iterator
 from typing import Any
 
 from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
+from llama_index.core.vector_stores.utils import metadata_dict_to_node
 from llama_index.vector_stores.pinecone import PineconeVectorStore
 from pinecone import NotFoundException, PodSpec, ServerlessSpec
 from pinecone import Pinecone as LLamaIndexPinecone
@@ -152,3 +154,38 @@ class Pinecone(VectorDBAdapter):
             node_id = ref_doc_id + "-" + node.node_id
             nodes[i].id_ = node_id
         return self.vector_db.add(nodes=nodes)
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        specification = self._config.get(Constants.SPECIFICATION)
+        if specification != Constants.SPEC_SERVERLESS:
+            raise NotImplementedError(
+                "Counting nodes is supported only for serverless indexes"
+            )
+        index = self._client.Index(self._collection_name)  # type: ignore
+        return sum(len(ids) for ids in index.list(prefix=ref_doc_id))
+
+    def get_nodes(self, ref_doc_id: str) -> list[BaseNode]:
+        return [node for page in self.iter_node_pages(ref_doc_id) for node in page]
+
+    def iter_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        # Node IDs are prefixed with the ref_doc_id in add(), which allows
+        # listing them on serverless indexes. Pod indexes only support
+        # metadata filtered queries which cap the number of results.
+        specification = self._config.get(Constants.SPECIFICATION)
+        if specification != Constants.SPEC_SERVERLESS:
+            raise NotImplementedError(
+                "Listing nodes is supported only for serverless indexes"
+            )
+        index = self._client.Index(self._collection_name)  # type: ignore
+        for ids in index.list(prefix=ref_doc_id):
+            response = index.fetch(ids=ids)
+            nodes: list[BaseNode] = []
+            for vector_id, vector in response.vectors.items():
+                node = metadata_dict_to_node(vector.metadata)
+                node.id_ = vector_id
+                if with_embeddings:
+                    node.embedding = vector.values
+                nodes.append(node)
+            yield nodes
@@ -1,11 +1,17 @@
+import json
 import os
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import quote_plus
 
 import psycopg2
+from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
+from llama_index.core.vector_stores.utils import metadata_dict_to_node
 from llama_index.vector_stores.postgres import PGVectorStore
+from psycopg2 import sql
 from psycopg2._psycopg import connection
+from psycopg2.errors import UndefinedTable
 from unstract.sdk.adapters.exceptions import AdapterError
 from unstract.sdk.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk.adapters.vectordb.helper import VectorDBHelper
@@ -20,6 +26,7 @@ class Constants:
     USER = "user"
     SCHEMA = "schema"
     ENABLE_SSL = "enable_ssl"
+    FETCH_PAGE_SIZE = 256
 
 
 class Postgres(VectorDBAdapter):
@@ -111,3 +118,80 @@ class Postgres(VectorDBAdapter):
     def close(self, **kwargs: Any) -> None:
         if self._client:
             self._client.close()
+
+    def is_healthy(self) -> bool:
+        return self._client is not None and not self._client.closed
+
+    def _get_table(self) -> sql.Composed:
+        # PGVectorStore lowercases the schema and table names
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self._schema_name.lower()),
+            sql.Identifier(f"data_{self._collection_name}".lower()),
+        )
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        if self._client is None:
+            raise NotImplementedError("Postgres connection is not available")
+        query = sql.SQL("SELECT COUNT(*) FROM {} WHERE metadata_->>{} = %s").format(
+            self._get_table(), sql.Literal(VectorDbConstants.DOC_ID)
+        )
+        try:
+            with self._client.cursor() as cursor:
+                cursor.execute(query, (ref_doc_id,))
+                count: int = cursor.fetchone()[0]
+            self._client.commit()
+            return count
+        except UndefinedTable:
+            # Table gets created on the first insert
+            self._client.rollback()
+            return 0
+        except Exception:
+            self._client.rollback()
+            raise
+
+    def iter_sorted_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        if self._client is None:
+            raise NotImplementedError("Postgres connection is not available")
+        # Nodes indexed before chunk indexes were stamped are ordered by their
+        # start offset, which is only kept in the serialised node
+        query = sql.SQL(
+            "SELECT text, metadata_, {} FROM {} WHERE metadata_->>{} = %s "
+            "ORDER BY (metadata_->>{})::int NULLS LAST, "
+            "((metadata_->>'_node_content')::jsonb->>'start_char_idx')::int "
+            "NULLS LAST, id"
+        ).format(
+            sql.SQL("embedding" if with_embeddings else "NULL"),
+            self._get_table(),
+            sql.Literal(VectorDbConstants.DOC_ID),
+            sql.Literal(VectorDbConstants.CHUNK_INDEX),
+        )
+        return self._fetch_node_pages(query, ref_doc_id)
+
+    def _fetch_node_pages(
+        self, query: sql.Composed, ref_doc_id: str
+    ) -> Iterator[list[BaseNode]]:
+        try:
+            # A named cursor is read from the server a page at a time
+            with self._client.cursor(name="unstract_sorted_nodes") as cursor:
+                cursor.execute(query, (ref_doc_id,))
+                while rows := cursor.fetchmany(Constants.FETCH_PAGE_SIZE):
+                    yield [self._to_node(*row) for row in rows]
+            self._client.commit()
+        except UndefinedTable:
+            # Table gets created on the first insert
+            self._client.rollback()
+        except BaseException:
+            # Includes the generator being closed before it's exhausted
+            self._client.rollback()
+            raise
+
+    @staticmethod
+    def _to_node(text: str, metadata: dict[str, Any], embedding: Any) -> BaseNode:
+        node = metadata_dict_to_node(metadata)
+        node.set_content(str(text))
+        if embedding is not None:
+            # pgvector's text representation, "[0.1,0.2]", is a JSON array
+            node.embedding = json.loads(embedding)
+        return node
@@ -1,11 +1,23 @@
 import logging
 import os
+from collections.abc import Iterator
 from typing import Any
 
+from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores.types import BasePydanticVectorStore
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    HasIdCondition,
+    IsEmptyCondition,
+    MatchValue,
+    OrderBy,
+    PayloadField,
+    PayloadSchemaType,
+)
 from unstract.sdk.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk.adapters.vectordb.helper import VectorDBHelper
 from unstract.sdk.adapters.vectordb.vectordb_adapter import VectorDBAdapter
@@ -17,6 +29,7 @@ logger = logging.getLogger(__name__)
 class Constants:
     URL = "url"
     API_KEY = "api_key"
+    SCROLL_PAGE_SIZE = 256
 
 
 class Qdrant(VectorDBAdapter):
@@ -24,6 +37,7 @@ class Qdrant(VectorDBAdapter):
         self._config = settings
         self._client: QdrantClient | None = None
         self._collection_name: str = VectorDbConstants.DEFAULT_VECTOR_DB_NAME
+        self._chunk_index_indexed = False
         self._vector_db_instance = self._get_vector_db_instance()
         super().__init__("Qdrant", self._vector_db_instance)
 
@@ -87,6 +101,131 @@ class Qdrant(VectorDBAdapter):
         if self._client:
             self._client.close(**kwargs)
 
+    def is_healthy(self) -> bool:
+        if self._client is None:
+            return False
+        self._client.collection_exists(self._collection_name)
+        return True
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        if not self._client.collection_exists(self._collection_name):
+            return 0
+        result = self._client.count(
+            collection_name=self._collection_name,
+            count_filter=self._get_doc_filter(ref_doc_id),
+            exact=True,
+        )
+        return result.count
+
+    def get_nodes(self, ref_doc_id: str) -> list[BaseNode]:
+        # Paginates over all the points, the vector store's implementation
+        # caps the results to a single page
+        return [node for page in self.iter_node_pages(ref_doc_id) for node in page]
+
+    def iter_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        if not self._client.collection_exists(self._collection_name):
+            return
+        doc_filter = self._get_doc_filter(ref_doc_id)
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=doc_filter,
+                limit=Constants.SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=True,
+                with_vectors=with_embeddings,
+            )
+            if points:
+                yield self._vector_db_instance.parse_to_query_result(points).nodes
+            if offset is None:
+                return
+
+    def iter_sorted_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        if not self._client.collection_exists(self._collection_name):
+            return iter(())
+        doc_filter = self._get_doc_filter(ref_doc_id)
+        # Points without a chunk index are left out when ordering by it
+        unordered = self._client.count(
+            collection_name=self._collection_name,
+            count_filter=Filter(
+                must=[
+                    *doc_filter.must,
+                    IsEmptyCondition(
+                        is_empty=PayloadField(key=VectorDbConstants.CHUNK_INDEX)
+                    ),
+                ]
+            ),
+            exact=True,
+        ).count
+        if unordered:
+            raise NotImplementedError(
+                f"{unordered} nodes of {ref_doc_id} have no chunk index"
+            )
+        if not self._chunk_index_indexed:
+            # Ordering needs a range index on the key, creating it is a no-op
+            # if it already exists
+            self._client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name=VectorDbConstants.CHUNK_INDEX,
+                field_schema=PayloadSchemaType.INTEGER,
+            )
+            self._chunk_index_indexed = True
+        return self._scroll_sorted(doc_filter, with_embeddings)
+
+    def _scroll_sorted(
+        self, doc_filter: Filter, with_embeddings: bool
+    ) -> Iterator[list[BaseNode]]:
+        # Scrolling by order doesn't return an offset, so each page starts
+        # from the last chunk index seen, excluding the points already seen
+        # with that index
+        last_index = None
+        last_ids: list[Any] = []
+        while True:
+            page_filter = doc_filter
+            if last_ids:
+                page_filter = Filter(
+                    must=doc_filter.must, must_not=[HasIdCondition(has_id=last_ids)]
+                )
+            points, _ = self._client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=page_filter,
+                limit=Constants.SCROLL_PAGE_SIZE,
+                order_by=OrderBy(
+                    key=VectorDbConstants.CHUNK_INDEX, start_from=last_index
+                ),
+                with_payload=True,
+                with_vectors=with_embeddings,
+            )
+            if not points:
+                return
+            yield self._vector_db_instance.parse_to_query_result(points).nodes
+            if len(points) < Constants.SCROLL_PAGE_SIZE:
+                return
+            page_last_index = points[-1].payload[VectorDbConstants.CHUNK_INDEX]
+            if page_last_index != last_index:
+                last_ids = []
+            last_index = page_last_index
+            last_ids.extend(
+                point.id
+                for point in points
+                if point.payload[VectorDbConstants.CHUNK_INDEX] == last_index
+            )
+
+    @staticmethod
+    def _get_doc_filter(ref_doc_id: str) -> Filter:
+        return Filter(
+            must=[
+                FieldCondition(
+                    key=VectorDbConstants.DOC_ID, match=MatchValue(value=ref_doc_id)
+                )
+            ]
+        )
+
     @staticmethod
     def parse_vector_db_err(e: Exception) -> VectorDBError:
         # Avoid wrapping VectorDBError objects again
@@ -1,10 +1,17 @@
 from abc import ABC
+from collections.abc import Iterator
 from typing import Any
 
 from llama_index.core.schema import BaseNode
-from llama_index.core.vector_stores import SimpleVectorStore
+from llama_index.core.vector_stores import (
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+    SimpleVectorStore,
+)
 from llama_index.core.vector_stores.types import BasePydanticVectorStore, VectorStore
 from unstract.sdk.adapters.base import Adapter
+from unstract.sdk.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk.adapters.enums import AdapterTypes
 from unstract.sdk.exceptions import VectorDBError
 
@@ -78,6 +85,16 @@ class VectorDBAdapter(Adapter, ABC):
         # library methods invoked
         pass
 
+    def is_healthy(self) -> bool:
+        """Checks if the client connection is still usable.
+
+        Returns:
+            bool: False if the client is known to be unusable
+        """
+        # Overriding implementations will have the corresponding
+        # library methods invoked
+        return True
+
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         """Delete the specified docs.
 
@@ -92,3 +109,109 @@ class VectorDBAdapter(Adapter, ABC):
 
     def add(self, ref_doc_id: str, nodes: list[BaseNode]) -> list[str]:
         return self._vector_db_instance.add(nodes=nodes)
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        """Counts the nodes stored for a document without a similarity search.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be counted
+
+        Returns:
+            int: Number of nodes stored for the document
+
+        Raises:
+            NotImplementedError: If the vector DB can't count by metadata
+        """
+        # Overriding implementations will have the corresponding
+        # library methods invoked
+        raise NotImplementedError(f"Counting nodes is not supported by {self.name}")
+
+    def get_nodes(self, ref_doc_id: str) -> list[BaseNode]:
+        """Fetches all the nodes stored for a document with their embeddings.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be fetched
+
+        Returns:
+            list[BaseNode]: Nodes of the document
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support listing nodes
+        """
+        if not isinstance(self._vector_db_instance, BasePydanticVectorStore):
+            raise NotImplementedError(f"Listing nodes is not supported by {self.name}")
+        filters = MetadataFilters(
+            filters=[
+                MetadataFilter(
+                    key=VectorDbConstants.DOC_ID,
+                    operator=FilterOperator.EQ,
+                    value=ref_doc_id,
+                )
+            ]
+        )
+        return self._vector_db_instance.get_nodes(filters=filters)
+
+    def iter_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        """Fetches the nodes stored for a document, a page at a time.
+
+        Nodes are yielded in no particular order. Vector DBs which can't
+        page through nodes yield everything from `get_nodes()` as one page.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be fetched
+            with_embeddings (bool, optional): Whether embeddings need to be
+                fetched, skipped if possible when False. Defaults to True.
+
+        Yields:
+            list[BaseNode]: A page of nodes of the document
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support listing nodes
+        """
+        nodes = self.get_nodes(ref_doc_id=ref_doc_id)
+        if nodes:
+            yield nodes
+
+    def iter_sorted_node_pages(
+        self, ref_doc_id: str, with_embeddings: bool = True
+    ) -> Iterator[list[BaseNode]]:
+        """Fetches the nodes stored for a document in order, a page at a time.
+
+        Nodes are ordered by their chunk index, then their start offset in
+        the document, as by `unstract.sdk.utils.incremental_indexing.sort_chunks()`.
+        Only vector DBs which can order by metadata implement this, so that a
+        single page is held in memory at a time.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be fetched
+            with_embeddings (bool, optional): Whether embeddings need to be
+                fetched, skipped if possible when False. Defaults to True.
+
+        Returns:
+            Iterator[list[BaseNode]]: Pages of nodes of the document, in order
+
+        Raises:
+            NotImplementedError: If the vector DB can't order the nodes of the
+                document. Raised on the call rather than on iteration.
+        """
+        # Overriding implementations will have the corresponding
+        # library methods invoked
+        raise NotImplementedError(f"Ordering nodes is not supported by {self.name}")
+
+    def delete_nodes(self, node_ids: list[str]) -> None:
+        """Deletes nodes by their IDs.
+
+        Args:
+            node_ids (list[str]): IDs of the nodes to delete
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support deleting
+                individual nodes
+        """
+        if not isinstance(self._vector_db_instance, BasePydanticVectorStore):
+            raise NotImplementedError(
+                f"Deleting nodes is not supported by {self.name}"
+            )
+        self._vector_db_instance.delete_nodes(node_ids=node_ids)
@@ -10,6 +10,7 @@ from unstract.sdk.adapters.vectordb.constants import VectorDbConstants
 from unstract.sdk.adapters.vectordb.helper import VectorDBHelper
 from unstract.sdk.adapters.vectordb.vectordb_adapter import VectorDBAdapter
 from weaviate.classes.init import Auth
+from weaviate.classes.query import Filter
 from weaviate.exceptions import UnexpectedStatusCodeException
 
 logger = logging.getLogger(__name__)
@@ -98,3 +99,16 @@ class Weaviate(VectorDBAdapter):
     def close(self, **kwargs: Any) -> None:
         if self._client:
             self._client.close(**kwargs)
+
+    def is_healthy(self) -> bool:
+        return self._client is not None and self._client.is_ready()
+
+    def count_nodes(self, ref_doc_id: str) -> int:
+        if not self._client.collections.exists(self._collection_name):
+            return 0
+        collection = self._client.collections.get(self._collection_name)
+        result = collection.aggregate.over_all(
+            total_count=True,
+            filters=Filter.by_property(VectorDbConstants.DOC_ID).equal(ref_doc_id),
+        )
+        return result.total_count or 0
@@ -4,7 +4,9 @@ import requests
 from llama_index.core.callbacks import CBEventType, TokenCountingHandler
 from unstract.sdk.constants import LogLevel, ToolEnv
 from unstract.sdk.helper import SdkHelper
+from unstract.sdk.platform import get_http_session
 from unstract.sdk.tool.stream import StreamMixin
+from unstract.sdk.usage_reporter import UsageRecord, get_usage_reporter, is_enabled_by_env
 from unstract.sdk.utils.token_counter import TokenCounter
 
 
@@ -12,8 +14,12 @@ class Audit(StreamMixin):
     """The 'Audit' class is responsible for pushing usage data to the platform
     service.
 
+    Usage is pushed in the background by the process' `UsageReporter`, unless
+    disabled with USAGE_REPORTER_ENABLED=false.
+
     Methods:
         - push_usage_data: Pushes the usage data to the platform service.
+        - push_page_usage_data: Pushes the page usage data to the platform service.
 
     Attributes:
         None
@@ -29,6 +35,7 @@ class Audit(StreamMixin):
         model_name: str = "",
         event_type: CBEventType = None,
         kwargs: dict[Any, Any] = None,
+        cached: bool = False,
     ) -> None:
         """Pushes the usage data to the platform service.
 
@@ -48,6 +55,8 @@ class Audit(StreamMixin):
                 adapter_instance_id (str, optional): The adapter instance ID.
                     Defaults to "".
                 run_id (str, optional): The run ID. Defaults to "".
+            cached (bool, optional): Whether the usage was served from a cache
+                instead of the provider. Defaults to False.
 
         Returns:
             None
@@ -62,7 +71,6 @@ class Audit(StreamMixin):
         base_url = SdkHelper.get_platform_base_url(
             platform_host=platform_host, platform_port=platform_port
         )
-        bearer_token = platform_api_key
 
         workflow_id = kwargs.get("workflow_id", "")
         execution_id = kwargs.get("execution_id", "")
@@ -85,32 +93,12 @@ class Audit(StreamMixin):
             "prompt_tokens": token_counter.prompt_llm_token_count,
             "completion_tokens": token_counter.completion_llm_token_count,
             "total_tokens": token_counter.total_llm_token_count,
+            "cached": cached,
         }
 
         url = f"{base_url}/usage"
-        headers = {"Authorization": f"Bearer {bearer_token}"}
-
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            if response.status_code != 200:
-                self.stream_log(
-                    log=(
-                        "Error while pushing usage details: "
-                        f"{response.status_code} {response.reason}",
-                    ),
-                    level=LogLevel.ERROR,
-                )
-            else:
-                self.stream_log(
-                    f"Successfully pushed usage details, {data}", level=LogLevel.DEBUG
-                )
-
-        except requests.RequestException as e:
-            self.stream_log(
-                log=f"Error while pushing usage details: {e}",
-                level=LogLevel.ERROR,
-            )
-
+            self._push(url, platform_api_key, data, description="usage details")
         finally:
             if isinstance(token_counter, TokenCountingHandler):
                 token_counter.reset_counts()
@@ -130,9 +118,7 @@ class Audit(StreamMixin):
         base_url = SdkHelper.get_platform_base_url(
             platform_host=platform_host, platform_port=platform_port
         )
-        bearer_token = platform_api_key
         url = f"{base_url}/page-usage"
-        headers = {"Authorization": f"Bearer {bearer_token}"}
 
         data = {
             "page_count": page_count,
@@ -141,24 +127,37 @@ class Audit(StreamMixin):
             "file_type": file_type,
             "run_id": run_id,
         }
+        self._push(url, platform_api_key, data, description="page usage details")
 
+    def _push(
+        self, url: str, platform_api_key: str, data: dict[str, Any], description: str
+    ) -> None:
+        if is_enabled_by_env():
+            get_usage_reporter().report(
+                UsageRecord(url=url, platform_api_key=platform_api_key, data=data)
+            )
+            return
+
+        headers = {"Authorization": f"Bearer {platform_api_key}"}
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = get_http_session().post(
+                url, headers=headers, json=data, timeout=30
+            )
             if response.status_code != 200:
                 self.stream_log(
                     log=(
-                        "Error while pushing page usage details: "
+                        f"Error while pushing {description}: "
                         f"{response.status_code} {response.reason}",
                     ),
                     level=LogLevel.ERROR,
                 )
             else:
                 self.stream_log(
-                    "Successfully pushed page usage details", level=LogLevel.DEBUG
+                    f"Successfully pushed {description}, {data}", level=LogLevel.DEBUG
                 )
 
         except requests.RequestException as e:
             self.stream_log(
-                log=f"Error while pushing page usage details: {e}",
+                log=f"Error while pushing {description}: {e}",
                 level=LogLevel.ERROR,
             )
@@ -1,8 +1,7 @@
 from typing import Any
 
-import requests
 from unstract.sdk.constants import LogLevel
-from unstract.sdk.platform import PlatformBase
+from unstract.sdk.platform import PlatformBase, get_http_session
 from unstract.sdk.tool.base import BaseTool
 
 
@@ -41,7 +40,7 @@ class ToolCache(PlatformBase):
         url = f"{self.base_url}/cache"
         json = {"key": key, "value": value}
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.post(url, json=json, headers=headers)
+        response = get_http_session().post(url, json=json, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully cached data for key: {key}")
@@ -64,7 +63,7 @@ class ToolCache(PlatformBase):
         """
         url = f"{self.base_url}/cache?key={key}"
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.get(url, headers=headers)
+        response = get_http_session().get(url, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully retrieved cached data for key: {key}")
@@ -91,7 +90,7 @@ class ToolCache(PlatformBase):
         """
         url = f"{self.base_url}/cache?key={key}"
         headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.delete(url, headers=headers)
+        response = get_http_session().delete(url, headers=headers)
 
         if response.status_code == 200:
             self.tool.stream_log(f"Successfully deleted cached data for key: {key}")
@@ -36,6 +36,7 @@ class ConnectorKeys:
 
 class AdapterKeys:
     ADAPTER_INSTANCE_ID = "adapter_instance_id"
+    ADAPTER_INSTANCE_IDS = "adapter_instance_ids"
 
 
 class PromptStudioKeys:
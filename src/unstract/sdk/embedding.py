@@ -1,35 +1,90 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from deprecated import deprecated
 from llama_index.core.base.embeddings.base import Embedding
+from llama_index.core.bridge.pydantic import PrivateAttr
 from llama_index.core.callbacks import CallbackManager as LlamaIndexCallbackManager
+from llama_index.core.callbacks import CBEventType, EventPayload
 from llama_index.core.embeddings import BaseEmbedding
 from unstract.sdk.adapter import ToolAdapter
 from unstract.sdk.adapters.constants import Common
 from unstract.sdk.adapters.embedding import adapters
+from unstract.sdk.adapters.embedding.embedding_adapter import EmbeddingAdapter
 from unstract.sdk.constants import LogLevel, ToolEnv
 from unstract.sdk.exceptions import EmbeddingError, SdkError
 from unstract.sdk.helper import SdkHelper
 from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.utils import ToolUtils
+from unstract.sdk.utils.adaptive_batching import AdaptiveEmbeddingBatcher
+from unstract.sdk.utils.cache_backends import CacheBackend, SQLiteCacheBackend
 from unstract.sdk.utils.callback_manager import CallbackManager
+from unstract.sdk.utils.embedding_cache import CachedEmbedding, EmbeddingCacheStats
+from unstract.sdk.utils.rate_limiter import RateLimiter, estimate_tokens
+from unstract.sdk.utils.tokenizer import count_tokens, count_tokens_batch
+from unstract.sdk.utils.usage_handler import UsageHandler
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    DIMENSION_CACHE_PATH = "EMBEDDING_DIMENSION_CACHE_PATH"
+    DIMENSION_KEY_SUFFIX = "dimension"
+    DEFAULT_MAX_IN_FLIGHT = 4
 
 
 class Embedding:
+    """Class to handle embedding models for Unstract Tools.
+
+    The embedding dimension is resolved once per adapter config and held
+    process-wide. It's taken from the adapter when declared, else
+    determined by embedding a test snippet. Determined dimensions are also
+    persisted in the embedding cache backend if any, and in a SQLite file
+    at EMBEDDING_DIMENSION_CACHE_PATH if set.
+    """
+
     _TEST_SNIPPET = "Hello, I am Unstract"
     MAX_TOKENS = 1024 * 16
     embedding_adapters = adapters
+    _dimension_cache: dict[str, int] = {}
+    _dimension_cache_lock = threading.Lock()
+    _dimension_cache_backend: CacheBackend | None = None
 
     def __init__(
         self,
         tool: BaseTool,
         adapter_instance_id: str | None = None,
         usage_kwargs: dict[Any, Any] = {},
+        cache_backend: CacheBackend | None = None,
     ):
+        """Creates an instance of Embedding.
+
+        Args:
+            tool (BaseTool): Instance of BaseTool to expose function to stream logs
+            adapter_instance_id (Optional[str], optional): UUID of the embedding
+                adapter. Defaults to None.
+            usage_kwargs (dict[Any, Any], optional): Dict to capture usage.
+                Defaults to {}.
+            cache_backend (Optional[CacheBackend], optional): Store of previously
+                computed embeddings, looked up before calling the provider.
+                Defaults to None.
+        """
         self._tool = tool
         self._adapter_instance_id = adapter_instance_id
         self._embedding_instance: BaseEmbedding = None
         self._length: int = None
         self._usage_kwargs = usage_kwargs
+        self._cache_backend = cache_backend
+        self._config_hash: str | None = None
+        self._embedding_adapter: EmbeddingAdapter | None = None
+        self._batcher: AdaptiveEmbeddingBatcher | None = None
+        self._rate_limiter: RateLimiter | None = None
+        self._embed_model: BaseEmbedding | None = None
         self._initialise()
 
     def _initialise(self):
@@ -45,6 +100,15 @@ class Embedding:
                     model=self._embedding_instance,
                     kwargs=self._usage_kwargs,
                 )
+            # Wrapped after the callbacks are set on the model, which the
+            # wrapper shares to capture usage of the texts actually embedded
+            if self._cache_backend is not None:
+                self._embedding_instance = CachedEmbedding(
+                    embedding=self._embedding_instance,
+                    backend=self._cache_backend,
+                    config_hash=self._config_hash,
+                )
+            self._batcher = self._get_batcher()
 
     def _get_embedding(self) -> BaseEmbedding:
         """Gets an instance of LlamaIndex's embedding object.
@@ -64,6 +128,9 @@ class Embedding:
             embedding_config_data = ToolAdapter.get_adapter_config(
                 self._tool, self._adapter_instance_id
             )
+            self._config_hash = ToolUtils.hash_str(
+                json.dumps(embedding_config_data, sort_keys=True)
+            )
             embedding_adapter_id = embedding_config_data.get(Common.ADAPTER_ID)
             if embedding_adapter_id not in self.embedding_adapters:
                 raise SdkError(
@@ -74,7 +141,11 @@ class Embedding:
                 Common.METADATA
             ][Common.ADAPTER]
             embedding_metadata = embedding_config_data.get(Common.ADAPTER_METADATA)
+            self._rate_limiter = RateLimiter.from_adapter(
+                self._adapter_instance_id, embedding_metadata
+            )
             embedding_adapter_class = embedding_adapter(embedding_metadata)
+            self._embedding_adapter = embedding_adapter_class
             self._usage_kwargs["provider"] = embedding_adapter_class.get_provider()
             return embedding_adapter_class.get_embedding_instance()
         except Exception as e:
@@ -84,13 +155,272 @@ class Embedding:
             raise EmbeddingError(f"Error getting embedding instance: {e}") from e
 
     def get_query_embedding(self, query: str) -> Embedding:
-        return self._embedding_instance.get_query_embedding(query)
+        """Embeds a query, served from the embedding cache if enabled.
+
+        Only queries sent to the provider wait for the adapter's rate limit.
+        """
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return self._embedding_instance.embed_query(query, self._embed_query)
+        return self._embed_query(query)
+
+    async def aget_query_embedding(self, query: str) -> Embedding:
+        """Async version of `get_query_embedding()`."""
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return await self._embedding_instance.aembed_query(query, self._aembed_query)
+        return await self._aembed_query(query)
+
+    def _embed_query(self, query: str) -> Embedding:
+        if self._rate_limiter:
+            self._rate_limiter.acquire(estimate_tokens(query))
+        return self._get_base_embedding().get_query_embedding(query)
+
+    async def _aembed_query(self, query: str) -> Embedding:
+        if self._rate_limiter:
+            await self._rate_limiter.aacquire(estimate_tokens(query))
+        return await self._get_base_embedding().aget_query_embedding(query)
+
+    def get_embed_model(self) -> BaseEmbedding:
+        """Gets a llama-index model which embeds through this instance.
+
+        Meant to be passed as the `embed_model` of llama-index components,
+        such as `VectorStoreIndex`, so that their embeddings are rate limited,
+        batched adaptively and cached like those of `get_text_embeddings()`.
+
+        Returns:
+            BaseEmbedding: llama-index embedding model
+        """
+        if self._embed_model is None:
+            self._embed_model = _EmbedModel(self)
+        return self._embed_model
+
+    def get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        """Embeds texts in batches adapted to the provider's limits.
+
+        Unlike llama-index's fixed `embed_batch_size`, batches are packed by
+        token count and resized as the provider accepts or rate limits them,
+        see `AdaptiveEmbeddingBatcher`. Cached embeddings are reused when an
+        embedding cache is configured.
+
+        Args:
+            texts (list[str]): Texts to embed
+
+        Returns:
+            list[Embedding]: Embedding of each text, in order
+        """
+        if not texts:
+            return []
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return self._embedding_instance.embed_texts(texts, self._batcher.embed)
+        return self._batcher.embed(texts)
+
+    def get_text_embeddings_concurrent(
+        self, texts: list[str], max_in_flight: int = Constants.DEFAULT_MAX_IN_FLIGHT
+    ) -> list[Embedding]:
+        """Embeds texts with several batches in flight at once.
+
+        Same as `get_text_embeddings()`, except that the texts are split into
+        groups which are embedded from a thread pool. The groups share the
+        adaptive batch size, so a rate limit on one shrinks the others.
+
+        Args:
+            texts (list[str]): Texts to embed
+            max_in_flight (int, optional): Maximum number of concurrent
+                requests to the provider. Defaults to 4.
+
+        Returns:
+            list[Embedding]: Embedding of each text, in order
+        """
+        if not texts:
+            return []
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return self._embedding_instance.embed_texts(
+                texts, lambda misses: self._embed_concurrent(misses, max_in_flight)
+            )
+        return self._embed_concurrent(texts, max_in_flight)
+
+    def _embed_concurrent(self, texts: list[str], max_in_flight: int) -> list[Embedding]:
+        groups = self._batcher.split(texts)
+        if len(groups) == 1 or max_in_flight <= 1:
+            return self._batcher.embed(texts)
+        with ThreadPoolExecutor(
+            max_workers=min(max_in_flight, len(groups)),
+            thread_name_prefix="embedding",
+        ) as executor:
+            results = list(executor.map(self._batcher.embed, groups))
+        return [embedding for result in results for embedding in result]
+
+    async def aget_text_embeddings(
+        self, texts: list[str], max_in_flight: int = Constants.DEFAULT_MAX_IN_FLIGHT
+    ) -> list[Embedding]:
+        """Async version of `get_text_embeddings_concurrent()`.
+
+        Args:
+            texts (list[str]): Texts to embed
+            max_in_flight (int, optional): Maximum number of concurrent
+                requests to the provider. Defaults to 4.
+
+        Returns:
+            list[Embedding]: Embedding of each text, in order
+        """
+        if not texts:
+            return []
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return await self._embedding_instance.aembed_texts(
+                texts, lambda misses: self._aembed_concurrent(misses, max_in_flight)
+            )
+        return await self._aembed_concurrent(texts, max_in_flight)
+
+    async def _aembed_concurrent(
+        self, texts: list[str], max_in_flight: int
+    ) -> list[Embedding]:
+        semaphore = asyncio.Semaphore(max(max_in_flight, 1))
+
+        async def _embed_group(group: list[str]) -> list[Embedding]:
+            async with semaphore:
+                return await self._batcher.aembed(group)
+
+        results = await asyncio.gather(
+            *(_embed_group(group) for group in self._batcher.split(texts))
+        )
+        return [embedding for result in results for embedding in result]
+
+    def _get_batcher(self) -> AdaptiveEmbeddingBatcher:
+        model = self._get_base_embedding()
+        model_name = CallbackManager.get_model_name(model)
+        return AdaptiveEmbeddingBatcher(
+            embed_fn=self._embed_batch,
+            aembed_fn=self._aembed_batch,
+            count_tokens=lambda text: count_tokens(text, model_name),
+            count_tokens_batch=lambda texts: count_tokens_batch(texts, model_name),
+            initial_batch_size=model.embed_batch_size,
+            # Learnt once per adapter config, for every Embedding of it
+            key=self._config_hash or self._adapter_instance_id,
+        )
+
+    def _embed_batch(self, texts: list[str]) -> list[Embedding]:
+        """Embeds texts in a single request, firing the usage callbacks."""
+        if self._rate_limiter:
+            self._rate_limiter.acquire(sum(estimate_tokens(text) for text in texts))
+        model = self._get_base_embedding()
+        with model.callback_manager.event(
+            CBEventType.EMBEDDING, payload={EventPayload.SERIALIZED: model.to_dict()}
+        ) as event:
+            embeddings = model._get_text_embeddings(texts)
+            event.on_end(
+                payload={
+                    EventPayload.CHUNKS: texts,
+                    EventPayload.EMBEDDINGS: embeddings,
+                },
+            )
+        return embeddings
+
+    async def _aembed_batch(self, texts: list[str]) -> list[Embedding]:
+        """Async version of `_embed_batch()`."""
+        if self._rate_limiter:
+            await self._rate_limiter.aacquire(
+                sum(estimate_tokens(text) for text in texts)
+            )
+        model = self._get_base_embedding()
+        with model.callback_manager.event(
+            CBEventType.EMBEDDING, payload={EventPayload.SERIALIZED: model.to_dict()}
+        ) as event:
+            embeddings = await model._aget_text_embeddings(texts)
+            event.on_end(
+                payload={
+                    EventPayload.CHUNKS: texts,
+                    EventPayload.EMBEDDINGS: embeddings,
+                },
+            )
+        return embeddings
 
     def _get_embedding_length(self) -> int:
+        if not self._config_hash:
+            return self._probe_embedding_length()
+        with Embedding._dimension_cache_lock:
+            embedding_dimension = Embedding._dimension_cache.get(self._config_hash)
+        if embedding_dimension:
+            return embedding_dimension
+
+        if self._embedding_adapter:
+            embedding_dimension = self._embedding_adapter.get_embedding_dimension()
+        if not embedding_dimension:
+            embedding_dimension = self._get_persisted_embedding_length()
+        if not embedding_dimension:
+            embedding_dimension = self._probe_embedding_length()
+            self._persist_embedding_length(embedding_dimension)
+        with Embedding._dimension_cache_lock:
+            Embedding._dimension_cache[self._config_hash] = embedding_dimension
+        return embedding_dimension
+
+    def _probe_embedding_length(self) -> int:
         embedding_list = self._embedding_instance._get_text_embedding(self._TEST_SNIPPET)
         embedding_dimension = len(embedding_list)
         return embedding_dimension
 
+    @classmethod
+    def _get_dimension_cache_backend(cls) -> CacheBackend | None:
+        db_path = os.environ.get(Constants.DIMENSION_CACHE_PATH)
+        if not db_path:
+            return None
+        with cls._dimension_cache_lock:
+            if not cls._dimension_cache_backend:
+                cls._dimension_cache_backend = SQLiteCacheBackend(db_path)
+            return cls._dimension_cache_backend
+
+    def _get_dimension_backends(self) -> list[CacheBackend]:
+        backends = [self._cache_backend, self._get_dimension_cache_backend()]
+        return [backend for backend in backends if backend is not None]
+
+    def _get_persisted_embedding_length(self) -> int | None:
+        key = f"{self._config_hash}:{Constants.DIMENSION_KEY_SUFFIX}"
+        for backend in self._get_dimension_backends():
+            try:
+                value = backend.get(key)
+            except Exception as e:
+                logger.warning(f"Unable to read embedding dimension: {e}")
+                continue
+            if value:
+                return int(value)
+        return None
+
+    def _persist_embedding_length(self, embedding_dimension: int) -> None:
+        key = f"{self._config_hash}:{Constants.DIMENSION_KEY_SUFFIX}"
+        for backend in self._get_dimension_backends():
+            try:
+                backend.set(key, str(embedding_dimension).encode())
+            except Exception as e:
+                logger.warning(f"Unable to persist embedding dimension: {e}")
+
+    @classmethod
+    def clear_dimension_cache(cls) -> None:
+        """Clears the process-wide cache of embedding dimensions."""
+        with cls._dimension_cache_lock:
+            cls._dimension_cache.clear()
+
+    def set_usage_kwargs(self, usage_kwargs: dict[Any, Any]) -> None:
+        """Replaces the details usage is reported with, such as the run ID.
+
+        Used to reuse an instance for another run, see `AdapterPool`.
+
+        Args:
+            usage_kwargs (dict[Any, Any]): Dict to capture usage
+        """
+        # Keeps the details set from the adapter, such as the provider
+        for key in list(self._usage_kwargs):
+            if key not in ("adapter_instance_id", "provider"):
+                del self._usage_kwargs[key]
+        self._usage_kwargs.update(
+            {
+                key: value
+                for key, value in usage_kwargs.items()
+                if key not in ("adapter_instance_id", "provider")
+            }
+        )
+        callback_manager = self._get_base_embedding().callback_manager
+        for handler in callback_manager.handlers if callback_manager else []:
+            if isinstance(handler, UsageHandler):
+                handler.kwargs = self._usage_kwargs.copy()
+
     def get_class_name(self) -> str:
         """Gets the class name of the Llama Index Embedding.
 
@@ -100,7 +430,22 @@ class Embedding:
         Returns:
                 Class name
         """
-        return self._embedding_instance.class_name()
+        return self._get_base_embedding().class_name()
+
+    def _get_base_embedding(self) -> BaseEmbedding:
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return self._embedding_instance.embedding
+        return self._embedding_instance
+
+    def get_cache_stats(self) -> EmbeddingCacheStats | None:
+        """Gets the hits and misses of the embedding cache.
+
+        Returns:
+            Optional[EmbeddingCacheStats]: Counters, None if caching is disabled
+        """
+        if isinstance(self._embedding_instance, CachedEmbedding):
+            return self._embedding_instance.get_stats()
+        return None
 
     def get_callback_manager(self) -> LlamaIndexCallbackManager:
         """Gets the llama-index callback manager set on the model.
@@ -125,5 +470,60 @@ class Embedding:
         return self._embedding_instance
 
 
+class _EmbedModel(BaseEmbedding):
+    """llama-index embedding model delegating to an `Embedding`."""
+
+    _embedding: Embedding = PrivateAttr()
+
+    def __init__(self, embedding: Embedding) -> None:
+        model = embedding._get_base_embedding()
+        super().__init__(
+            model_name=model.model_name,
+            embed_batch_size=model.embed_batch_size,
+            callback_manager=model.callback_manager,
+            num_workers=model.num_workers,
+        )
+        self._embedding = embedding
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "UnstractEmbedding"
+
+    def get_query_embedding(self, query: str) -> list[float]:
+        return self._embedding.get_query_embedding(query)
+
+    async def aget_query_embedding(self, query: str) -> list[float]:
+        return await self._embedding.aget_query_embedding(query)
+
+    def get_text_embedding(self, text: str) -> list[float]:
+        return self._embedding.get_text_embeddings([text])[0]
+
+    async def aget_text_embedding(self, text: str) -> list[float]:
+        return (await self._embedding.aget_text_embeddings([text]))[0]
+
+    def get_text_embedding_batch(
+        self, texts: list[str], show_progress: bool = False, **kwargs: Any
+    ) -> list[list[float]]:
+        return self._embedding.get_text_embeddings(texts)
+
+    async def aget_text_embedding_batch(
+        self, texts: list[str], show_progress: bool = False
+    ) -> list[list[float]]:
+        return await self._embedding.aget_text_embeddings(texts)
+
+    # The public methods above are what llama-index calls
+    def _get_query_embedding(self, query: str) -> list[float]:
+        return self._embedding._embed_query(query)
+
+    async def _aget_query_embedding(self, query: str) -> list[float]:
+        return await self._embedding._aembed_query(query)
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        return self._embedding._embed_batch([text])[0]
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        return self._embedding._embed_batch(texts)
+
+
 # Legacy
 ToolEmbedding = Embedding
@@ -7,6 +7,7 @@ __all__ = [
     "SharedTemporaryFileStorage",
     "EnvHelper",
     "StorageType",
+    "ExtractionCache",
 ]
 
 # Do not change the order of the imports below to avoid circular dependency issues
@@ -20,3 +21,4 @@ from unstract.sdk.file_storage.shared_temporary import (
     SharedTemporaryFileStorage,
 )
 from unstract.sdk.file_storage.env_helper import EnvHelper
+from unstract.sdk.file_storage.extraction_cache import ExtractionCache
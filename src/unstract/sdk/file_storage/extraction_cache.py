@@ -0,0 +1,248 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from unstract.sdk.file_storage.impl import FileStorage
+from unstract.sdk.file_storage.provider import FileStorageProvider
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    DEFAULT_MAX_SIZE_BYTES = 1024 * 1024 * 1024
+    ENTRY_SUFFIX = ".json"
+    # Highlight metadata written by LLMWhisperer next to the output file
+    METADATA_DIR = "metadata"
+
+
+@dataclass
+class ExtractionCacheEntry:
+    """Cached result of extracting text from a file.
+
+    Attributes:
+        extracted_text (str): Text returned by the x2text adapter, before any
+            post-processing
+        whisper_hash (Optional[str]): Whisper hash returned by LLMWhisperer
+        highlight_metadata (Optional[str]): Contents of the highlight metadata
+            file LLMWhisperer writes alongside the output file
+    """
+
+    extracted_text: str
+    whisper_hash: str | None = None
+    highlight_metadata: str | None = None
+
+
+class ExtractionCache:
+    """Content addressed store of extracted text, kept in a FileStorage.
+
+    Entries are keyed by the hash of the file's contents, the hash of the
+    x2text adapter's config and whether highlighting was enabled, so that the
+    same document extracted the same way is only sent to the text extractor
+    once, even across projects. Once the entries exceed `max_size_bytes`, the
+    oldest written entries are evicted.
+
+    The entries are listed once, after which their total size is tracked as
+    entries are written and only listed again once it exceeds the limit. Sizes
+    of entries written by other processes are only picked up then.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        fs: FileStorage | None = None,
+        max_size_bytes: int | None = Constants.DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        """Creates an extraction cache.
+
+        Args:
+            cache_dir (str): Directory in `fs` which holds the entries
+            fs (FileStorage, optional): Storage for the entries. Defaults to
+                local storage.
+            max_size_bytes (Optional[int], optional): Total size of entries
+                after which the oldest are evicted, never evicts if None.
+                Defaults to 1 GiB.
+        """
+        self._cache_dir = cache_dir
+        self._fs = fs or FileStorage(provider=FileStorageProvider.LOCAL)
+        self._max_size_bytes = max_size_bytes
+        # Total size of the entries, None until they are listed
+        self._total_size: int | None = None
+        self._size_lock = threading.Lock()
+
+    @staticmethod
+    def generate_key(
+        file_hash: str, x2text_config: dict[str, Any], enable_highlight: bool
+    ) -> str:
+        """Generates the key of an entry.
+
+        Args:
+            file_hash (str): SHA256 hash of the file's contents
+            x2text_config (dict[str, Any]): Config of the x2text adapter
+            enable_highlight (bool): Whether highlighting was enabled
+
+        Returns:
+            str: Key of the entry
+        """
+        config_hash = sha256(
+            json.dumps(x2text_config, sort_keys=True).encode()
+        ).hexdigest()
+        key = {
+            "file_hash": file_hash,
+            "x2text_config_hash": config_hash,
+            "enable_highlight": enable_highlight,
+        }
+        return sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}{Constants.ENTRY_SUFFIX}")
+
+    @staticmethod
+    def _metadata_path(output_file_path: str) -> str:
+        output_path = Path(output_file_path)
+        return str(
+            output_path.parent
+            / Constants.METADATA_DIR
+            / output_path.with_suffix(".json").name
+        )
+
+    def get(self, key: str) -> ExtractionCacheEntry | None:
+        """Fetches an entry.
+
+        Args:
+            key (str): Key from `generate_key()`
+
+        Returns:
+            Optional[ExtractionCacheEntry]: Entry if present and readable
+        """
+        entry_path = self._entry_path(key)
+        try:
+            if not self._fs.exists(entry_path):
+                return None
+            return ExtractionCacheEntry(**self._fs.json_load(entry_path))
+        except Exception as e:
+            logger.warning(f"Unable to read extraction cache entry {entry_path}: {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        extracted_text: str,
+        whisper_hash: str | None = None,
+        output_file_path: str | None = None,
+        output_fs: FileStorage | None = None,
+    ) -> None:
+        """Stores an entry, evicting older ones if needed.
+
+        Args:
+            key (str): Key from `generate_key()`
+            extracted_text (str): Text returned by the x2text adapter
+            whisper_hash (Optional[str], optional): Whisper hash returned by
+                LLMWhisperer. Defaults to None.
+            output_file_path (Optional[str], optional): Output file written
+                by the extraction, used to capture its highlight metadata.
+                Defaults to None.
+            output_fs (Optional[FileStorage], optional): Storage holding the
+                output file. Defaults to the storage of the cache.
+        """
+        output_fs = output_fs or self._fs
+        highlight_metadata = None
+        if output_file_path:
+            metadata_path = self._metadata_path(output_file_path)
+            try:
+                if output_fs.exists(metadata_path):
+                    highlight_metadata = output_fs.read(
+                        path=metadata_path, mode="r", encoding="utf-8"
+                    )
+            except Exception as e:
+                logger.warning(f"Unable to read highlight metadata {metadata_path}: {e}")
+        entry = ExtractionCacheEntry(
+            extracted_text=extracted_text,
+            whisper_hash=whisper_hash,
+            highlight_metadata=highlight_metadata,
+        )
+        try:
+            self._fs.mkdir(self._cache_dir)
+            entry_path = self._entry_path(key)
+            self._fs.json_dump(path=entry_path, data=asdict(entry))
+            self._track_size(entry_path)
+        except Exception as e:
+            logger.warning(f"Unable to write extraction cache entry {key}: {e}")
+
+    def restore_output(
+        self,
+        entry: ExtractionCacheEntry,
+        output_file_path: str,
+        output_fs: FileStorage | None = None,
+    ) -> None:
+        """Writes a cached entry to an output file as the extraction would.
+
+        Args:
+            entry (ExtractionCacheEntry): Cached entry
+            output_file_path (str): Path to write the extracted text into
+            output_fs (Optional[FileStorage], optional): Storage to write
+                into. Defaults to the storage of the cache.
+        """
+        output_fs = output_fs or self._fs
+        output_fs.write(
+            path=output_file_path,
+            mode="w",
+            data=entry.extracted_text,
+            encoding="utf-8",
+        )
+        if entry.highlight_metadata is not None:
+            metadata_path = self._metadata_path(output_file_path)
+            output_fs.mkdir(str(Path(metadata_path).parent))
+            output_fs.write(
+                path=metadata_path,
+                mode="w",
+                data=entry.highlight_metadata,
+                encoding="utf-8",
+            )
+
+    def delete(self, key: str) -> None:
+        entry_path = self._entry_path(key)
+        if self._fs.exists(entry_path):
+            self._fs.rm(entry_path, recursive=False)
+
+    def _track_size(self, entry_path: str) -> None:
+        """Adds a written entry to the total size, evicting once over the limit.
+
+        Overwritten entries are counted again, which only brings the next
+        listing of the entries forward.
+        """
+        if self._max_size_bytes is None:
+            return
+        with self._size_lock:
+            if self._total_size is not None:
+                self._total_size += self._fs.size(entry_path)
+                if self._total_size <= self._max_size_bytes:
+                    return
+            self._evict()
+
+    def _evict(self) -> None:
+        """Lists the entries and evicts the oldest ones over the limit."""
+        entries = []
+        total_size = 0
+        for path in self._fs.ls(self._cache_dir):
+            if not path.endswith(Constants.ENTRY_SUFFIX):
+                continue
+            size = self._fs.size(path)
+            total_size += size
+            entries.append((self._fs.modification_time(path), size, path))
+        self._total_size = total_size
+        if total_size <= self._max_size_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self._max_size_bytes:
+                break
+            self._fs.rm(path, recursive=False)
+            total_size -= size
+            logger.debug(f"Evicted extraction cache entry {path}")
+        self._total_size = total_size
@@ -1,11 +1,15 @@
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from deprecated import deprecated
 from llama_index.core import Document
 from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores import (
     FilterOperator,
     MetadataFilter,
@@ -14,6 +18,7 @@ from llama_index.core.vector_stores import (
     VectorStoreQueryResult,
 )
 from unstract.sdk.adapter import ToolAdapter
+from unstract.sdk.adapter_pool import AdapterPool
 from unstract.sdk.adapters.exceptions import AdapterError
 from unstract.sdk.adapters.vectordb.no_op.src.no_op_custom_vectordb import (
     NoOpCustomVectorDB,
@@ -25,9 +30,15 @@ from unstract.sdk.adapters.x2text.llm_whisperer_v2.src import LLMWhispererV2
 from unstract.sdk.constants import LogLevel
 from unstract.sdk.embedding import Embedding
 from unstract.sdk.exceptions import IndexingError, SdkError, VectorDBError, X2TextError
-from unstract.sdk.file_storage import FileStorage, FileStorageProvider
+from unstract.sdk.file_storage import (
+    ExtractionCache,
+    FileStorage,
+    FileStorageProvider,
+)
+from unstract.sdk.index_registry import IndexRegistry
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.utils import ToolUtils
+from unstract.sdk.utils.cache_backends import CacheBackend
 from unstract.sdk.utils.common_utils import capture_metrics, log_elapsed
 from unstract.sdk.vector_db import VectorDB
 from unstract.sdk.x2txt import X2Text
@@ -37,6 +48,31 @@ logger = logging.getLogger(__name__)
 
 class Constants:
     TOP_K = 5
+    DEFAULT_INDEX_WORKERS = 4
+
+
+@dataclass
+class IndexFileSpec:
+    """A file to be indexed as part of a batch with `Index.index_many()`."""
+
+    file_path: str
+    file_hash: str | None = None
+    output_file_path: str | None = None
+    reindex: bool = False
+    tags: list[str] | None = None
+
+
+@dataclass
+class IndexFileResult:
+    """Outcome of indexing a single file with `Index.index_many()`."""
+
+    file_path: str
+    doc_id: str | None = None
+    error: Exception | None = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
 
 
 class Index:
@@ -45,68 +81,127 @@ class Index:
         tool: BaseTool,
         run_id: str | None = None,
         capture_metrics: bool = False,
+        pipelined: bool = False,
+        registry: IndexRegistry | None = None,
+        verify_on_miss: bool = True,
+        extraction_cache: ExtractionCache | None = None,
+        embedding_cache: CacheBackend | None = None,
+        adapter_pool: AdapterPool | None = None,
     ):
+        """Creates an instance of Index.
+
+        Args:
+            tool (BaseTool): Instance of BaseTool to expose function to stream logs
+            run_id (Optional[str], optional): Run ID used to capture metrics.
+                Defaults to None.
+            capture_metrics (bool, optional): Flag to capture metrics.
+                Defaults to False.
+            pipelined (bool, optional): Overlap the split, embed and upsert
+                stages while indexing, see `VectorDB.index_document_pipelined()`.
+                Defaults to False.
+            registry (Optional[IndexRegistry], optional): Registry of indexed
+                doc_ids consulted before querying the vector DB and updated
+                after indexing. Defaults to None.
+            verify_on_miss (bool, optional): Query the vector DB when a doc_id
+                is missing from the registry, to catch documents indexed
+                elsewhere. Only used with a `registry`. Defaults to True.
+            extraction_cache (Optional[ExtractionCache], optional): Store of
+                previously extracted text, consulted before calling the text
+                extractor. Defaults to None.
+            embedding_cache (Optional[CacheBackend], optional): Store of
+                previously computed embeddings, see `Embedding`. Defaults to None.
+            adapter_pool (Optional[AdapterPool], optional): Pool to lease the
+                embedding and vector DB from instead of creating them for each
+                call, meant to be shared across a worker process. Defaults
+                to None.
+        """
         # TODO: Inherit from StreamMixin and avoid using BaseTool
         self.tool = tool
         self._run_id = run_id
         self._capture_metrics = capture_metrics
+        self._pipelined = pipelined
+        self._registry = registry
+        self._verify_on_miss = verify_on_miss
+        self._extraction_cache = extraction_cache
+        self._embedding_cache = embedding_cache
+        self._adapter_pool = adapter_pool
         self._metrics = {}
 
-    @capture_metrics
-    def query_index(
+    @contextmanager
+    def _get_vector_db(
         self,
         embedding_instance_id: str,
         vector_db_instance_id: str,
-        doc_id: str,
-        usage_kwargs: dict[Any, Any] = {},
-    ):
+        usage_kwargs: dict[Any, Any],
+    ) -> Iterator[tuple[Embedding, VectorDB]]:
+        """Leases the embedding and vector DB from the pool, else creates them.
+
+        Vector DBs which aren't pooled are closed on exit.
+        """
+        if self._adapter_pool is not None:
+            with self._adapter_pool.lease_vector_db(
+                tool=self.tool,
+                embedding_instance_id=embedding_instance_id,
+                vector_db_instance_id=vector_db_instance_id,
+                usage_kwargs=usage_kwargs,
+                embedding_cache=self._embedding_cache,
+                registry=self._registry,
+            ) as (embedding, vector_db):
+                yield embedding, vector_db
+            return
+
         embedding = Embedding(
             tool=self.tool,
             adapter_instance_id=embedding_instance_id,
             usage_kwargs=usage_kwargs,
+            cache_backend=self._embedding_cache,
         )
-
         vector_db = VectorDB(
             tool=self.tool,
             adapter_instance_id=vector_db_instance_id,
             embedding=embedding,
+            registry=self._registry,
         )
-
         try:
+            yield embedding, vector_db
+        finally:
+            vector_db.close()
+
+    @capture_metrics
+    def query_index(
+        self,
+        embedding_instance_id: str,
+        vector_db_instance_id: str,
+        doc_id: str,
+        usage_kwargs: dict[Any, Any] = {},
+    ):
+        """Fetches the complete indexed text of a document.
+
+        Nodes are listed in document order where the vector DB supports it,
+        see `VectorDB.get_sorted_nodes()`. Other vector DBs fall back to a
+        similarity search which returns at most `Constants.TOP_K` nodes.
+
+        Args:
+            embedding_instance_id (str): UUID of the embedding service configured
+            vector_db_instance_id (str): UUID of the vector DB configured
+            doc_id (str): Key generated by `generate_index_key()`
+            usage_kwargs (dict[Any, Any], optional): Dict to capture usage.
+                Defaults to {}.
+
+        Returns:
+            Optional[str]: Text of the document, None if it isn't indexed
+        """
+        with self._get_vector_db(
+            embedding_instance_id=embedding_instance_id,
+            vector_db_instance_id=vector_db_instance_id,
+            usage_kwargs=usage_kwargs,
+        ) as (embedding, vector_db):
             self.tool.stream_log(
                 f">>> Querying '{vector_db_instance_id}' for {doc_id}..."
             )
             try:
-                doc_id_eq_filter = MetadataFilter.from_dict(
-                    {
-                        "key": "doc_id",
-                        "operator": FilterOperator.EQ,
-                        "value": doc_id,
-                    }
-                )
-                filters = MetadataFilters(filters=[doc_id_eq_filter])
-                q = VectorStoreQuery(
-                    query_embedding=embedding.get_query_embedding(" "),
-                    doc_ids=[doc_id],
-                    filters=filters,
-                    similarity_top_k=Constants.TOP_K,
-                )
-            except Exception as e:
-                self.tool.stream_log(
-                    f"Error while building vector DB query: {e}", level=LogLevel.ERROR
-                )
-                raise VectorDBError(
-                    f"Failed to construct query for {vector_db}: {e}", actual_err=e
-                )
-            try:
-                n: VectorStoreQueryResult = vector_db.query(query=q)
-                if len(n.nodes) > 0:
-                    self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
-                    all_text = ""
-                    for node in n.nodes:
-                        all_text += node.get_content()
-                    return all_text
-                else:
+                # Avoids computing a query embedding for missing documents
+                if not vector_db.doc_exists(ref_doc_id=doc_id):
                     self.tool.stream_log(f"No nodes found for {doc_id}")
                     return None
             except Exception as e:
@@ -115,9 +210,136 @@ class Index:
                 )
                 raise VectorDBError(
                     f"Failed to execute query on {vector_db}: {e}", actual_err=e
-                )
-        finally:
-            vector_db.close()
+                ) from e
+            try:
+                texts = [
+                    node.get_content()
+                    for node in self._get_sorted_nodes(vector_db=vector_db, doc_id=doc_id)
+                ]
+            except NotImplementedError:
+                texts = []
+            if texts:
+                self.tool.stream_log(f"Found {len(texts)} nodes for {doc_id}")
+                return "".join(texts)
+            return self._query_nodes_by_similarity(
+                embedding=embedding, vector_db=vector_db, doc_id=doc_id
+            )
+
+    def get_document_nodes(
+        self,
+        embedding_instance_id: str,
+        vector_db_instance_id: str,
+        doc_id: str,
+        usage_kwargs: dict[Any, Any] = {},
+    ) -> Iterator[BaseNode]:
+        """Fetches every node indexed for a document in document order.
+
+        Unlike `query_index()` this never falls back to a similarity search,
+        so the nodes are never a partial subset of the document. Nodes are
+        yielded as they are read from the vector DB, see
+        `VectorDB.get_sorted_nodes()` for how much is held in memory. The
+        vector DB is released once the nodes are exhausted or the generator
+        is closed.
+
+        Args:
+            embedding_instance_id (str): UUID of the embedding service configured
+            vector_db_instance_id (str): UUID of the vector DB configured
+            doc_id (str): Key generated by `generate_index_key()`
+            usage_kwargs (dict[Any, Any], optional): Dict to capture usage.
+                Defaults to {}.
+
+        Yields:
+            BaseNode: Nodes of the document, ordered by their position
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support listing nodes
+        """
+        with self._get_vector_db(
+            embedding_instance_id=embedding_instance_id,
+            vector_db_instance_id=vector_db_instance_id,
+            usage_kwargs=usage_kwargs,
+        ) as (embedding, vector_db):
+            yield from self._get_sorted_nodes(vector_db=vector_db, doc_id=doc_id)
+
+    def get_document_text(
+        self,
+        embedding_instance_id: str,
+        vector_db_instance_id: str,
+        doc_id: str,
+        usage_kwargs: dict[Any, Any] = {},
+    ) -> str | None:
+        """Joins the text of every node indexed for a document.
+
+        See `get_document_nodes()`.
+
+        Returns:
+            Optional[str]: Text of the document, None if it isn't indexed
+        """
+        texts = [
+            node.get_content()
+            for node in self.get_document_nodes(
+                embedding_instance_id=embedding_instance_id,
+                vector_db_instance_id=vector_db_instance_id,
+                doc_id=doc_id,
+                usage_kwargs=usage_kwargs,
+            )
+        ]
+        return "".join(texts) if texts else None
+
+    def _get_sorted_nodes(self, vector_db: VectorDB, doc_id: str) -> Iterator[BaseNode]:
+        try:
+            yield from vector_db.get_sorted_nodes(ref_doc_id=doc_id)
+        except NotImplementedError as e:
+            logger.debug(f"Unable to list nodes of {doc_id}: {e}")
+            raise
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error while fetching nodes from vector DB: {e}", level=LogLevel.ERROR
+            )
+            raise VectorDBError(
+                f"Failed to fetch nodes from {vector_db}: {e}", actual_err=e
+            ) from e
+
+    def _query_nodes_by_similarity(
+        self, embedding: Embedding, vector_db: VectorDB, doc_id: str
+    ) -> str | None:
+        try:
+            doc_id_eq_filter = MetadataFilter.from_dict(
+                {
+                    "key": "doc_id",
+                    "operator": FilterOperator.EQ,
+                    "value": doc_id,
+                }
+            )
+            filters = MetadataFilters(filters=[doc_id_eq_filter])
+            q = VectorStoreQuery(
+                query_embedding=embedding.get_query_embedding(" "),
+                doc_ids=[doc_id],
+                filters=filters,
+                similarity_top_k=Constants.TOP_K,
+            )
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error while building vector DB query: {e}", level=LogLevel.ERROR
+            )
+            raise VectorDBError(
+                f"Failed to construct query for {vector_db}: {e}", actual_err=e
+            ) from e
+        try:
+            n: VectorStoreQueryResult = vector_db.query(query=q)
+            if len(n.nodes) > 0:
+                self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
+                return "".join(node.get_content() for node in n.nodes)
+            else:
+                self.tool.stream_log(f"No nodes found for {doc_id}")
+                return None
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error while executing vector DB query: {e}", level=LogLevel.ERROR
+            )
+            raise VectorDBError(
+                f"Failed to execute query on {vector_db}: {e}", actual_err=e
+            ) from e
 
     @log_elapsed(operation="EXTRACTION")
     def extract_text(
@@ -130,6 +352,8 @@ class Index:
         process_text: Callable[[str], str] | None = None,
         fs: FileStorage = FileStorage(FileStorageProvider.LOCAL),
         tags: list[str] | None = None,
+        file_hash: str | None = None,
+        x2text: X2Text | None = None,
     ) -> str:
         """Extracts text from a document.
 
@@ -150,17 +374,91 @@ class Index:
             process_text (Optional[Callable[[str], str]], optional): Optional function
                 to post-process the text. Defaults to None.
             tags: (Optional[list[str]], optional): Tags
+            file_hash (Optional[str], optional): SHA256 hash of the file, used
+                to look up the extraction cache. Defaults to None. If None, the
+                hash is generated when an extraction cache is configured.
+            x2text (Optional[X2Text], optional): Text extractor of
+                `x2text_instance_id` to reuse across files. Defaults to None,
+                to create one.
 
         Raises:
             IndexingError: Errors during text extraction
         """
+        cache_key = None
+        if self._extraction_cache:
+            cache_key = self._get_extraction_cache_key(
+                x2text_instance_id=x2text_instance_id,
+                file_path=file_path,
+                file_hash=file_hash,
+                enable_highlight=enable_highlight,
+                fs=fs,
+            )
+        cache_entry = None
+        if cache_key:
+            cache_entry = self._extraction_cache.get(cache_key)
+
+        if cache_entry:
+            self.tool.stream_log("Reusing previously extracted text of input file")
+            extracted_text = cache_entry.extracted_text
+            if output_file_path:
+                self._extraction_cache.restore_output(
+                    entry=cache_entry, output_file_path=output_file_path, output_fs=fs
+                )
+            if (
+                enable_highlight
+                and cache_entry.whisper_hash
+                and hasattr(self.tool, "update_exec_metadata")
+            ):
+                self.tool.update_exec_metadata(
+                    {X2TextConstants.WHISPER_HASH: cache_entry.whisper_hash}
+                )
+        else:
+            extracted_text = self._extract_text(
+                x2text_instance_id=x2text_instance_id,
+                file_path=file_path,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                usage_kwargs=usage_kwargs,
+                fs=fs,
+                tags=tags,
+                cache_key=cache_key,
+                x2text=x2text,
+            )
+        if process_text:
+            try:
+                result = process_text(extracted_text)
+                if isinstance(result, str):
+                    extracted_text = result
+                else:
+                    logger.warning("'process_text' is expected to return an 'str'")
+            except Exception as e:
+                logger.error(
+                    f"Error occured inside callable 'process_text': {e}\n"
+                    "continuing processing..."
+                )
+        return extracted_text
+
+    def _extract_text(
+        self,
+        x2text_instance_id: str,
+        file_path: str,
+        output_file_path: str | None,
+        enable_highlight: bool,
+        usage_kwargs: dict[Any, Any],
+        fs: FileStorage,
+        tags: list[str] | None,
+        cache_key: str | None = None,
+        x2text: X2Text | None = None,
+    ) -> str:
+        """Extracts text with the x2text adapter, caching it if `cache_key` is set."""
         self.tool.stream_log("Extracting text from input file")
-        extracted_text = ""
-        x2text = X2Text(
-            tool=self.tool,
-            adapter_instance_id=x2text_instance_id,
-            usage_kwargs=usage_kwargs,
-        )
+        whisper_hash_value = None
+        if not x2text:
+            x2text = X2Text(
+                tool=self.tool,
+                adapter_instance_id=x2text_instance_id,
+                usage_kwargs=usage_kwargs,
+            )
         try:
             if enable_highlight and (
                 isinstance(x2text.x2text_instance, LLMWhisperer)
@@ -190,20 +488,38 @@ class Index:
             msg = f"Error from text extractor '{x2text.x2text_instance.get_name()}'. "
             msg += str(e)
             raise X2TextError(msg) from e
-        if process_text:
-            try:
-                result = process_text(extracted_text)
-                if isinstance(result, str):
-                    extracted_text = result
-                else:
-                    logger.warning("'process_text' is expected to return an 'str'")
-            except Exception as e:
-                logger.error(
-                    f"Error occured inside callable 'process_text': {e}\n"
-                    "continuing processing..."
-                )
+        if cache_key and extracted_text:
+            self._extraction_cache.put(
+                key=cache_key,
+                extracted_text=extracted_text,
+                whisper_hash=whisper_hash_value,
+                output_file_path=output_file_path,
+                output_fs=fs,
+            )
         return extracted_text
 
+    def _get_extraction_cache_key(
+        self,
+        x2text_instance_id: str,
+        file_path: str,
+        file_hash: str | None,
+        enable_highlight: bool,
+        fs: FileStorage,
+    ) -> str | None:
+        """Generates the extraction cache key, None if it can't be generated."""
+        try:
+            if not file_hash:
+                file_hash = fs.get_hash_from_file(path=file_path)
+            x2text_config = ToolAdapter.get_adapter_config(self.tool, x2text_instance_id)
+        except Exception as e:
+            logger.warning(f"Unable to look up extraction cache for {file_path}: {e}")
+            return None
+        return ExtractionCache.generate_key(
+            file_hash=file_hash,
+            x2text_config=x2text_config,
+            enable_highlight=enable_highlight,
+        )
+
     # TODO: Reduce the number of params by some dataclass
     # TODO: Deprecate and remove `process_text` argument
     @log_elapsed(operation="CHECK_AND_INDEX(overall)")
@@ -262,90 +578,241 @@ class Index:
             fs=fs,
         )
         self.tool.stream_log(f"Checking if doc_id {doc_id} exists")
-        embedding = Embedding(
-            tool=self.tool,
-            adapter_instance_id=embedding_instance_id,
+        with self._get_vector_db(
+            embedding_instance_id=embedding_instance_id,
+            vector_db_instance_id=vector_db_instance_id,
             usage_kwargs=usage_kwargs,
-        )
+        ) as (embedding, vector_db):
+            return self._index_file(
+                doc_id=doc_id,
+                embedding=embedding,
+                vector_db=vector_db,
+                vector_db_instance_id=vector_db_instance_id,
+                x2text_instance_id=x2text_instance_id,
+                file_path=file_path,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                reindex=reindex,
+                output_file_path=output_file_path,
+                enable_highlight=enable_highlight,
+                usage_kwargs=usage_kwargs,
+                process_text=process_text,
+                fs=fs,
+                tags=tags,
+                file_hash=file_hash,
+            )
 
-        vector_db = VectorDB(
-            tool=self.tool,
-            adapter_instance_id=vector_db_instance_id,
-            embedding=embedding,
-        )
+    @log_elapsed(operation="CHECK_AND_INDEX(batch)")
+    @capture_metrics
+    def index_many(
+        self,
+        files: list[IndexFileSpec],
+        embedding_instance_id: str,
+        vector_db_instance_id: str,
+        x2text_instance_id: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        max_workers: int = Constants.DEFAULT_INDEX_WORKERS,
+        enable_highlight: bool = False,
+        usage_kwargs: dict[Any, Any] = {},
+        process_text: Callable[[str], str] | None = None,
+        fs: FileStorage = FileStorage(provider=FileStorageProvider.LOCAL),
+    ) -> list[IndexFileResult]:
+        """Indexes a batch of files which share the same adapters.
 
-        try:
-            # Checking if document is already indexed against doc_id
-            doc_id_eq_filter = MetadataFilter.from_dict(
-                {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
-            )
-            filters = MetadataFilters(filters=[doc_id_eq_filter])
-            q = VectorStoreQuery(
-                query_embedding=embedding.get_query_embedding(" "),
-                doc_ids=[doc_id],
-                filters=filters,
-            )
+        Files are processed on a bounded pool of worker threads. A single
+        `Embedding`, `VectorDB` and `X2Text` instance is created for the batch
+        and shared by all workers. Failure to index a file is captured in its
+        result and does not abort the rest of the batch.
 
-            doc_id_found = False
-            try:
-                n: VectorStoreQueryResult = vector_db.query(query=q)
-                if len(n.nodes) > 0:
-                    doc_id_found = True
-                    self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
-                else:
-                    self.tool.stream_log(f"No nodes found for {doc_id}")
-            except Exception as e:
-                self.tool.stream_log(
-                    f"Error querying {vector_db_instance_id}: {e}, proceeding to index",
-                    level=LogLevel.ERROR,
-                )
+        Args:
+            files (list[IndexFileSpec]): Files to index along with their
+                per-file options
+            embedding_instance_id (str): UUID of the embedding service configured
+            vector_db_instance_id (str): UUID of the vector DB configured
+            x2text_instance_id (str): UUID of the x2text adapter configured.
+            chunk_size (int): Chunk size to be used for indexing
+            chunk_overlap (int): Overlap in chunks to be used for indexing
+            max_workers (int, optional): Maximum number of files indexed
+                concurrently. Defaults to Constants.DEFAULT_INDEX_WORKERS.
+            enable_highlight (bool, optional): Flag to provide highlighting metadata.
+                Defaults to False.
+            usage_kwargs (dict[Any, Any], optional): Dict to capture usage.
+                Defaults to {}.
+            process_text (Optional[Callable[[str], str]], optional): Optional function
+                to post-process the text. Defaults to None.
+            fs (FileStorage): file storage object to perfrom file operations
+
+        Returns:
+            list[IndexFileResult]: Result for each file, in the same order as
+                `files`
+        """
+        if not files:
+            return []
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1")
 
-            if doc_id_found and not reindex:
-                self.tool.stream_log(f"File was indexed already under {doc_id}")
-                if output_file_path and not fs.exists(output_file_path):
-                    # Added this as a workaround to handle extraction
-                    # for documents uploaded twice in different projects.
-                    # to be reconsidered after permanent fixes.
-                    extracted_text = self.extract_text(
+        self.tool.stream_log(
+            f"Indexing {len(files)} file(s) with up to {max_workers} worker(s)"
+        )
+        with self._get_vector_db(
+            embedding_instance_id=embedding_instance_id,
+            vector_db_instance_id=vector_db_instance_id,
+            usage_kwargs=usage_kwargs,
+        ) as (embedding, vector_db):
+            x2text = X2Text(
+                tool=self.tool,
+                adapter_instance_id=x2text_instance_id,
+                usage_kwargs=usage_kwargs,
+            )
+
+            def _index_spec(spec: IndexFileSpec) -> IndexFileResult:
+                result = IndexFileResult(file_path=spec.file_path)
+                try:
+                    result.doc_id = self.generate_index_key(
+                        vector_db=vector_db_instance_id,
+                        embedding=embedding_instance_id,
+                        x2text=x2text_instance_id,
+                        chunk_size=str(chunk_size),
+                        chunk_overlap=str(chunk_overlap),
+                        file_path=spec.file_path,
+                        file_hash=spec.file_hash,
+                        fs=fs,
+                    )
+                    self._index_file(
+                        doc_id=result.doc_id,
+                        embedding=embedding,
+                        vector_db=vector_db,
+                        vector_db_instance_id=vector_db_instance_id,
                         x2text_instance_id=x2text_instance_id,
-                        file_path=file_path,
-                        output_file_path=output_file_path,
+                        file_path=spec.file_path,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        reindex=spec.reindex,
+                        output_file_path=spec.output_file_path,
                         enable_highlight=enable_highlight,
                         usage_kwargs=usage_kwargs,
                         process_text=process_text,
                         fs=fs,
-                        tags=tags,
+                        tags=spec.tags,
+                        file_hash=spec.file_hash,
+                        x2text=x2text,
+                    )
+                except SdkError as e:
+                    self.tool.stream_log(
+                        f"Error while indexing '{spec.file_path}': {e}",
+                        level=LogLevel.ERROR,
+                    )
+                    result.error = e
+                except Exception as e:
+                    # Unexpected, but shouldn't abort the rest of the batch
+                    logger.exception(f"Unexpected error indexing '{spec.file_path}'")
+                    self.tool.stream_log(
+                        f"Error while indexing '{spec.file_path}': {e}",
+                        level=LogLevel.ERROR,
                     )
-                return doc_id
+                    result.error = e
+                return result
 
-            extracted_text = self.extract_text(
-                x2text_instance_id=x2text_instance_id,
-                file_path=file_path,
-                output_file_path=output_file_path,
-                enable_highlight=enable_highlight,
-                usage_kwargs=usage_kwargs,
-                process_text=process_text,
-                tags=tags,
-                fs=fs,
-            )
-            if not extracted_text:
-                raise IndexingError("No text available to index")
-
-            # For No-op adapters, addition of nodes to vectorDB should not happen
-            # and this has to be handled in the adapter level. But there are a
-            # few challenges considering callback manager and upstream Llama index
-            # method invocations. Hence, making this check here and returning
-            # the doc id to maintain the legacy flow of adapters.
-
-            if isinstance(
-                vector_db.get_vector_db(
-                    adapter_instance_id=vector_db_instance_id, embedding_dimension=1
-                ),
-                (NoOpCustomVectorDB),
-            ):
-                return doc_id
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(files)),
+                thread_name_prefix="index_many",
+            ) as executor:
+                # map() preserves the input order of the files
+                results = list(executor.map(_index_spec, files))
 
-            self.index_to_vector_db(
+        failed = sum(1 for result in results if result.error)
+        self.tool.stream_log(
+            f"Indexed {len(results) - failed}/{len(results)} file(s) successfully"
+        )
+        return results
+
+    def _index_file(
+        self,
+        doc_id: str,
+        embedding: Embedding,
+        vector_db: VectorDB,
+        vector_db_instance_id: str,
+        x2text_instance_id: str,
+        file_path: str,
+        chunk_size: int,
+        chunk_overlap: int,
+        reindex: bool,
+        output_file_path: str | None,
+        enable_highlight: bool,
+        usage_kwargs: dict[Any, Any],
+        process_text: Callable[[str], str] | None,
+        fs: FileStorage,
+        tags: list[str] | None,
+        file_hash: str | None = None,
+        x2text: X2Text | None = None,
+    ) -> str:
+        """Checks and indexes a single file with the passed adapter instances.
+
+        Callers own `embedding` and `vector_db` and are responsible for
+        closing the vector DB once done.
+
+        Returns:
+            str: doc_id of the indexed file
+        """
+        # Checking if document is already indexed against doc_id
+        doc_id_found = self._is_doc_indexed(
+            doc_id=doc_id,
+            vector_db=vector_db,
+            vector_db_instance_id=vector_db_instance_id,
+        )
+
+        if doc_id_found and not reindex:
+            self.tool.stream_log(f"File was indexed already under {doc_id}")
+            if output_file_path and not fs.exists(output_file_path):
+                # Added this as a workaround to handle extraction
+                # for documents uploaded twice in different projects.
+                # to be reconsidered after permanent fixes.
+                extracted_text = self.extract_text(
+                    x2text_instance_id=x2text_instance_id,
+                    file_path=file_path,
+                    output_file_path=output_file_path,
+                    enable_highlight=enable_highlight,
+                    usage_kwargs=usage_kwargs,
+                    process_text=process_text,
+                    fs=fs,
+                    tags=tags,
+                    file_hash=file_hash,
+                    x2text=x2text,
+                )
+            return doc_id
+
+        extracted_text = self.extract_text(
+            x2text_instance_id=x2text_instance_id,
+            file_path=file_path,
+            output_file_path=output_file_path,
+            enable_highlight=enable_highlight,
+            usage_kwargs=usage_kwargs,
+            process_text=process_text,
+            tags=tags,
+            fs=fs,
+            file_hash=file_hash,
+            x2text=x2text,
+        )
+        if not extracted_text:
+            raise IndexingError("No text available to index")
+
+        # For No-op adapters, addition of nodes to vectorDB should not happen
+        # and this has to be handled in the adapter level. But there are a
+        # few challenges considering callback manager and upstream Llama index
+        # method invocations. Hence, making this check here and returning
+        # the doc id to maintain the legacy flow of adapters.
+
+        if isinstance(
+            vector_db.get_vector_db(
+                adapter_instance_id=vector_db_instance_id, embedding_dimension=1
+            ),
+            (NoOpCustomVectorDB),
+        ):
+            return doc_id
+
+        try:
+            node_count = self.index_to_vector_db(
                 vector_db=vector_db,
                 embedding=embedding,
                 chunk_size=chunk_size,
@@ -354,9 +821,64 @@ class Index:
                 text_to_idx=extracted_text,
                 doc_id_found=doc_id_found,
             )
-            return doc_id
-        finally:
-            vector_db.close()
+        except Exception:
+            # Nodes of the document may be partially written or deleted
+            self._unregister(doc_id)
+            raise
+        if self._registry:
+            try:
+                self._registry.record(doc_id=doc_id, node_count=node_count)
+            except Exception as e:
+                logger.warning(f"Unable to register indexed doc_id {doc_id}: {e}")
+        return doc_id
+
+    def _unregister(self, doc_id: str) -> None:
+        if not self._registry:
+            return
+        try:
+            self._registry.remove(doc_id)
+        except Exception as e:
+            logger.warning(f"Unable to unregister doc_id {doc_id}: {e}")
+
+    def _is_doc_indexed(
+        self, doc_id: str, vector_db: VectorDB, vector_db_instance_id: str
+    ) -> bool:
+        """Checks the registry and then the vector DB for indexed nodes."""
+        if self._registry:
+            try:
+                record = self._registry.get(doc_id)
+            except Exception as e:
+                logger.warning(f"Unable to look up doc_id {doc_id} in registry: {e}")
+                record = None
+            if record:
+                self.tool.stream_log(
+                    f"Found {record.node_count} nodes for {doc_id} in index registry"
+                )
+                return True
+            if not self._verify_on_miss:
+                self.tool.stream_log(f"No nodes found for {doc_id} in index registry")
+                return False
+
+        doc_id_found = False
+        try:
+            node_count = vector_db.count_nodes(ref_doc_id=doc_id)
+            if node_count > 0:
+                doc_id_found = True
+                self.tool.stream_log(f"Found {node_count} nodes for {doc_id}")
+            else:
+                self.tool.stream_log(f"No nodes found for {doc_id}")
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error querying {vector_db_instance_id}: {e}, proceeding to index",
+                level=LogLevel.ERROR,
+            )
+        if doc_id_found and self._registry:
+            # Document was indexed before the registry was in use
+            try:
+                self._registry.record(doc_id=doc_id, node_count=node_count)
+            except Exception as e:
+                logger.warning(f"Unable to register indexed doc_id {doc_id}: {e}")
+        return doc_id_found
 
     @log_elapsed(operation="INDEXING")
     def index_to_vector_db(
@@ -368,7 +890,12 @@ class Index:
         text_to_idx: str,
         doc_id: str,
         doc_id_found: bool,
-    ):
+    ) -> int | None:
+        """Splits, embeds and writes the text of a document to the vector DB.
+
+        Returns:
+            Optional[int]: Number of nodes stored for the document, if known
+        """
         self.tool.stream_log("Indexing file...")
         full_text = [
             {
@@ -389,6 +916,34 @@ class Index:
             documents.append(document)
         self.tool.stream_log(f"Number of documents: {len(documents)}")
 
+        if doc_id_found and chunk_size != 0:
+            # Embed and write only the chunks which changed since the
+            # document was last indexed
+            try:
+                diff = vector_db.index_document_incremental(
+                    documents,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap,
+                )
+            except Exception as e:
+                self.tool.stream_log(
+                    f"Error re-indexing nodes for {doc_id}: {e}",
+                    level=LogLevel.ERROR,
+                )
+                raise IndexingError(str(e)) from e
+            if diff is not None:
+                self.tool.stream_log(
+                    f"Re-indexed {doc_id}: added {len(diff.to_add)} nodes, "
+                    f"deleted {len(diff.to_delete)} nodes and retained "
+                    f"{diff.unchanged} nodes"
+                )
+                self.tool.stream_log("File has been indexed successfully")
+                return diff.unchanged + len(diff.to_add)
+            self.tool.stream_log(
+                "Vector DB does not support incremental re-indexing, "
+                "re-indexing all nodes"
+            )
+
         if doc_id_found:
             # Delete the nodes for the doc_id
             try:
@@ -401,6 +956,7 @@ class Index:
                 )
                 raise SdkError(f"Error deleting nodes for {doc_id}: {e}") from e
 
+        node_count = None
         try:
             if chunk_size == 0:
                 parser = SentenceSplitter.from_defaults(
@@ -412,6 +968,7 @@ class Index:
                 node = nodes[0]
                 node.embedding = embedding.get_query_embedding(" ")
                 vector_db.add(doc_id, nodes=[node])
+                node_count = 1
                 self.tool.stream_log("Added node to vector db")
             else:
                 self.tool.stream_log("Adding nodes to vector db...")
@@ -425,12 +982,20 @@ class Index:
                 # Once this is in place, the overridden implementation
                 # of prefixing ids with doc_id before adding to VDB
                 # can be removed
-                vector_db.index_document(
-                    documents,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap,
-                    show_progress=True,
-                )
+                if self._pipelined:
+                    node_count = vector_db.index_document_pipelined(
+                        documents,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                    )
+                    self.tool.stream_log(f"Added {node_count} nodes to vector db")
+                else:
+                    vector_db.index_document(
+                        documents,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        show_progress=True,
+                    )
         except Exception as e:
             self.tool.stream_log(
                 f"Error adding nodes to vector db: {e}",
@@ -438,8 +1003,15 @@ class Index:
             )
             raise IndexingError(str(e)) from e
 
+        if node_count is None:
+            # Nodes aren't counted while indexing them in one call
+            try:
+                node_count = vector_db.count_nodes(ref_doc_id=doc_id)
+            except Exception as e:
+                logger.warning(f"Unable to count nodes indexed for {doc_id}: {e}")
+
         self.tool.stream_log("File has been indexed successfully")
-        return
+        return node_count
 
     def generate_index_key(
         self,
@@ -478,11 +1050,14 @@ class Index:
         # Whole adapter config is used currently even though it contains some keys
         # which might not be relevant to indexing. This is easier for now than
         # marking certain keys of the adapter config as necessary.
+        adapter_configs = ToolAdapter.get_adapter_configs(
+            self.tool, [vector_db, embedding, x2text]
+        )
         index_key = {
             "file_hash": file_hash,
-            "vector_db_config": ToolAdapter.get_adapter_config(self.tool, vector_db),
-            "embedding_config": ToolAdapter.get_adapter_config(self.tool, embedding),
-            "x2text_config": ToolAdapter.get_adapter_config(self.tool, x2text),
+            "vector_db_config": adapter_configs[vector_db],
+            "embedding_config": adapter_configs[embedding],
+            "x2text_config": adapter_configs[x2text],
             # Typed and hashed as strings since the final hash is persisted
             # and this is required to be backward compatible
             "chunk_size": str(chunk_size),
@@ -0,0 +1,150 @@
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from unstract.sdk.utils.cache_backends import (
+    CacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+    create_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    REDIS_KEY_PREFIX = "index_registry"
+
+
+@dataclass
+class IndexRecord:
+    """Details of a document indexed into a vector DB.
+
+    Attributes:
+        doc_id (str): Key generated by `Index.generate_index_key()`
+        node_count (Optional[int]): Number of nodes written, if known
+        indexed_at (float): Epoch timestamp of when the document was indexed
+    """
+
+    doc_id: str
+    node_count: int | None = None
+    indexed_at: float = 0.0
+
+
+class IndexRegistry:
+    """Registry of documents which have been indexed.
+
+    Lets `Index` answer "is this doc_id indexed?" without a round trip to the
+    vector DB. Since doc_ids hash the vector DB, embedding and extraction
+    settings, a record is only valid for the exact same configuration.
+    Records are hints; documents deleted from the vector DB outside of the
+    SDK need to be removed from the registry as well.
+
+    Records are kept in a `CacheBackend`, see `SQLiteIndexRegistry` and
+    `RedisIndexRegistry` for the ones persisted across runs.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        """Creates a registry on top of a store.
+
+        Args:
+            backend (CacheBackend): Store for the records
+        """
+        self._backend = backend
+
+    def get(self, doc_id: str) -> IndexRecord | None:
+        """Fetches the record for a doc_id.
+
+        Args:
+            doc_id (str): Key of the indexed document
+
+        Returns:
+            Optional[IndexRecord]: Record if the document is registered
+        """
+        value = self._backend.get(doc_id)
+        if value is None:
+            return None
+        return IndexRecord(**json.loads(value))
+
+    def record(self, doc_id: str, node_count: int | None = None) -> IndexRecord:
+        """Registers a document as indexed, replacing any existing record.
+
+        Args:
+            doc_id (str): Key of the indexed document
+            node_count (Optional[int], optional): Number of nodes written.
+                Defaults to None.
+
+        Returns:
+            IndexRecord: The stored record
+        """
+        index_record = IndexRecord(
+            doc_id=doc_id, node_count=node_count, indexed_at=time.time()
+        )
+        self._backend.set(doc_id, json.dumps(asdict(index_record)).encode())
+        return index_record
+
+    def remove(self, doc_id: str) -> None:
+        """Removes the record for a doc_id, if present.
+
+        Args:
+            doc_id (str): Key of the indexed document
+        """
+        self._backend.delete(doc_id)
+
+    def contains(self, doc_id: str) -> bool:
+        return self.get(doc_id) is not None
+
+    def close(self) -> None:
+        self._backend.close()
+
+
+class SQLiteIndexRegistry(IndexRegistry):
+    """Registry persisted to a SQLite database on local disk.
+
+    Safe to share across threads of a process and across processes on the
+    same host.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """Creates / opens the registry database.
+
+        Args:
+            db_path (str): Path to the SQLite database file. Parent
+                directories are created if needed.
+        """
+        super().__init__(SQLiteCacheBackend(db_path))
+
+
+class RedisIndexRegistry(IndexRegistry):
+    """Registry stored in Redis, shared by all workers using it."""
+
+    def __init__(
+        self,
+        client: Any,
+        key_prefix: str = Constants.REDIS_KEY_PREFIX,
+        ttl: int | None = None,
+    ) -> None:
+        """Creates a registry on top of a Redis client.
+
+        Args:
+            client (Any): Redis client, see `RedisCacheBackend`
+            key_prefix (str, optional): Prefix for the keys holding records.
+                Defaults to "index_registry".
+            ttl (Optional[int], optional): Expiry of records in seconds, never
+                expires if None. Defaults to None.
+        """
+        super().__init__(RedisCacheBackend(client=client, key_prefix=key_prefix, ttl=ttl))
+
+    @classmethod
+    def from_env(
+        cls,
+        key_prefix: str = Constants.REDIS_KEY_PREFIX,
+        ttl: int | None = None,
+    ) -> "RedisIndexRegistry":
+        """Creates a registry for the Redis configured in the environment.
+
+        See `create_redis_client()`.
+        """
+        return cls(client=create_redis_client(), key_prefix=key_prefix, ttl=ttl)
@@ -1,11 +1,14 @@
+import json
 import logging
 import os
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from deprecated import deprecated
 from llama_index.core.base.llms.types import CompletionResponseGen
+from llama_index.core.callbacks import CBEventType, EventPayload
 from llama_index.core.llms import LLM as LlamaIndexLLM
 from llama_index.core.llms import CompletionResponse
 from openai import APIError as OpenAIAPIError
@@ -15,24 +18,47 @@ from unstract.sdk.adapters.constants import Common
 from unstract.sdk.adapters.llm import adapters
 from unstract.sdk.adapters.llm.exceptions import parse_llm_err
 from unstract.sdk.adapters.llm.llm_adapter import LLMAdapter
+from unstract.sdk.audit import Audit
 from unstract.sdk.constants import LogLevel, ToolEnv
 from unstract.sdk.exceptions import LLMError, RateLimitError, SdkError
 from unstract.sdk.helper import SdkHelper
 from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.utils import ToolUtils
+from unstract.sdk.utils.cache_backends import CacheBackend, CacheStats
 from unstract.sdk.utils.callback_manager import CallbackManager
 from unstract.sdk.utils.common_utils import capture_metrics
+from unstract.sdk.utils.completion_cache import CompletionCache
+from unstract.sdk.utils.json_extraction import (
+    IncrementalJsonParser,
+    PartialJson,
+)
+from unstract.sdk.utils.json_extraction import extract_json as extract_json_text
+from unstract.sdk.utils.rate_limiter import RateLimiter, estimate_tokens
+from unstract.sdk.utils.token_counter import TokenCounter
+from unstract.sdk.utils.tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
 
 class LLM:
-    """Interface to handle all LLM interactions."""
+    """Interface to handle all LLM interactions.
 
+    Completions can optionally be cached, see `CompletionCache`. Only
+    completions sampled at a temperature of 0 are cached. A cache hit is
+    reported with the token counts of the cached response and flagged as
+    cached, so that cost reports can tell it apart from provider usage.
+    """
+
+    # Deprecated, backtracks heavily on long text. Use `extract_json` from
+    # `unstract.sdk.utils.json_extraction` instead.
     json_regex = re.compile(r"\[(?:.|\n)*\]|\{(?:.|\n)*\}")
     llm_adapters = adapters
     MAX_TOKENS = 1024 * 4
     RESPONSE = "response"
     JSON_SELECTION_MARKER = os.environ.get("JSON_SELECTION_MARKER", "§§§")
+    CACHE_HITS = "cache_hits"
+    CACHE_MISSES = "cache_misses"
+    DEFAULT_MAX_CONCURRENCY = 8
 
     def __init__(
         self,
@@ -40,6 +66,7 @@ class LLM:
         adapter_instance_id: str | None = None,
         usage_kwargs: dict[Any, Any] = {},
         capture_metrics: bool = False,
+        cache_backend: CacheBackend | None = None,
     ):
         """Creates an instance of this LLM class.
 
@@ -49,6 +76,9 @@ class LLM:
                 Unstract. Defaults to None.
             usage_kwargs (dict[Any, Any], optional): Dict to capture token usage with
                 callbacks. Defaults to {}.
+            cache_backend (Optional[CacheBackend], optional): Store of previous
+                completions, looked up before calling the provider. Caching is
+                disabled if None. Defaults to None.
         """
         self._tool = tool
         self._adapter_instance_id = adapter_instance_id
@@ -58,6 +88,11 @@ class LLM:
         self._run_id = usage_kwargs.get("run_id")
         self._usage_reason = usage_kwargs.get("llm_usage_reason")
         self._metrics = {}
+        self._cache_backend = cache_backend
+        self._completion_cache: CompletionCache | None = None
+        self._config_hash: str | None = None
+        self._platform_api_key: str | None = None
+        self._rate_limiter: RateLimiter | None = None
         self._initialise()
 
     def _initialise(self):
@@ -67,11 +102,18 @@ class LLM:
 
             if not SdkHelper.is_public_adapter(adapter_id=self._adapter_instance_id):
                 platform_api_key = self._tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY)
+                self._platform_api_key = platform_api_key
                 CallbackManager.set_callback(
                     platform_api_key=platform_api_key,
                     model=self._llm_instance,
                     kwargs=self._usage_kwargs,
                 )
+            if self._cache_backend is not None:
+                self._completion_cache = CompletionCache(
+                    backend=self._cache_backend,
+                    config_hash=self._config_hash,
+                    model=self._llm_instance.metadata.model_name,
+                )
 
     @capture_metrics
     def complete(
@@ -99,36 +141,202 @@ class LLM:
                 any processed output, and the captured metrics (if applicable).
         """
         try:
-            response: CompletionResponse = self._llm_instance.complete(prompt, **kwargs)
-            process_text_output = {}
-            if extract_json:
-                response_text = response.text
-                start = response_text.find(self.JSON_SELECTION_MARKER)
-                if start != -1:
-                    response_text = response_text[
-                        start + len(self.JSON_SELECTION_MARKER) :
-                    ].lstrip()
-                end = response_text.rfind(self.JSON_SELECTION_MARKER)
-                if end != -1:
-                    response_text = response_text[:end].rstrip()
-                match = LLM.json_regex.search(response_text)
-                if match:
-                    response.text = match.group(0)
-            if process_text:
-                try:
-                    process_text_output = process_text(response, extract_json)
-                    if not isinstance(process_text_output, dict):
-                        process_text_output = {}
-                except Exception as e:
-                    logger.error(f"Error occurred inside function 'process_text': {e}")
-                    process_text_output = {}
-            response_data = {LLM.RESPONSE: response, **process_text_output}
-            return response_data
+            response: CompletionResponse = self._complete(prompt, **kwargs)
+            return self._process_response(response, extract_json, process_text)
         except Exception as e:
             raise parse_llm_err(e, self._llm_adapter_class) from e
 
+    @capture_metrics
+    async def acomplete(
+        self,
+        prompt: str,
+        extract_json: bool = True,
+        process_text: Callable[[str], str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Async version of `complete()`.
+
+        Args:
+            prompt (str): The input text prompt for generating the completion.
+            extract_json (bool, optional): If set to True, JSON content is
+                extracted from the response text. Defaults to True.
+            process_text (Optional[Callable[[str], str]], optional): A callable that
+                processes the generated text and extracts specific information.
+                Defaults to None.
+            **kwargs (Any): Additional arguments passed to the completion function.
+
+        Returns:
+            dict[str, Any]: A dictionary containing the result of the completion
+                and any processed output.
+        """
+        try:
+            response: CompletionResponse = await self._acomplete(prompt, **kwargs)
+            return self._process_response(response, extract_json, process_text)
+        except Exception as e:
+            raise parse_llm_err(e, self._llm_adapter_class) from e
+
+    def complete_many(
+        self,
+        prompts: Sequence[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        extract_json: bool = True,
+        process_text: Callable[[str], str] | None = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any] | SdkError]:
+        """Completes several prompts concurrently.
+
+        Each prompt goes through `complete()` on a thread pool, so the
+        completions overlap while waiting on the provider. A failed prompt
+        doesn't affect the others, its error is returned in its place.
+
+        Args:
+            prompts (Sequence[str]): Prompts to complete
+            max_concurrency (int, optional): Maximum number of completions in
+                flight. Defaults to 8.
+            extract_json (bool, optional): Passed to `complete()` for each
+                prompt. Defaults to True.
+            process_text (Optional[Callable[[str], str]], optional): Passed to
+                `complete()` for each prompt. Defaults to None.
+            **kwargs (Any): Additional arguments passed to the completion function.
+
+        Returns:
+            list[Union[dict[str, Any], SdkError]]: Result of `complete()` for
+                each prompt in order, or the error it raised
+        """
+        if not prompts:
+            return []
+
+        def _complete(prompt: str) -> dict[str, Any] | SdkError:
+            try:
+                return self.complete(
+                    prompt, extract_json=extract_json, process_text=process_text, **kwargs
+                )
+            except SdkError as e:
+                logger.warning(f"Completion failed for a prompt: {e}")
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=max(min(max_concurrency, len(prompts)), 1),
+            thread_name_prefix="llm",
+        ) as executor:
+            return list(executor.map(_complete, prompts))
+
+    def _process_response(
+        self,
+        response: CompletionResponse,
+        extract_json: bool,
+        process_text: Callable[[str], str] | None,
+    ) -> dict[str, Any]:
+        """Post-processes a completion into the result of `complete()`."""
+        process_text_output = {}
+        if extract_json:
+            json_text = extract_json_text(response.text, self.JSON_SELECTION_MARKER)
+            if json_text is not None:
+                response.text = json_text
+        if process_text:
+            try:
+                process_text_output = process_text(response, extract_json)
+                if not isinstance(process_text_output, dict):
+                    process_text_output = {}
+            except Exception as e:
+                logger.error(f"Error occurred inside function 'process_text': {e}")
+                process_text_output = {}
+        response_data = {LLM.RESPONSE: response, **process_text_output}
+        return response_data
+
+    def _get_cached(
+        self, prompt: str, **kwargs: Any
+    ) -> tuple[str | None, CompletionResponse | None]:
+        """Looks up the completion cache, if enabled for the request.
+
+        Returns:
+            tuple[Optional[str], Optional[CompletionResponse]]: Cache key, None
+                if the completion is not to be cached, and the cached response,
+                if any
+        """
+        if self._completion_cache is None or not self._is_deterministic(**kwargs):
+            return None, None
+        key = self._completion_cache.get_key(prompt, **kwargs)
+        response = self._completion_cache.get(key)
+        if response is not None:
+            logger.debug("Serving completion from cache")
+            self._record_cache_hit(prompt, response)
+        return key, response
+
+    def _is_deterministic(self, **kwargs: Any) -> bool:
+        """Checks if completions are sampled at a temperature of 0.
+
+        Adapters set the temperature on the model rather than in their config,
+        so it is not part of the cache key. An unknown temperature is treated
+        as non-zero.
+        """
+        temperature = kwargs.get(
+            "temperature", getattr(self._llm_instance, "temperature", None)
+        )
+        return temperature == 0
+
+    def _record_cache_hit(self, prompt: str, response: CompletionResponse) -> None:
+        """Reports the usage of the cached completion, flagged as cached."""
+        if not self._platform_api_key:
+            return
+        token_counter = TokenCounter.get_llm_token_counts(
+            {EventPayload.PROMPT: prompt, EventPayload.COMPLETION: response}
+        )
+        Audit().push_usage_data(
+            platform_api_key=self._platform_api_key,
+            token_counter=token_counter,
+            model_name=self._llm_instance.metadata.model_name,
+            event_type=CBEventType.LLM,
+            kwargs=self._usage_kwargs,
+            cached=True,
+        )
+
+    def _complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        """Completes the prompt, serving it from the cache when enabled.
+
+        Waits for the adapter's rate limit, if any, before calling the provider.
+        """
+        key, response = self._get_cached(prompt, **kwargs)
+        if response is not None:
+            return response
+        if self._rate_limiter:
+            self._rate_limiter.acquire(estimate_tokens(prompt))
+        response = self._llm_instance.complete(prompt, **kwargs)
+        if key is not None:
+            self._completion_cache.put(key, response)
+        return response
+
+    async def _acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        """Async version of `_complete()`."""
+        key, response = self._get_cached(prompt, **kwargs)
+        if response is not None:
+            return response
+        if self._rate_limiter:
+            await self._rate_limiter.aacquire(estimate_tokens(prompt))
+        response = await self._llm_instance.acomplete(prompt, **kwargs)
+        if key is not None:
+            self._completion_cache.put(key, response)
+        return response
+
     def get_metrics(self):
-        return self._metrics
+        if self._completion_cache is None:
+            return self._metrics
+        stats = self._completion_cache.get_stats()
+        return {
+            **self._metrics,
+            LLM.CACHE_HITS: stats.hits,
+            LLM.CACHE_MISSES: stats.misses,
+        }
+
+    def get_cache_stats(self) -> CacheStats | None:
+        """Gets the hits and misses of the completion cache.
+
+        Returns:
+            Optional[CacheStats]: Counters, None if caching is disabled
+        """
+        if self._completion_cache is None:
+            return None
+        return self._completion_cache.get_stats()
 
     def get_usage_reason(self):
         return self._usage_reason
@@ -139,6 +347,8 @@ class LLM:
         **kwargs: Any,
     ) -> CompletionResponseGen:
         try:
+            if self._rate_limiter:
+                self._rate_limiter.acquire(estimate_tokens(prompt))
             response: CompletionResponseGen = self._llm_instance.stream_complete(
                 prompt, **kwargs
             )
@@ -146,6 +356,88 @@ class LLM:
         except Exception as e:
             raise parse_llm_err(e, self._llm_adapter_class) from e
 
+    def stream_complete_json(
+        self,
+        prompt: str,
+        stop_on_complete: bool = True,
+        **kwargs: Any,
+    ) -> Generator[PartialJson, None, None]:
+        """Streams a completion, parsing the JSON in it as it arrives.
+
+        A result is yielded whenever a member of the JSON value completes, so
+        fields can be shown before the completion ends. Once the top-level
+        value closes, the stream is closed to cancel the rest of the
+        generation, and usage is reported for what was streamed.
+
+        Args:
+            prompt (str): The input text prompt for generating the completion.
+            stop_on_complete (bool, optional): Whether to stop the stream once
+                the JSON value closes. Defaults to True.
+            **kwargs (Any): Additional arguments passed to the completion function.
+
+        Yields:
+            PartialJson: JSON parsed so far. The last result has the whole
+                value, or what could be extracted if the value never closed.
+        """
+        try:
+            if self._rate_limiter:
+                self._rate_limiter.acquire(estimate_tokens(prompt))
+            response_gen = self._llm_instance.stream_complete(prompt, **kwargs)
+            parser = IncrementalJsonParser()
+            try:
+                for response in response_gen:
+                    # Once complete, the rest of the stream is only collected
+                    changed = parser.feed(response.delta or "")
+                    if parser.complete and stop_on_complete:
+                        break
+                    if changed and not parser.complete:
+                        yield parser.partial()
+            finally:
+                response_gen.close()
+            if parser.complete and stop_on_complete:
+                self._report_stream_usage(prompt, parser.text)
+            yield self._get_final_json(parser)
+        except Exception as e:
+            raise parse_llm_err(e, self._llm_adapter_class) from e
+
+    def _get_final_json(self, parser: IncrementalJsonParser) -> PartialJson:
+        result = parser.partial()
+        if parser.complete:
+            return result
+        # The value never closed, fall back to what complete() would extract
+        result.json_text = extract_json_text(parser.text, self.JSON_SELECTION_MARKER)
+        result.value = None
+        if result.json_text is not None:
+            try:
+                result.value = json.loads(result.json_text)
+                result.complete = True
+            except ValueError:
+                pass
+        return result
+
+    def _report_stream_usage(self, prompt: str, text: str) -> None:
+        """Ends the LLM event of a stream closed early.
+
+        llama-index only reports the error when a stream is closed, so usage
+        of the text streamed so far would otherwise be lost. Providers only
+        send usage in the last chunk, if at all, so the tokens are counted
+        locally.
+        """
+        model_name = self._llm_instance.metadata.model_name
+        usage = {
+            "prompt_tokens": count_tokens(prompt, model_name),
+            "completion_tokens": count_tokens(text, model_name),
+        }
+        self._llm_instance.callback_manager.on_event_end(
+            CBEventType.LLM,
+            payload={
+                EventPayload.PROMPT: prompt,
+                EventPayload.COMPLETION: CompletionResponse(
+                    text=text, raw={"usage": usage}
+                ),
+            },
+        )
+
     def _get_llm(self, adapter_instance_id: str) -> LlamaIndexLLM:
         """Returns the LLM object for the tool.
 
@@ -160,6 +452,9 @@ class LLM:
             llm_config_data = ToolAdapter.get_adapter_config(
                 self._tool, self._adapter_instance_id
             )
+            self._config_hash = ToolUtils.hash_str(
+                json.dumps(llm_config_data, sort_keys=True)
+            )
 
             llm_adapter_id = llm_config_data.get(Common.ADAPTER_ID)
             if llm_adapter_id not in self.llm_adapters:
@@ -169,6 +464,9 @@ class LLM:
                 Common.ADAPTER
             ]
             llm_metadata = llm_config_data.get(Common.ADAPTER_METADATA)
+            self._rate_limiter = RateLimiter.from_adapter(
+                self._adapter_instance_id, llm_metadata
+            )
             self._llm_adapter_class: LLMAdapter = llm_adapter(llm_metadata)
             self._usage_kwargs["provider"] = self._llm_adapter_class.get_provider()
             llm_instance: LLM = self._llm_adapter_class.get_llm_instance()
@@ -258,9 +556,9 @@ class LLM:
 
         try:
             response: CompletionResponse = llm.complete(prompt, **new_kwargs)
-            match = cls.json_regex.search(response.text)
-            if match:
-                response.text = match.group(0)
+            json_text = extract_json_text(response.text)
+            if json_text is not None:
+                response.text = json_text
             return {"response": response}
         # TODO: Handle for all LLM providers
         except OpenAIAPIError as e:
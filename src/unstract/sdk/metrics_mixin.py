@@ -1,10 +1,9 @@
 import logging
-import os
 import time
 import uuid
 from typing import Any
 
-from redis import StrictRedis
+from unstract.sdk.utils.cache_backends import create_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,14 +22,7 @@ class MetricsMixin:
         self.redis_client = None
         try:
             # Initialize Redis client
-            self.redis_client = StrictRedis(
-                host=os.getenv("REDIS_HOST", "unstract-redis"),
-                port=int(os.getenv("REDIS_PORT", 6379)),
-                username=os.getenv("REDIS_USER", "default"),
-                password=os.getenv("REDIS_PASSWORD", ""),
-                db=1,
-                decode_responses=True,
-            )
+            self.redis_client = create_redis_client(db=1, decode_responses=True)
         except Exception as e:
             logger.error("Failed to initialize Redis client" f" for run_id={run_id}: {e}")
 
@@ -1,8 +1,13 @@
 import logging
+import os
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 import requests
-from requests import ConnectionError, RequestException, Response
+from requests import ConnectionError, PreparedRequest, RequestException, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from unstract.sdk.constants import (
     LogLevel,
     MimeType,
@@ -17,6 +22,144 @@ from unstract.sdk.utils.retry_utils import retry_platform_service_call
 logger = logging.getLogger(__name__)
 
 
+class HttpService:
+    """Services talked to over HTTP, named as the prefix of their settings."""
+
+    PLATFORM = "PLATFORM_SERVICE"
+    PROMPT = "PROMPT_SERVICE"
+
+
+@dataclass
+class HttpSessionConfig:
+    """Settings of the connection pool and requests of an HTTP session.
+
+    Attributes:
+        pool_connections (int): Number of hosts connections are pooled for
+        pool_maxsize (int): Connections kept alive per host
+        connect_timeout (float): Seconds to wait for a connection
+        read_timeout (Optional[float]): Seconds to wait for a response, None
+            to wait indefinitely
+        connect_retries (int): Retries of failed connection attempts, which
+            are safe for any method as nothing reached the server
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    connect_timeout: float = 10.0
+    read_timeout: float | None = 60.0
+    connect_retries: int = 2
+
+    @classmethod
+    def from_env(cls, service: str) -> "HttpSessionConfig":
+        """Reads the settings of a service from the environment.
+
+        Environment variables (using the service as prefix):
+            {service}_POOL_CONNECTIONS: Hosts to pool connections for
+                (default: 10)
+            {service}_POOL_MAXSIZE: Connections kept alive per host (default: 10)
+            {service}_CONNECT_TIMEOUT: Connect timeout in seconds (default: 10)
+            {service}_READ_TIMEOUT: Read timeout in seconds, 0 for none. Defaults
+                to 60, and to none for the prompt service which waits on LLMs
+            {service}_CONNECT_RETRIES: Retries of failed connection attempts
+                (default: 2)
+
+        Args:
+            service (str): Service, see `HttpService`
+
+        Returns:
+            HttpSessionConfig: Settings of the service
+        """
+        default_read_timeout = "0" if service == HttpService.PROMPT else "60"
+        read_timeout = float(
+            os.environ.get(f"{service}_READ_TIMEOUT", default_read_timeout)
+        )
+        return cls(
+            pool_connections=int(os.environ.get(f"{service}_POOL_CONNECTIONS", "10")),
+            pool_maxsize=int(os.environ.get(f"{service}_POOL_MAXSIZE", "10")),
+            connect_timeout=float(os.environ.get(f"{service}_CONNECT_TIMEOUT", "10")),
+            read_timeout=read_timeout or None,
+            connect_retries=int(os.environ.get(f"{service}_CONNECT_RETRIES", "2")),
+        )
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """Applies default timeouts to requests which don't set their own."""
+
+    def __init__(self, timeout: tuple[float, float | None], **kwargs: Any) -> None:
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+_sessions: dict[tuple[str, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def create_http_session(config: HttpSessionConfig) -> requests.Session:
+    """Creates a session which keeps connections alive in a pool.
+
+    Args:
+        config (HttpSessionConfig): Settings of the pool and requests
+
+    Returns:
+        requests.Session: Session for HTTP and HTTPS requests
+    """
+    adapter = _TimeoutHTTPAdapter(
+        timeout=(config.connect_timeout, config.read_timeout),
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        max_retries=Retry(
+            total=config.connect_retries,
+            connect=config.connect_retries,
+            read=0,
+            other=0,
+            backoff_factor=0.1,
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session(service: str = HttpService.PLATFORM) -> requests.Session:
+    """Gets the session shared by the clients of a service in this process.
+
+    Reusing the session reuses its connections, saving a TCP connection and
+    TLS handshake per call. Sessions are created per process, since pooled
+    connections can't be shared with forked processes.
+
+    Args:
+        service (str, optional): Service, see `HttpService`. Defaults to the
+            platform service.
+
+    Returns:
+        requests.Session: Session configured from the environment, see
+            `HttpSessionConfig.from_env()`
+    """
+    key = (service, os.getpid())
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = create_http_session(HttpSessionConfig.from_env(service))
+        return _sessions[key]
+
+
+def close_http_sessions() -> None:
+    """Closes the shared sessions along with their pooled connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
 class PlatformBase:
     """Base class to handle interactions with Unstract's platform service.
 
@@ -129,12 +272,13 @@ class PlatformHelper(PlatformBase):
         req_headers = self._get_headers(headers)
         response: Response = Response()
         try:
+            session = get_http_session()
             if method.upper() == "POST":
-                response = requests.post(
+                response = session.post(
                     url=url, json=payload, params=params, headers=req_headers
                 )
             elif method.upper() == "GET":
-                response = requests.get(url=url, params=params, headers=req_headers)
+                response = session.get(url=url, params=params, headers=req_headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -0,0 +1,213 @@
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any
+
+# Only depends on the standard library, so that it can be installed before
+# the rest of the SDK is imported
+
+
+class Constants:
+    # Set to "true" to profile imports and startup of a tool
+    ENV = "STARTUP_PROFILING"
+    # Number of slowest imports reported
+    TOP_IMPORTS = 30
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's loader to time its execution."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        with self._profiler.time_import(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str) -> Any:
+        # Such as get_resource_reader() or get_source()
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Finds modules through the other finders, timing their loading."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+        self._finding = threading.local()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler)
+                return spec
+            return None
+        finally:
+            self._finding.active = False
+
+
+class StartupProfiler:
+    """Records the time spent importing modules and in startup phases.
+
+    Import times are recorded per module, inclusive of the modules it
+    imports (cumulative) and exclusive of them (self), like
+    `python -X importtime`.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Creates a profiler, whose timings start now.
+
+        Args:
+            clock (Callable[[], float], optional): Clock in seconds. Defaults
+                to time.perf_counter.
+        """
+        self._clock = clock
+        self._started_at = clock()
+        self._lock = threading.Lock()
+        self._import_stack = threading.local()
+        # Cumulative and self seconds of each imported module
+        self.imports: dict[str, tuple[float, float]] = {}
+        # Name, start since the profiler started and duration of each phase
+        self.phases: list[tuple[str, float, float]] = []
+        self._finder: _ImportTimer | None = None
+
+    def install(self) -> None:
+        """Starts timing the modules imported from now on."""
+        if self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextmanager
+    def time_import(self, name: str) -> Iterator[None]:
+        stack: list[float] = self._import_stack.__dict__.setdefault("children", [])
+        stack.append(0.0)
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self.imports[name] = (elapsed, elapsed - children)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times a phase of the startup, such as validating settings."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            end = self._clock()
+            with self._lock:
+                self.phases.append((name, start - self._started_at, end - start))
+
+    def report(self, top: int = Constants.TOP_IMPORTS) -> dict[str, Any]:
+        """Summarises the timings.
+
+        Args:
+            top (int, optional): Number of slowest imports to list, by
+                cumulative time. Defaults to 30.
+
+        Returns:
+            dict[str, Any]: Seconds elapsed since the profiler started, spent
+                importing and per phase, with the slowest imports and the
+                import time per top-level package
+        """
+        with self._lock:
+            imports = dict(self.imports)
+            phases = list(self.phases)
+        packages: dict[str, float] = {}
+        for name, (_, self_seconds) in imports.items():
+            package = name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + self_seconds
+        slowest = sorted(imports.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            "elapsed": round(self._clock() - self._started_at, 4),
+            "import_total": round(sum(seconds for _, seconds in imports.values()), 4),
+            "modules_imported": len(imports),
+            "packages": {
+                package: round(seconds, 4)
+                for package, seconds in sorted(
+                    packages.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            "imports": [
+                {"module": name, "cumulative": round(cum, 4), "self": round(own, 4)}
+                for name, (cum, own) in slowest[:top]
+            ],
+            "phases": [
+                {"phase": name, "start": round(start, 4), "duration": round(duration, 4)}
+                for name, start, duration in phases
+            ],
+        }
+
+
+_profiler: StartupProfiler | None = None
+
+
+def is_enabled_by_env() -> bool:
+    return os.environ.get(Constants.ENV, "").lower() in ("1", "true", "yes")
+
+
+def enable(time_imports: bool = True) -> StartupProfiler:
+    """Enables the process-wide profiler, if not already.
+
+    Args:
+        time_imports (bool, optional): Whether to time the modules imported
+            from now on. Defaults to True.
+
+    Returns:
+        StartupProfiler: The process-wide profiler
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    if time_imports:
+        _profiler.install()
+    return _profiler
+
+
+def get_profiler() -> StartupProfiler | None:
+    """Gets the process-wide profiler, None if profiling isn't enabled."""
+    return _profiler
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Times a startup phase with the process-wide profiler, if enabled."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name):
+        yield
@@ -1,9 +1,11 @@
+import asyncio
 import functools
+import inspect
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, ParamSpec, TypeVar
 
-import requests
+import httpx
 from deprecated import deprecated
 from requests import ConnectionError, RequestException, Response
 from unstract.sdk.constants import (
@@ -12,7 +14,12 @@ from unstract.sdk.constants import (
     ToolEnv,
 )
 from unstract.sdk.helper import SdkHelper
-from unstract.sdk.platform import PlatformHelper
+from unstract.sdk.platform import (
+    HttpService,
+    HttpSessionConfig,
+    PlatformHelper,
+    get_http_session,
+)
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.utils.common_utils import log_elapsed
 from unstract.sdk.utils.retry_utils import retry_prompt_service_call
@@ -23,9 +30,35 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def _handle_service_error(tool: BaseTool, context: str, e: Exception) -> None:
+    """Streams an error from the prompt service and exits.
+
+    Handles the errors of `requests` and of `httpx`, used by the async client.
+    """
+    if isinstance(e, ConnectionError | httpx.ConnectError | httpx.ConnectTimeout):
+        msg = f"Error while {context}. Unable to connect to prompt service."
+        logger.error(f"{msg}\n{e}")
+        tool.stream_error_and_exit(msg, e)
+        return
+    error_message = str(e)
+    response = getattr(e, "response", None)
+    if response is not None:
+        if (
+            MimeType.JSON in response.headers.get("Content-Type", "").lower()
+            and "error" in response.json()
+        ):
+            error_message = response.json()["error"]
+        elif response.text:
+            error_message = response.text
+    msg = f"Error while {context}. {error_message}"
+    tool.stream_error_and_exit(msg, e)
+
+
 def handle_service_exceptions(context: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator to handle exceptions in PromptTool service calls.
 
+    Also decorates the coroutines of `AsyncPromptTool`.
+
     Args:
         context (str): Context string describing where the error occurred
     Returns:
@@ -33,35 +66,31 @@ def handle_service_exceptions(context: str) -> Callable[[Callable[P, R]], Callab
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                try:
+                    return await func(*args, **kwargs)
+                except (RequestException, httpx.HTTPError) as e:
+                    _handle_service_error(args[0].tool, context, e)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             try:
                 return func(*args, **kwargs)
-            except ConnectionError as e:
-                msg = f"Error while {context}. Unable to connect to prompt service."
-                logger.error(f"{msg}\n{e}")
-                args[0].tool.stream_error_and_exit(msg, e)
             except RequestException as e:
-                error_message = str(e)
-                response = getattr(e, "response", None)
-                if response is not None:
-                    if (
-                        MimeType.JSON in response.headers.get("Content-Type", "").lower()
-                        and "error" in response.json()
-                    ):
-                        error_message = response.json()["error"]
-                    elif response.text:
-                        error_message = response.text
-                msg = f"Error while {context}. {error_message}"
-                args[0].tool.stream_error_and_exit(msg, e)
+                _handle_service_error(args[0].tool, context, e)
 
         return wrapper
 
     return decorator
 
 
-class PromptTool:
-    """Class to handle prompt service methods for Unstract Tools."""
+class _PromptServiceClient:
+    """Connection details of the prompt service shared by its clients."""
 
     def __init__(
         self,
@@ -86,6 +115,27 @@ class PromptTool:
         if not is_public_call:
             self.bearer_token = tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY)
 
+    def _get_headers(self, headers: dict[str, str] | None = None) -> dict[str, str]:
+        """Get default headers for requests.
+
+        Returns:
+            dict[str, str]: Default headers including request ID and authorization
+        """
+        request_headers = {RequestHeader.REQUEST_ID: self.request_id}
+        if self.is_public_call:
+            return request_headers
+        request_headers.update(
+            {RequestHeader.AUTHORIZATION: f"Bearer {self.bearer_token}"}
+        )
+
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+
+class PromptTool(_PromptServiceClient):
+    """Class to handle prompt service methods for Unstract Tools."""
+
     @log_elapsed(operation="ANSWER_PROMPTS")
     @handle_service_exceptions("answering prompt(s)")
     def answer_prompt(
@@ -169,23 +219,6 @@ class PromptTool:
             headers=headers,
         )
 
-    def _get_headers(self, headers: dict[str, str] | None = None) -> dict[str, str]:
-        """Get default headers for requests.
-
-        Returns:
-            dict[str, str]: Default headers including request ID and authorization
-        """
-        request_headers = {RequestHeader.REQUEST_ID: self.request_id}
-        if self.is_public_call:
-            return request_headers
-        request_headers.update(
-            {RequestHeader.AUTHORIZATION: f"Bearer {self.bearer_token}"}
-        )
-
-        if headers:
-            request_headers.update(headers)
-        return request_headers
-
     @retry_prompt_service_call
     def _call_service(
         self,
@@ -220,12 +253,13 @@ class PromptTool:
         url: str = f"{self.base_url}/{url_path}"
         req_headers = self._get_headers(headers)
         response: Response = Response()
+        session = get_http_session(HttpService.PROMPT)
         if method.upper() == "POST":
-            response = requests.post(
+            response = session.post(
                 url=url, json=payload, params=params, headers=req_headers
             )
         elif method.upper() == "GET":
-            response = requests.get(url=url, params=params, headers=req_headers)
+            response = session.get(url=url, params=params, headers=req_headers)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -256,3 +290,210 @@ class PromptTool:
         return platform_helper.get_prompt_studio_tool(
             prompt_registry_id=prompt_registry_id
         )
+
+
+class AsyncPromptTool(_PromptServiceClient):
+    """Async client of the prompt service, to make many calls concurrently.
+
+    Calls share a pool of connections, and are made from a single event loop
+    instead of a thread each. Errors are handled like in `PromptTool`. Close
+    the client once done, or use it as an async context manager.
+
+    Example:
+        async with AsyncPromptTool(tool, host, port) as prompt_tool:
+            answers = await prompt_tool.gather(
+                *(prompt_tool.answer_prompt(payload) for payload in payloads)
+            )
+    """
+
+    def __init__(
+        self,
+        tool: BaseTool,
+        prompt_host: str,
+        prompt_port: str,
+        is_public_call: bool = False,
+        request_id: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Creates a client with its own pool of connections.
+
+        The pool is configured like the session of `PromptTool`, see
+        `HttpSessionConfig.from_env()`.
+
+        Args:
+            tool (AbstractTool): Instance of AbstractTool
+            prompt_host (str): Host of platform service
+            prompt_port (str): Port of platform service
+            is_public_call (bool): Whether the call is public. Defaults to False
+            request_id (Optional[str], optional): Request ID for the service.
+                Defaults to None.
+            max_concurrency (Optional[int], optional): Maximum calls in flight
+                with `gather()`. Defaults to None, for the pool's maximum
+                connections per host.
+        """
+        super().__init__(
+            tool=tool,
+            prompt_host=prompt_host,
+            prompt_port=prompt_port,
+            is_public_call=is_public_call,
+            request_id=request_id,
+        )
+        config = HttpSessionConfig.from_env(HttpService.PROMPT)
+        self.max_concurrency = max_concurrency or config.pool_maxsize
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=config.pool_maxsize,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=config.connect_retries),
+        )
+
+    async def __aenter__(self) -> "AsyncPromptTool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections."""
+        await self._client.aclose()
+
+    async def gather(self, *calls: Awaitable[R]) -> list[R]:
+        """Awaits calls concurrently, at most `max_concurrency` at a time.
+
+        Args:
+            calls (Awaitable[R]): Calls to the prompt service, such as
+                `answer_prompt()`, which aren't started yet
+
+        Returns:
+            list[R]: Result of each call, in the same order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(call: Awaitable[R]) -> R:
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(_bounded(call) for call in calls))
+
+    @log_elapsed(operation="ANSWER_PROMPTS")
+    @handle_service_exceptions("answering prompt(s)")
+    async def answer_prompt(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        url_path = "answer-prompt"
+        if self.is_public_call:
+            url_path = "answer-prompt-public"
+        return await self._call_service(
+            url_path=url_path, payload=payload, params=params, headers=headers
+        )
+
+    @log_elapsed(operation="INDEX")
+    @handle_service_exceptions("indexing")
+    async def index(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> str:
+        url_path = "index"
+        if self.is_public_call:
+            url_path = "index-public"
+        prompt_service_response = await self._call_service(
+            url_path=url_path,
+            payload=payload,
+            params=params,
+            headers=headers,
+        )
+        return prompt_service_response.get("doc_id")
+
+    @log_elapsed(operation="EXTRACT")
+    @handle_service_exceptions("extracting")
+    async def extract(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        url_path = "extract"
+        if self.is_public_call:
+            url_path = "extract-public"
+        prompt_service_response = await self._call_service(
+            url_path=url_path,
+            payload=payload,
+            params=params,
+            headers=headers,
+        )
+        return prompt_service_response.get("extracted_text")
+
+    @log_elapsed(operation="SINGLE_PASS_EXTRACTION")
+    @handle_service_exceptions("single pass extraction")
+    async def single_pass_extraction(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        return await self._call_service(
+            url_path="single-pass-extraction",
+            payload=payload,
+            params=params,
+            headers=headers,
+        )
+
+    @log_elapsed(operation="SUMMARIZATION")
+    @handle_service_exceptions("summarizing")
+    async def summarize(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        return await self._call_service(
+            url_path="summarize",
+            payload=payload,
+            params=params,
+            headers=headers,
+        )
+
+    @retry_prompt_service_call
+    async def _call_service(
+        self,
+        url_path: str,
+        payload: dict[str, Any] | None = None,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        method: str = "POST",
+    ) -> dict[str, Any]:
+        """Communicates to prompt service, like `PromptTool._call_service()`.
+
+        Retried on connection errors with the same backoff, configured by
+        the PROMPT_SERVICE_* environment variables.
+
+        Args:
+            url_path (str): URL path to the service endpoint
+            payload (dict, optional): Payload to send in the request body
+            params (dict, optional): Query parameters to include in the request
+            headers (dict, optional): Headers to include in the request
+            method (str): HTTP method to use for the request (GET or POST)
+
+        Returns:
+            dict: Response from the prompt service
+        """
+        url: str = f"{self.base_url}/{url_path}"
+        req_headers = self._get_headers(headers)
+        if method.upper() == "POST":
+            response = await self._client.post(
+                url=url, json=payload, params=params, headers=req_headers
+            )
+        elif method.upper() == "GET":
+            response = await self._client.get(url=url, params=params, headers=req_headers)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        response.raise_for_status()
+        return response.json()
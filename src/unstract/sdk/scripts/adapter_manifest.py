@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+import argparse
+import logging
+
+from unstract.sdk.adapters.manifest import MANIFEST_PATH, Constants, write_manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="Unstract adapter manifest",
+        description=(
+            "Generates the manifest of adapters, so that tools import an "
+            "adapter only when it's used. Run it when building an image."
+        ),
+        epilog="Unstract SDK",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help=f"File to write the manifest to. Defaults to {MANIFEST_PATH}",
+        required=False,
+        default=MANIFEST_PATH,
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        manifest = write_manifest(args.output)
+    except Exception as e:
+        print(f"Error generating adapter manifest: {e}")
+        exit(1)
+    for package, adapters in manifest[Constants.ADAPTERS].items():
+        print(f"{package}: {len(adapters)} adapters")
+    print(f"Adapter manifest written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+import argparse
+import json
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from unstract.sdk.platform import HttpSessionConfig, create_http_session
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Answers every request like the platform service, keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps({"status": "OK", "details": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _time_requests(
+    get: Callable[[str], requests.Response], url: str, count: int
+) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        get(url).raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _describe(name: str, latencies: list[float], connections: int) -> str:
+    return (
+        f"{name}: median {statistics.median(latencies) * 1000:.3f}ms, "
+        f"p95 {statistics.quantiles(latencies, n=20)[-1] * 1000:.3f}ms "
+        f"over {len(latencies)} requests, {connections} connection(s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="Unstract HTTP session benchmark",
+        description=(
+            "Compares the latency of requests to a local stand-in of the "
+            "platform service, made with a new connection each versus through "
+            "the pooled session used by the SDK's platform clients."
+        ),
+        epilog="Unstract SDK",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=500,
+        help="Number of requests made each way. Defaults to 500",
+        required=False,
+    )
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/platform_details"
+    try:
+        _StandInHandler.connections = 0
+        unpooled = _time_requests(requests.get, url, args.requests)
+        print(_describe("requests.get", unpooled, _StandInHandler.connections))
+
+        _StandInHandler.connections = 0
+        with create_http_session(HttpSessionConfig()) as session:
+            pooled = _time_requests(session.get, url, args.requests)
+        print(_describe("pooled session", pooled, _StandInHandler.connections))
+    finally:
+        server.shutdown()
+        server.server_close()
+    speedup = statistics.median(unpooled) / statistics.median(pooled)
+    print(f"Pooled session is {speedup:.1f}x faster at the median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+from unstract.sdk import get_sdk_version
+from unstract.sdk.profiler import Constants
+
+DEFAULT_MODULES = [
+    "unstract.sdk.tool.base",
+    "unstract.sdk.llm",
+    "unstract.sdk.embedding",
+    "unstract.sdk.vector_db",
+    "unstract.sdk.index",
+]
+
+# Run in a fresh interpreter, so that nothing is imported yet
+_IMPORT_MODULE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+from unstract.sdk import profiler
+print(json.dumps({"elapsed": elapsed, "profile": profiler.get_profiler().report(10)}))
+"""
+
+
+def _run_once(module: str) -> dict[str, Any]:
+    env = dict(os.environ, **{Constants.ENV: "true"})
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_MODULE, module],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    run["wall"] = wall
+    return run
+
+
+def _summarise(values: list[float]) -> dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 4),
+        "min": round(min(values), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def benchmark(module: str, runs: int) -> dict[str, Any]:
+    """Measures the cold start time of importing a module.
+
+    Args:
+        module (str): Module to import, such as "unstract.sdk.llm"
+        runs (int): Number of fresh interpreters to import it in
+
+    Returns:
+        dict[str, Any]: Seconds taken by the whole process and by the import,
+            with the slowest imports of the last run
+    """
+    results = [_run_once(module) for _ in range(runs)]
+    return {
+        "sdk_version": get_sdk_version(),
+        "python": platform.python_version(),
+        "module": module,
+        "runs": runs,
+        "process": _summarise([result["wall"] for result in results]),
+        "import": _summarise([result["elapsed"] for result in results]),
+        "modules_imported": results[-1]["profile"]["modules_imported"],
+        "packages": dict(list(results[-1]["profile"]["packages"].items())[:10]),
+        "slowest_imports": results[-1]["profile"]["imports"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="Unstract startup benchmark",
+        description=(
+            "Measures the time taken to import SDK modules in fresh "
+            "interpreters. Append the results of each SDK version to the same "
+            "file to compare them."
+        ),
+        epilog="Unstract SDK",
+    )
+    parser.add_argument(
+        "--modules",
+        type=str,
+        nargs="+",
+        default=DEFAULT_MODULES,
+        help=f"Modules to import. Defaults to {' '.join(DEFAULT_MODULES)}",
+        required=False,
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Number of times each module is imported. Defaults to 5",
+        required=False,
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="JSON lines file to append the results to",
+        required=False,
+    )
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules:
+        try:
+            result = benchmark(module, runs=args.runs)
+        except subprocess.CalledProcessError as e:
+            print(f"Error importing {module}: {e.stderr}")
+            exit(1)
+        results.append(result)
+        print(
+            f"{module}: {result['import']['median']}s to import "
+            f"{result['modules_imported']} modules, "
+            f"{result['process']['median']}s for the process "
+            f"(median of {args.runs})"
+        )
+    if args.output:
+        with open(args.output, "a") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
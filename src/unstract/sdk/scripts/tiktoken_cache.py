@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+import argparse
+import logging
+
+from unstract.sdk.utils.tokenizer import ENCODING_URLS, get_cache_dir, warm_up
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="Unstract tiktoken cache",
+        description=(
+            "Downloads the tiktoken encodings used to count tokens, so that "
+            "tools start without network access. Run it when building an image."
+        ),
+        epilog="Unstract SDK",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help=(
+            "Directory to download into, read by setting TIKTOKEN_CACHE_DIR. "
+            f"Defaults to TIKTOKEN_CACHE_DIR, else {get_cache_dir()}"
+        ),
+        required=False,
+    )
+    parser.add_argument(
+        "--encodings",
+        type=str,
+        nargs="+",
+        choices=sorted(ENCODING_URLS),
+        help="Encodings to download. Defaults to all",
+        required=False,
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        paths = warm_up(encoding_names=args.encodings, cache_dir=args.cache_dir)
+    except Exception as e:
+        print(f"Error caching tiktoken encodings: {e}")
+        exit(1)
+    for path in paths:
+        print(f"Cached {path}")
+
+
+if __name__ == "__main__":
+    main()
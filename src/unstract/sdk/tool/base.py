@@ -15,6 +15,7 @@ from unstract.sdk.constants import (
 )
 from unstract.sdk.exceptions import FileStorageError
 from unstract.sdk.file_storage import EnvHelper, StorageType
+from unstract.sdk.profiler import phase
 from unstract.sdk.tool.mixin import ToolConfigHelper
 from unstract.sdk.tool.parser import ToolArgsParser
 from unstract.sdk.tool.stream import StreamMixin
@@ -81,21 +82,24 @@ class BaseTool(ABC, StreamMixin):
         Returns:
             AbstractTool: Abstract base tool class
         """
-        parsed_args = ToolArgsParser.parse_args(args)
-        tool = cls(log_level=parsed_args.log_level)
-        if parsed_args.command not in Command.static_commands():
-            tool._exec_metadata = tool._get_exec_metadata()
-            tool.workflow_id = tool._exec_metadata.get(MetadataKey.WORKFLOW_ID)
-            tool.execution_id = tool._exec_metadata.get(MetadataKey.EXECUTION_ID, "")
-            tool.file_execution_id = tool._exec_metadata.get(
-                MetadataKey.FILE_EXECUTION_ID, ""
-            )
-            tool.tags = tool._exec_metadata.get(MetadataKey.TAGS, [])
-            tool.source_file_name = tool._exec_metadata.get(MetadataKey.SOURCE_NAME, "")
-            tool.org_id = tool._exec_metadata.get(MetadataKey.ORG_ID)
-            tool.llm_profile_id = tool._exec_metadata.get(MetadataKey.LLM_PROFILE_ID)
-            tool.custom_data = tool._exec_metadata.get(MetadataKey.CUSTOM_DATA, {})
-        return tool
+        with phase("from_tool_args"):
+            parsed_args = ToolArgsParser.parse_args(args)
+            tool = cls(log_level=parsed_args.log_level)
+            if parsed_args.command not in Command.static_commands():
+                tool._exec_metadata = tool._get_exec_metadata()
+                tool.workflow_id = tool._exec_metadata.get(MetadataKey.WORKFLOW_ID)
+                tool.execution_id = tool._exec_metadata.get(MetadataKey.EXECUTION_ID, "")
+                tool.file_execution_id = tool._exec_metadata.get(
+                    MetadataKey.FILE_EXECUTION_ID, ""
+                )
+                tool.tags = tool._exec_metadata.get(MetadataKey.TAGS, [])
+                tool.source_file_name = tool._exec_metadata.get(
+                    MetadataKey.SOURCE_NAME, ""
+                )
+                tool.org_id = tool._exec_metadata.get(MetadataKey.ORG_ID)
+                tool.llm_profile_id = tool._exec_metadata.get(MetadataKey.LLM_PROFILE_ID)
+                tool.custom_data = tool._exec_metadata.get(MetadataKey.CUSTOM_DATA, {})
+            return tool
 
     def elapsed_time(self) -> float:
         """Returns the elapsed time since the tool was created."""
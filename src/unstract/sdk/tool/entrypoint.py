@@ -2,6 +2,7 @@ import logging
 import signal
 from typing import Any
 
+from unstract.sdk import profiler
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.tool.executor import ToolExecutor
 from unstract.sdk.tool.parser import ToolArgsParser
@@ -19,7 +20,9 @@ class ToolEntrypoint:
         logger.info("Received %s signal", signal_name)
 
     @staticmethod
-    def launch(tool: BaseTool, args: list[str]) -> None:
+    def launch(
+        tool: BaseTool, args: list[str], profile_startup: bool = False
+    ) -> None:
         """Entrypoint function for a tool.
 
         It parses the arguments passed to a tool and executes
@@ -28,7 +31,13 @@ class ToolEntrypoint:
         Args:
             tool (AbstractTool): Tool to execute
             args (List[str]): Arguments passed to a tool
+            profile_startup (bool, optional): Whether to stream the time taken
+                to start the tool. Imports are only timed when profiling is
+                enabled with STARTUP_PROFILING instead, since they're done by
+                now. Defaults to False.
         """
+        if profile_startup:
+            profiler.enable(time_imports=False)
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, ToolEntrypoint._signal_handler)
         signal.signal(signal.SIGINT, ToolEntrypoint._signal_handler)
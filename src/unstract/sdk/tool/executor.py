@@ -5,7 +5,7 @@ from json import loads
 from pathlib import Path
 from typing import Any
 
-from unstract.sdk import get_sdk_version
+from unstract.sdk import get_sdk_version, profiler
 from unstract.sdk.constants import Command
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.tool.validator import ToolValidator
@@ -45,6 +45,22 @@ class ToolExecutor:
         shutil.rmtree(self.tool.get_output_dir(), ignore_errors=True)
         Path(self.tool.get_output_dir()).mkdir(parents=True, exist_ok=True)
 
+    def _stream_startup_profile(self) -> None:
+        """Streams the time taken to start the tool, if profiling is enabled.
+
+        Covers everything up to running the tool, see `unstract.sdk.profiler`.
+        """
+        startup_profiler = profiler.get_profiler()
+        if startup_profiler is None:
+            return
+        report = startup_profiler.report()
+        self.tool.stream_log(
+            f"Tool started in {report['elapsed']}s, "
+            f"{report['import_total']}s of which importing "
+            f"{report['modules_imported']} modules",
+            profile=report,
+        )
+
     def execute_run(self, args: argparse.Namespace) -> None:
         """Executes the tool's RUN command.
 
@@ -63,14 +79,16 @@ class ToolExecutor:
             f"Execution ID: {self.tool.execution_id}, "
             f"SDK Version: {get_sdk_version()}"
         )
-        validator = ToolValidator(self.tool)
-        settings = validator.validate_pre_execution(settings=settings)
+        with profiler.phase("validate_pre_execution"):
+            validator = ToolValidator(self.tool)
+            settings = validator.validate_pre_execution(settings=settings)
 
         self.tool.stream_log(
             f"Executing for file: '{self.tool.get_exec_metadata['source_name']}', "
             f"with tool settings: {settings}"
         )
 
+        self._stream_startup_profile()
         try:
             self.tool.run(
                 settings=settings,
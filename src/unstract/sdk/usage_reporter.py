@@ -0,0 +1,286 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from unstract.sdk.platform import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    ENABLED = "USAGE_REPORTER_ENABLED"
+    BATCH_SIZE = "USAGE_REPORTER_BATCH_SIZE"
+    FLUSH_INTERVAL = "USAGE_REPORTER_FLUSH_INTERVAL"
+    MAX_QUEUE_SIZE = "USAGE_REPORTER_MAX_QUEUE_SIZE"
+    SPOOL_DIR = "USAGE_REPORTER_SPOOL_DIR"
+    DEFAULT_SPOOL_DIR = os.path.join(tempfile.gettempdir(), "unstract-usage-spool")
+    SPOOL_SUFFIX = ".jsonl"
+    REQUEST_TIMEOUT = 30
+
+
+@dataclass
+class UsageRecord:
+    """Usage to push to an endpoint of the platform service.
+
+    Attributes:
+        url (str): URL of the endpoint, such as `<platform>/usage`
+        platform_api_key (str): API key to push the usage with
+        data (dict): Usage pushed as the body of the request
+    """
+
+    url: str
+    platform_api_key: str
+    data: dict[str, Any]
+
+
+class _PlatformUnavailableError(Exception):
+    """The platform couldn't be reached or failed, the usage is kept to retry."""
+
+
+class UsageReporter:
+    """Pushes usage to the platform service from a background thread.
+
+    Records are queued in memory and pushed in batches, once `batch_size`
+    are queued or every `flush_interval` seconds. Usage which can't be pushed
+    while the platform is unavailable is spooled to files in `spool_dir`, and
+    pushed once the platform is reachable again, by any process using the
+    same directory. Queued usage is pushed at process exit.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        max_queue_size: int = 10000,
+        spool_dir: str = Constants.DEFAULT_SPOOL_DIR,
+        session: requests.Session | None = None,
+    ) -> None:
+        """Creates a reporter, its thread is started on the first report.
+
+        Args:
+            batch_size (int): Records which trigger a flush. Defaults to 50.
+            flush_interval (float): Seconds between flushes. Defaults to 5.
+            max_queue_size (int): Records kept in memory, usage reported while
+                the queue is full is spooled instead. Defaults to 10000.
+            spool_dir (str): Directory usage is spooled to. Defaults to
+                `unstract-usage-spool` in the temporary directory.
+            session (Optional[requests.Session], optional): Session to push
+                usage with. Defaults to None, for the shared platform session.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.spool_dir = Path(spool_dir)
+        self._session = session
+        self._queue: deque[UsageRecord] = deque()
+        self._condition = threading.Condition()
+        # Serialises flushes of the thread and of callers of flush()
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @classmethod
+    def from_env(cls) -> "UsageReporter":
+        """Creates a reporter configured by the environment.
+
+        Environment variables:
+            USAGE_REPORTER_BATCH_SIZE: Records which trigger a flush (default: 50)
+            USAGE_REPORTER_FLUSH_INTERVAL: Seconds between flushes (default: 5)
+            USAGE_REPORTER_MAX_QUEUE_SIZE: Records kept in memory (default: 10000)
+            USAGE_REPORTER_SPOOL_DIR: Directory usage is spooled to
+
+        Returns:
+            UsageReporter: Reporter configured by the environment
+        """
+        return cls(
+            batch_size=int(os.environ.get(Constants.BATCH_SIZE, "50")),
+            flush_interval=float(os.environ.get(Constants.FLUSH_INTERVAL, "5")),
+            max_queue_size=int(os.environ.get(Constants.MAX_QUEUE_SIZE, "10000")),
+            spool_dir=os.environ.get(Constants.SPOOL_DIR, Constants.DEFAULT_SPOOL_DIR),
+        )
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    def report(self, record: UsageRecord) -> None:
+        """Queues usage to push, without waiting on the platform.
+
+        Args:
+            record (UsageRecord): Usage to push
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Usage reporter is closed")
+            if len(self._queue) >= self.max_queue_size:
+                self._spool([record])
+                return
+            self._queue.append(record)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="usage-reporter", daemon=True
+                )
+                self._thread.start()
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Pushes queued usage, and spooled usage if the platform is reachable.
+
+        Usage which can't be pushed is spooled.
+        """
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    batch = [
+                        self._queue.popleft()
+                        for _ in range(min(self.batch_size, len(self._queue)))
+                    ]
+                if not batch:
+                    break
+                if not self._push(batch):
+                    # Spool the rest too, rather than waiting on each record
+                    with self._condition:
+                        rest = list(self._queue)
+                        self._queue.clear()
+                    self._spool(rest)
+                    return
+            self._push_spooled()
+
+    def close(self) -> None:
+        """Stops the thread and pushes the usage left."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and len(self._queue) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Error while pushing usage details")
+
+    def _push(self, batch: list[UsageRecord]) -> bool:
+        """Pushes a batch over the pooled connections.
+
+        Returns:
+            bool: False if the platform is unavailable, after spooling the
+                records of the batch that weren't pushed
+        """
+        session = self._session or get_http_session()
+        for index, record in enumerate(batch):
+            try:
+                self._post(session, record)
+            except _PlatformUnavailableError as e:
+                logger.warning(f"Spooling usage details, platform unavailable: {e}")
+                self._spool(batch[index:])
+                return False
+        return True
+
+    def _post(self, session: requests.Session, record: UsageRecord) -> None:
+        headers = {"Authorization": f"Bearer {record.platform_api_key}"}
+        try:
+            response = session.post(
+                record.url,
+                headers=headers,
+                json=record.data,
+                timeout=Constants.REQUEST_TIMEOUT,
+            )
+        except requests.RequestException as e:
+            raise _PlatformUnavailableError(str(e)) from e
+        if response.status_code >= 500:
+            raise _PlatformUnavailableError(f"{response.status_code} {response.reason}")
+        if response.status_code != 200:
+            # Rejected, so pushing it again wouldn't help
+            logger.error(
+                "Error while pushing usage details: "
+                f"{response.status_code} {response.reason}"
+            )
+
+    def _spool(self, records: list[UsageRecord]) -> None:
+        if not records:
+            return
+        try:
+            self.spool_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            path = self.spool_dir / f"{uuid.uuid4().hex}{Constants.SPOOL_SUFFIX}"
+            # Records hold API keys, so only the owner can read them
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w") as spool_file:
+                for record in records:
+                    spool_file.write(json.dumps(asdict(record)) + "\n")
+        except OSError:
+            logger.exception(f"Dropping {len(records)} usage record(s), can't spool")
+
+    def _push_spooled(self) -> None:
+        if not self.spool_dir.is_dir():
+            return
+        for path in sorted(self.spool_dir.glob(f"*{Constants.SPOOL_SUFFIX}")):
+            # Claim the file, in case another process is pushing it too
+            claimed = path.with_suffix(f".{os.getpid()}.pushing")
+            try:
+                path.rename(claimed)
+                lines = claimed.read_text().splitlines()
+            except OSError:
+                continue
+            records = [UsageRecord(**json.loads(line)) for line in lines if line]
+            claimed.unlink()
+            if not self._push(records):
+                return
+
+
+_reporter: UsageReporter | None = None
+_reporter_pid: int | None = None
+_reporter_lock = threading.Lock()
+
+
+def is_enabled_by_env() -> bool:
+    """Whether usage is pushed in the background, set by USAGE_REPORTER_ENABLED.
+
+    Defaults to true. Set it to false to push usage as it's reported.
+    """
+    return os.environ.get(Constants.ENABLED, "true").strip().lower() == "true"
+
+
+def get_usage_reporter() -> UsageReporter:
+    """Gets the reporter of this process, creating it on first use.
+
+    It's closed at process exit, pushing the usage left.
+
+    Returns:
+        UsageReporter: Reporter shared by this process
+    """
+    global _reporter, _reporter_pid
+    # A forked process doesn't have the thread of its parent
+    if _reporter is not None and _reporter_pid == os.getpid():
+        return _reporter
+    with _reporter_lock:
+        if _reporter is None or _reporter_pid != os.getpid():
+            _reporter = UsageReporter.from_env()
+            _reporter_pid = os.getpid()
+            atexit.register(_reporter.close)
+        return _reporter
@@ -0,0 +1,312 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any
+
+from unstract.sdk.utils.retry_utils import calculate_delay
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    MIN_BATCH_SIZE = 1
+    # Conservative request budget, OpenAI allows 300k tokens per request
+    DEFAULT_MAX_BATCH_TOKENS = 100000
+    GROWTH_STEP = 8
+    SHRINK_FACTOR = 0.5
+    MAX_RETRIES = 8
+    BASE_DELAY = 1.0
+    MAX_DELAY = 60.0
+    RATE_LIMIT_STATUS_CODES = (429,)
+    # Providers reject batches above their limits with a bad request
+    SIZE_LIMIT_STATUS_CODES = (400, 413)
+    # Exceptions raised by provider SDKs on rate limits, which don't all carry
+    # a status code, such as Bedrock's ThrottlingException
+    RATE_LIMIT_ERROR_NAMES = (
+        "RateLimitError",
+        "ResourceExhausted",
+        "ThrottlingException",
+        "TooManyRequests",
+    )
+
+
+def get_status_code(error: Exception) -> int | None:
+    """Gets the HTTP status code carried by a provider SDK's exception."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    if status_code is None:
+        # Google API errors carry it as `code`
+        status_code = getattr(error, "code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def get_retry_after(error: Exception) -> float | None:
+    """Gets the delay requested through Retry-After headers, in seconds."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+    except (TypeError, ValueError):
+        # HTTP dates aren't sent by embedding providers, fall back to backoff
+        pass
+    return None
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether the provider rejected a request for its rate.
+
+    Classified by the status code, else by the type of the exception.
+    """
+    if get_status_code(error) in Constants.RATE_LIMIT_STATUS_CODES:
+        return True
+    return any(
+        error_type.__name__ in Constants.RATE_LIMIT_ERROR_NAMES
+        for error_type in type(error).__mro__
+    )
+
+
+def is_size_limit_error(error: Exception) -> bool:
+    """Whether the provider might have rejected a request for its size.
+
+    Providers answer a batch above their limits with a 400 or 413, like other
+    bad requests. Such requests are retried with smaller batches, so a bad
+    request which isn't caused by the size is raised once down to one text.
+    """
+    return get_status_code(error) in Constants.SIZE_LIMIT_STATUS_CODES
+
+
+class _LearntBatchSize:
+    """Batch size accepted by a provider, shared by the batchers of a model."""
+
+    def __init__(self, initial_batch_size: int, max_batch_size: int) -> None:
+        self.max_batch_size = max(max_batch_size, Constants.MIN_BATCH_SIZE)
+        self.lock = threading.Lock()
+        self.value = min(
+            max(initial_batch_size, Constants.MIN_BATCH_SIZE), self.max_batch_size
+        )
+
+
+_learnt_batch_sizes: dict[Hashable, _LearntBatchSize] = {}
+_learnt_batch_sizes_lock = threading.Lock()
+
+
+def _get_learnt_batch_size(
+    key: Hashable | None, initial_batch_size: int, max_batch_size: int
+) -> _LearntBatchSize:
+    if key is None:
+        return _LearntBatchSize(initial_batch_size, max_batch_size)
+    with _learnt_batch_sizes_lock:
+        if key not in _learnt_batch_sizes:
+            _learnt_batch_sizes[key] = _LearntBatchSize(
+                initial_batch_size, max_batch_size
+            )
+        return _learnt_batch_sizes[key]
+
+
+class AdaptiveEmbeddingBatcher:
+    """Embeds texts in batches sized to what the provider currently accepts.
+
+    Batches are packed up to the current batch size without exceeding a
+    token budget. The batch size is halved when the provider rejects a
+    request for its rate or size, after which the request is retried, and
+    grows back additively after each successful request up to
+    `max_batch_size`. Rate limited requests wait for the provider's
+    Retry-After, else back off exponentially. The learnt batch size carries
+    over across calls, and across the batchers created with the same `key`.
+    Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[Any]],
+        count_tokens: Callable[[str], int],
+        initial_batch_size: int,
+        max_batch_size: int | None = None,
+        max_batch_tokens: int = Constants.DEFAULT_MAX_BATCH_TOKENS,
+        max_retries: int = Constants.MAX_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+        aembed_fn: Callable[[list[str]], Awaitable[list[Any]]] | None = None,
+        count_tokens_batch: Callable[[list[str]], list[int]] | None = None,
+        key: Hashable | None = None,
+    ) -> None:
+        """Creates a batcher.
+
+        Args:
+            embed_fn (Callable[[list[str]], list[Any]]): Embeds a batch of
+                texts in a single request to the provider
+            count_tokens (Callable[[str], int]): Counts the tokens of a text
+                with the model's tokenizer
+            initial_batch_size (int): Batch size to start with, typically
+                the `embed_batch_size` configured for the adapter
+            max_batch_size (Optional[int], optional): Upper bound of the
+                batch size. Defaults to None, for the `initial_batch_size`
+                since providers limit the inputs of a request.
+            max_batch_tokens (int, optional): Upper bound of the tokens sent
+                in a request. A single text above it is still sent on its
+                own. Defaults to 100000.
+            max_retries (int, optional): Consecutive failed requests after
+                which the error is raised. Defaults to 8.
+            sleep (Callable[[float], None], optional): Used to wait before
+                retrying. Defaults to time.sleep.
+            aembed_fn (Optional[Callable[[list[str]], Awaitable[list[Any]]]],
+                optional): Async counterpart of `embed_fn`, required for
+                `aembed()`. Defaults to None.
+            count_tokens_batch (Optional[Callable[[list[str]], list[int]]],
+                optional): Counts the tokens of each text in a list, used
+                instead of `count_tokens` if set. Defaults to None.
+            key (Optional[Hashable], optional): Identifies the model, such as
+                the hash of the adapter's config. Batchers with the same key
+                share the learnt batch size. Defaults to None, to not share it.
+        """
+        self._embed_fn = embed_fn
+        self._aembed_fn = aembed_fn
+        self._count_tokens = count_tokens
+        self._count_tokens_batch = count_tokens_batch
+        self._max_batch_tokens = max_batch_tokens
+        self._max_retries = max_retries
+        self._sleep = sleep
+        self._learnt = _get_learnt_batch_size(
+            key,
+            initial_batch_size,
+            max_batch_size if max_batch_size is not None else initial_batch_size,
+        )
+
+    def _get_token_counts(self, texts: list[str]) -> list[int]:
+        if self._count_tokens_batch:
+            return self._count_tokens_batch(list(texts))
+        return [self._count_tokens(text) for text in texts]
+
+    @property
+    def batch_size(self) -> int:
+        with self._learnt.lock:
+            return self._learnt.value
+
+    def _grow(self) -> None:
+        with self._learnt.lock:
+            self._learnt.value = min(
+                self._learnt.value + Constants.GROWTH_STEP, self._learnt.max_batch_size
+            )
+
+    def _shrink(self, failed_batch_size: int) -> None:
+        with self._learnt.lock:
+            self._learnt.value = max(
+                min(self._learnt.value, int(failed_batch_size * Constants.SHRINK_FACTOR)),
+                Constants.MIN_BATCH_SIZE,
+            )
+            logger.info(f"Reduced embedding batch size to {self._learnt.value}")
+
+    def _pack(self, token_counts: Sequence[int], start: int) -> int:
+        """Returns the end of the batch starting at `start`."""
+        batch_size = self.batch_size
+        end = start
+        batch_tokens = 0
+        while end < len(token_counts) and end - start < batch_size:
+            if end > start and batch_tokens + token_counts[end] > self._max_batch_tokens:
+                break
+            batch_tokens += token_counts[end]
+            end += 1
+        return end
+
+    def split(self, texts: Sequence[str]) -> list[list[str]]:
+        """Splits texts into groups of the current batch size.
+
+        Lets callers embed the groups concurrently, each with `embed()`.
+        """
+        batch_size = self.batch_size
+        return [
+            list(texts[start : start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ]
+
+    def _get_retry_delay(
+        self, error: Exception, batch: Sequence[str], attempt: int
+    ) -> float:
+        """Shrinks the batch size and returns the delay before retrying.
+
+        Raises the error if it isn't worth retrying.
+        """
+        rate_limited = is_rate_limit_error(error)
+        if not rate_limited and not (is_size_limit_error(error) and len(batch) > 1):
+            raise error
+        if attempt >= self._max_retries:
+            raise error
+        self._shrink(len(batch))
+        if not rate_limited:
+            return 0.0
+        delay = get_retry_after(error)
+        if delay is None:
+            delay = calculate_delay(
+                attempt,
+                base_delay=Constants.BASE_DELAY,
+                multiplier=2.0,
+                max_delay=Constants.MAX_DELAY,
+            )
+        logger.warning(f"Embedding rate limited, retrying in {delay:.2f}s: {error}")
+        return delay
+
+    def embed(self, texts: Sequence[str]) -> list[Any]:
+        """Embeds texts, preserving their order.
+
+        Args:
+            texts (Sequence[str]): Texts to embed
+
+        Returns:
+            list[Any]: Embedding of each text
+
+        Raises:
+            Exception: Error from the provider which isn't a rate / size
+                limit, or one that persists beyond `max_retries`
+        """
+        token_counts = self._get_token_counts(texts)
+        embeddings: list[Any] = []
+        start = 0
+        attempt = 0
+        while start < len(texts):
+            end = self._pack(token_counts, start)
+            batch = list(texts[start:end])
+            try:
+                embeddings.extend(self._embed_fn(batch))
+            except Exception as e:
+                delay = self._get_retry_delay(e, batch, attempt)
+                if delay:
+                    self._sleep(delay)
+                attempt += 1
+                continue
+            attempt = 0
+            start = end
+            self._grow()
+        return embeddings
+
+    async def aembed(self, texts: Sequence[str]) -> list[Any]:
+        """Async version of `embed()`."""
+        if not self._aembed_fn:
+            raise ValueError("`aembed_fn` is required to embed asynchronously")
+        token_counts = self._get_token_counts(texts)
+        embeddings: list[Any] = []
+        start = 0
+        attempt = 0
+        while start < len(texts):
+            end = self._pack(token_counts, start)
+            batch = list(texts[start:end])
+            try:
+                embeddings.extend(await self._aembed_fn(batch))
+            except Exception as e:
+                delay = self._get_retry_delay(e, batch, attempt)
+                if delay:
+                    await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            attempt = 0
+            start = end
+            self._grow()
+        return embeddings
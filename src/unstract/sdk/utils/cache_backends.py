@@ -0,0 +1,344 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from redis import StrictRedis
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    DEFAULT_MEMORY_MAX_SIZE = 10000
+    REDIS_KEY_PREFIX = "unstract_cache"
+    SQLITE_TABLE = "cache_entries"
+    # SQLite limits the number of bound parameters of a statement
+    SQLITE_BATCH_SIZE = 500
+
+
+@dataclass
+class CacheStats:
+    """Lookups served by a cache.
+
+    Attributes:
+        hits (int): Lookups which were found in the cache
+        misses (int): Lookups which had to be computed
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(ABC):
+    """Key value store of bytes used by the SDK's caches.
+
+    Backends are expected to be safe to share across threads. Operations
+    work on batches so that a remote backend costs a single round trip for
+    a batch of keys.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Fetches the values of keys.
+
+        Args:
+            keys (Sequence[str]): Keys to fetch
+
+        Returns:
+            dict[str, bytes]: Values of the keys which are present
+        """
+
+    @abstractmethod
+    def set_many(self, items: dict[str, bytes]) -> None:
+        """Stores values, replacing any existing ones.
+
+        Args:
+            items (dict[str, bytes]): Values by key
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Deletes a key, if present."""
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases the connections or memory held by the backend."""
+
+
+def create_redis_client(**kwargs: Any) -> StrictRedis:
+    """Creates a client for the Redis configured in the environment.
+
+    Uses REDIS_HOST, REDIS_PORT, REDIS_USER and REDIS_PASSWORD. Shared by the
+    Redis backed stores of the SDK.
+
+    Args:
+        kwargs: Further options of the client, such as `db`
+
+    Returns:
+        StrictRedis: Redis client
+    """
+    return StrictRedis(
+        host=os.getenv("REDIS_HOST", "unstract-redis"),
+        port=int(os.getenv("REDIS_PORT", 6379)),
+        username=os.getenv("REDIS_USER", "default"),
+        password=os.getenv("REDIS_PASSWORD", ""),
+        **kwargs,
+    )
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory LRU store, local to the process.
+
+    Values aren't serialised, so any object can be stored under any hashable
+    key when the store isn't used as a `CacheBackend` of bytes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = Constants.DEFAULT_MEMORY_MAX_SIZE,
+        ttl: float | None = None,
+        timer: Callable[[], float] | None = None,
+    ) -> None:
+        """Creates an empty store.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries held, the least
+                recently used are evicted beyond it. Defaults to 10000.
+            ttl (Optional[float], optional): Expiry of entries in seconds,
+                never expires if None. Defaults to None.
+            timer (Optional[Callable[[], float]], optional): Clock used for
+                expiry. Defaults to None, for time.monotonic.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+
+    def _now(self) -> float:
+        return self._timer() if self._timer else time.monotonic()
+
+    def get_many(self, keys: Sequence[Hashable]) -> dict[Hashable, Any]:
+        values = {}
+        now = self._now()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                values[key] = value
+        return values
+
+    def set_many(self, items: dict[Hashable, Any]) -> None:
+        expires_at = self._now() + self.ttl if self.ttl else None
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Deletes all entries whose key satisfies the predicate.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        self.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Store persisted to a SQLite database on local disk.
+
+    Safe to share across threads of a process and across processes on the
+    same host.
+    """
+
+    def __init__(
+        self, db_path: str, ttl: int | None = None, max_entries: int | None = None
+    ) -> None:
+        """Creates / opens the cache database.
+
+        Args:
+            db_path (str): Path to the SQLite database file. Parent
+                directories are created if needed.
+            ttl (Optional[int], optional): Expiry of entries in seconds, never
+                expires if None. Defaults to None.
+            max_entries (Optional[int], optional): Maximum number of entries
+                held, the oldest written are evicted beyond it. Unbounded if
+                None. Defaults to None.
+        """
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {Constants.SQLITE_TABLE} ("
+                "key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+            )
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        values = {}
+        now = time.time()
+        keys = list(keys)
+        with self._lock:
+            for start in range(0, len(keys), Constants.SQLITE_BATCH_SIZE):
+                batch = keys[start : start + Constants.SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM {Constants.SQLITE_TABLE} "
+                    f"WHERE key IN ({placeholders}) "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (*batch, now),
+                ).fetchall()
+                values.update({key: bytes(value) for key, value in rows})
+        return values
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        expires_at = time.time() + self._ttl if self._ttl else None
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {Constants.SQLITE_TABLE} "
+                "(key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, value in items.items()],
+            )
+            if self._max_entries is not None:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drops expired entries, then the oldest beyond `max_entries`.
+
+        A replaced entry gets a new rowid, so rowids follow the write order.
+        """
+        self._conn.execute(
+            f"DELETE FROM {Constants.SQLITE_TABLE} "
+            "WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        self._conn.execute(
+            f"DELETE FROM {Constants.SQLITE_TABLE} WHERE rowid IN ("
+            f"SELECT rowid FROM {Constants.SQLITE_TABLE} ORDER BY rowid LIMIT "
+            f"MAX((SELECT COUNT(*) FROM {Constants.SQLITE_TABLE}) - ?, 0))",
+            (self._max_entries,),
+        )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM {Constants.SQLITE_TABLE} WHERE key = ?", (key,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Store in Redis, shared by all workers using it.
+
+    The client needs the `mget`, `set`, `delete` and `pipeline` commands of
+    `redis.Redis`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        key_prefix: str = Constants.REDIS_KEY_PREFIX,
+        ttl: int | None = None,
+    ) -> None:
+        """Creates a store on top of a Redis client.
+
+        Args:
+            client (Any): Redis client
+            key_prefix (str, optional): Prefix for the keys holding entries.
+                Defaults to "unstract_cache".
+            ttl (Optional[int], optional): Expiry of entries in seconds, never
+                expires if None. Defaults to None.
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+        self._ttl = ttl
+
+    @classmethod
+    def from_env(
+        cls,
+        key_prefix: str = Constants.REDIS_KEY_PREFIX,
+        ttl: int | None = None,
+    ) -> "RedisCacheBackend":
+        """Creates a store for the Redis configured in the environment.
+
+        See `create_redis_client()`.
+        """
+        return cls(client=create_redis_client(), key_prefix=key_prefix, ttl=ttl)
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}:{key}"
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        if not keys:
+            return {}
+        values = self._client.mget([self._key(key) for key in keys])
+        return {
+            key: value
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        pipeline = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self._key(key), value, ex=self._ttl)
+        pipeline.execute()
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+
+    def close(self) -> None:
+        self._client.close()
@@ -1,17 +1,73 @@
 import logging
 from collections.abc import Callable
+from typing import Any
 
 import tiktoken
 from deprecated import deprecated
 from llama_index.core.callbacks import CallbackManager as LlamaIndexCallbackManager
-from llama_index.core.callbacks import TokenCountingHandler
+from llama_index.core.callbacks import CBEventType, EventPayload, TokenCountingHandler
+from llama_index.core.callbacks.token_counting import TokenCountingEvent
 from llama_index.core.embeddings import BaseEmbedding
 from llama_index.core.llms import LLM
+from unstract.sdk.utils import tokenizer as tokenizer_registry
 from unstract.sdk.utils.usage_handler import UsageHandler
 
 logger = logging.getLogger(__name__)
 
 
+class BatchTokenCountingHandler(TokenCountingHandler):
+    """Token counter sharing the process-wide tokenizer of its model.
+
+    The chunks of an embedding event are counted in a single batch, without
+    building their token lists. Other events are counted as by
+    `TokenCountingHandler`.
+    """
+
+    def __init__(self, model_name: str | None = None, verbose: bool = False) -> None:
+        """Creates a token counter.
+
+        Args:
+            model_name (Optional[str], optional): Name of the model whose
+                tokenizer is used. Defaults to None, for the fallback one.
+            verbose (bool, optional): Whether to print the counts of each
+                event. Defaults to False.
+        """
+        self._model_name = model_name
+        super().__init__(
+            tokenizer=tokenizer_registry.get_tokenizer(model_name), verbose=verbose
+        )
+
+    def on_event_end(
+        self,
+        event_type: CBEventType,
+        payload: dict[str, Any] | None = None,
+        event_id: str = "",
+        **kwargs: Any,
+    ) -> None:
+        if event_type in self.event_ends_to_ignore or payload is None:
+            return
+        if event_type == CBEventType.EMBEDDING:
+            self._count_embedding_tokens(payload, event_id)
+        else:
+            super().on_event_end(event_type, payload, event_id, **kwargs)
+
+    def _count_embedding_tokens(self, payload: dict[str, Any], event_id: str) -> None:
+        chunks = payload.get(EventPayload.CHUNKS, [])
+        counts = tokenizer_registry.count_tokens_batch(chunks, self._model_name)
+        for chunk, count in zip(chunks, counts, strict=True):
+            self.embedding_token_counts.append(
+                TokenCountingEvent(
+                    event_id=event_id,
+                    prompt=chunk,
+                    prompt_token_count=count,
+                    completion="",
+                    completion_token_count=0,
+                )
+            )
+        if self._verbose:
+            self._print(f"Embedding Token Usage: {sum(counts)}")
+
+
 class CallbackManager:
     """Class representing the CallbackManager to manage callbacks.
 
@@ -84,9 +140,9 @@ class CallbackManager:
             handler_list.append(usage_handler)
         elif isinstance(model, BaseEmbedding):
             embedding = model
-            # Get a tokenizer
-            tokenizer = CallbackManager.get_tokenizer(model)
-            token_counter = TokenCountingHandler(tokenizer=tokenizer, verbose=True)
+            token_counter = BatchTokenCountingHandler(
+                model_name=CallbackManager.get_model_name(model), verbose=True
+            )
             usage_handler = UsageHandler(
                 token_counter=token_counter,
                 platform_api_key=platform_api_key,
@@ -102,18 +158,31 @@ class CallbackManager:
         )
         return callback_manager
 
+    @staticmethod
+    def get_model_name(model: LLM | BaseEmbedding | None) -> str | None:
+        """Returns the name of the model, if any."""
+        if isinstance(model, LLM):
+            return model.metadata.model_name
+        elif isinstance(model, BaseEmbedding):
+            return model.model_name
+        return None
+
     @staticmethod
     def get_tokenizer(
         model: LLM | BaseEmbedding | None,
-        fallback_tokenizer: Callable[[str], list] = tiktoken.encoding_for_model(
-            "gpt-3.5-turbo"
-        ).encode,
+        fallback_tokenizer: Callable[[str], list] | None = None,
     ) -> Callable[[str], list]:
         """Returns a tokenizer function based on the provided model.
 
+        Tokenizers are loaded once per model name and shared by the process,
+        see `unstract.sdk.utils.tokenizer`.
+
         Args:
             model (Optional[Union[LLM, BaseEmbedding]]): The model to use for
             tokenization.
+            fallback_tokenizer (Optional[Callable[[str], list]], optional):
+                Used for models unknown to tiktoken. Defaults to None, for the
+                tokenizer of "gpt-3.5-turbo".
 
         Returns:
             Callable[[str], List]: The tokenizer function.
@@ -121,19 +190,15 @@ class CallbackManager:
         Raises:
             OSError: If an error occurs while loading the tokenizer.
         """
-        try:
-            if isinstance(model, LLM):
-                model_name: str = model.metadata.model_name
-            elif isinstance(model, BaseEmbedding):
-                model_name = model.model_name
-
-            tokenizer: Callable[[str], list] = tiktoken.encoding_for_model(
-                model_name
-            ).encode
-            return tokenizer
-        except (KeyError, ValueError) as e:
-            logger.warning(str(e))
-            return fallback_tokenizer
+        model_name = CallbackManager.get_model_name(model)
+        if fallback_tokenizer is not None:
+            try:
+                # Only resolves the name, the encoding is loaded by the registry
+                tiktoken.encoding_name_for_model(model_name or "")
+            except (KeyError, ValueError) as e:
+                logger.warning(str(e))
+                return fallback_tokenizer
+        return tokenizer_registry.get_tokenizer(model_name)
 
     @staticmethod
     @deprecated("Use set_callback() instead")
@@ -1,4 +1,5 @@
 import functools
+import inspect
 import logging
 import time
 import uuid
@@ -69,6 +70,20 @@ def log_elapsed(operation):
     """
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.time()
+                try:
+                    result = await func(*args, **kwargs)
+                finally:
+                    elapsed_time = time.time() - start_time
+                    logger.info(f"Time taken for '{operation}': {elapsed_time:.3f}s")
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             start_time = time.time()
@@ -85,50 +100,79 @@ def log_elapsed(operation):
     return decorator
 
 
+def _start_metrics(self) -> MetricsMixin | None:
+    # Check if run_id exists and if metrics should be captured
+    if self._run_id and self._capture_metrics:
+        return MetricsMixin(run_id=self._run_id)
+    return None
+
+
+def _collect_metrics(self, metrics_mixin: MetricsMixin | None) -> None:
+    # If metrics are being captured, collect and assign them at the end
+    if not metrics_mixin:
+        return
+    time_taken_key = MetricsMixin.TIME_TAKEN_KEY
+    new_metrics = metrics_mixin.collect_metrics()
+
+    # If time_taken(s) exists in both self._metrics and new_metrics, sum it
+    if (
+        self._metrics
+        and time_taken_key in self._metrics
+        and time_taken_key in new_metrics
+    ):
+        previously_measured_time = self._metrics.get(time_taken_key)
+        newly_measured_time = new_metrics.get(time_taken_key)
+
+        # Only sum if both are valid
+        if previously_measured_time and newly_measured_time:
+            self._metrics[time_taken_key] = (
+                previously_measured_time + newly_measured_time
+            )
+        else:
+            self._metrics[time_taken_key] = None
+    else:
+        # If the key isn't in self._metrics, set it to new_metrics
+        self._metrics = new_metrics
+
+
+def _has_metrics(self) -> bool:
+    return all(
+        hasattr(self, attr) for attr in ["_run_id", "_capture_metrics", "_metrics"]
+    )
+
+
 def capture_metrics(func):
-    """Decorator to capture metrics at the start and end of a function."""
+    """Decorator to capture metrics at the start and end of a function.
+
+    Coroutine functions are supported, their metrics cover the time until
+    the coroutine completes.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _has_metrics(self):
+                return await func(self, *args, **kwargs)
+            metrics_mixin = _start_metrics(self)
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                _collect_metrics(self, metrics_mixin)
+
+        return async_wrapper
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         # Ensure the required attributes exist; if not,
         # execute the function and return its result
-        if not all(
-            hasattr(self, attr) for attr in ["_run_id", "_capture_metrics", "_metrics"]
-        ):
+        if not _has_metrics(self):
             return func(self, *args, **kwargs)
 
-        # Check if run_id exists and if metrics should be captured
-        metrics_mixin = None
-        time_taken_key = MetricsMixin.TIME_TAKEN_KEY
-        if self._run_id and self._capture_metrics:
-            metrics_mixin = MetricsMixin(run_id=self._run_id)
-
+        metrics_mixin = _start_metrics(self)
         try:
             result = func(self, *args, **kwargs)
         finally:
-            # If metrics are being captured, collect and assign them at the end
-            if metrics_mixin:
-                new_metrics = metrics_mixin.collect_metrics()
-
-                # If time_taken(s) exists in both self._metrics and new_metrics, sum it
-                if (
-                    self._metrics
-                    and time_taken_key in self._metrics
-                    and time_taken_key in new_metrics
-                ):
-                    previously_measured_time = self._metrics.get(time_taken_key)
-                    newly_measured_time = new_metrics.get(time_taken_key)
-
-                    # Only sum if both are valid
-                    if previously_measured_time and newly_measured_time:
-                        self._metrics[time_taken_key] = (
-                            previously_measured_time + newly_measured_time
-                        )
-                    else:
-                        self._metrics[time_taken_key] = None
-                else:
-                    # If the key isn't in self._metrics, set it to new_metrics
-                    self._metrics = new_metrics
+            _collect_metrics(self, metrics_mixin)
 
         return result
 
@@ -0,0 +1,103 @@
+import json
+import logging
+import threading
+from typing import Any
+
+from llama_index.core.llms import CompletionResponse
+from unstract.sdk.utils.cache_backends import CacheBackend, CacheStats
+from unstract.sdk.utils.tool_utils import ToolUtils
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    KEY_PREFIX = "llm_completion"
+    TEXT = "text"
+    ADDITIONAL_KWARGS = "additional_kwargs"
+    RAW = "raw"
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Converts objects of provider SDKs, such as `raw` responses, to JSON."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return str(value)
+
+
+def encode_completion(response: CompletionResponse) -> bytes:
+    return json.dumps(
+        {
+            Constants.TEXT: response.text,
+            Constants.ADDITIONAL_KWARGS: response.additional_kwargs,
+            Constants.RAW: response.raw,
+        },
+        default=_to_jsonable,
+    ).encode()
+
+
+def decode_completion(value: bytes) -> CompletionResponse:
+    data = json.loads(value)
+    return CompletionResponse(
+        text=data[Constants.TEXT],
+        additional_kwargs=data.get(Constants.ADDITIONAL_KWARGS) or {},
+        raw=data.get(Constants.RAW),
+    )
+
+
+class CompletionCache:
+    """Exact match cache of LLM completions.
+
+    Entries are keyed by the adapter's config hash, the model, the prompt
+    and the completion kwargs, so a hit is only possible for a byte
+    identical request to the same adapter. The response is cached as
+    returned by the provider, before any post-processing. Expiry and
+    eviction are left to the backend. Errors from the backend are logged
+    and treated as misses.
+    """
+
+    def __init__(self, backend: CacheBackend, config_hash: str, model: str) -> None:
+        """Creates a cache for an LLM adapter.
+
+        Args:
+            backend (CacheBackend): Store for the completions
+            config_hash (str): Hash of the LLM adapter's config
+            model (str): Name of the LLM model
+        """
+        self._backend = backend
+        self._namespace = f"{Constants.KEY_PREFIX}:{config_hash}:{model}"
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get_key(self, prompt: str, **kwargs: Any) -> str:
+        request = json.dumps(
+            {"prompt": prompt, "kwargs": kwargs}, sort_keys=True, default=str
+        )
+        return f"{self._namespace}:{ToolUtils.hash_str(request)}"
+
+    def get(self, key: str) -> CompletionResponse | None:
+        """Gets a cached completion, recording the lookup in the stats."""
+        response = None
+        try:
+            value = self._backend.get(key)
+            if value is not None:
+                response = decode_completion(value)
+        except Exception as e:
+            logger.warning(f"Unable to read from completion cache: {e}")
+        with self._stats_lock:
+            if response is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return response
+
+    def put(self, key: str, response: CompletionResponse) -> None:
+        try:
+            self._backend.set(key, encode_completion(response))
+        except Exception as e:
+            logger.warning(f"Unable to write to completion cache: {e}")
+
+    def get_stats(self) -> CacheStats:
+        with self._stats_lock:
+            return CacheStats(hits=self._stats.hits, misses=self._stats.misses)
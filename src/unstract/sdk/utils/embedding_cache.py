@@ -0,0 +1,243 @@
+import logging
+import threading
+from array import array
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from llama_index.core.base.embeddings.base import Embedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.embeddings import BaseEmbedding
+from unstract.sdk.utils.cache_backends import CacheBackend, CacheStats
+from unstract.sdk.utils.tool_utils import ToolUtils
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    TEXT = "text"
+    QUERY = "query"
+    # Vectors are stored as C floats (float32)
+    TYPECODE = "f"
+
+
+# Hits and misses count texts, misses being sent to the embedding provider
+EmbeddingCacheStats = CacheStats
+
+
+def encode_embedding(embedding: Embedding) -> bytes:
+    return array(Constants.TYPECODE, embedding).tobytes()
+
+
+def decode_embedding(value: bytes) -> Embedding:
+    embedding = array(Constants.TYPECODE)
+    embedding.frombytes(value)
+    return embedding.tolist()
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model which looks up a cache before calling the provider.
+
+    Wraps a llama-index embedding so that it can be used in its place, such
+    as by `VectorStoreIndex` or the indexing pipeline. Entries are keyed by
+    the adapter's config hash, the model and the hash of the text. Only the
+    texts missing from the cache are sent to the wrapped model, so usage is
+    recorded only for what's actually embedded. Errors from the cache
+    backend are logged and treated as misses.
+    """
+
+    _embedding: BaseEmbedding = PrivateAttr()
+    _backend: CacheBackend = PrivateAttr()
+    _namespace: str = PrivateAttr()
+    _stats: EmbeddingCacheStats = PrivateAttr()
+    _stats_lock: threading.Lock = PrivateAttr()
+
+    def __init__(
+        self, embedding: BaseEmbedding, backend: CacheBackend, config_hash: str
+    ) -> None:
+        """Wraps an embedding model.
+
+        Args:
+            embedding (BaseEmbedding): Embedding model to wrap. Its callback
+                manager is shared so that usage is captured as before.
+            backend (CacheBackend): Store for the embeddings
+            config_hash (str): Hash of the embedding adapter's config
+        """
+        super().__init__(
+            model_name=embedding.model_name,
+            embed_batch_size=embedding.embed_batch_size,
+            callback_manager=embedding.callback_manager,
+            num_workers=embedding.num_workers,
+        )
+        self._embedding = embedding
+        self._backend = backend
+        self._namespace = f"{config_hash}:{embedding.model_name}"
+        self._stats = EmbeddingCacheStats()
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def embedding(self) -> BaseEmbedding:
+        return self._embedding
+
+    def get_stats(self) -> EmbeddingCacheStats:
+        with self._stats_lock:
+            return EmbeddingCacheStats(hits=self._stats.hits, misses=self._stats.misses)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats = EmbeddingCacheStats()
+
+    def _get_key(self, kind: str, text: str) -> str:
+        return f"{self._namespace}:{kind}:{ToolUtils.hash_str(text)}"
+
+    def _lookup(
+        self, kind: str, texts: list[str]
+    ) -> tuple[list[str], dict[str, Embedding], list[str]]:
+        """Looks up texts, returning their keys, the cached hits and misses.
+
+        Misses are de-duplicated so that repeated texts are embedded once.
+        """
+        keys = [self._get_key(kind, text) for text in texts]
+        try:
+            cached = self._backend.get_many(list(set(keys)))
+        except Exception as e:
+            logger.warning(f"Unable to read from embedding cache: {e}")
+            cached = {}
+        found = {key: decode_embedding(value) for key, value in cached.items()}
+        misses: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found:
+                misses.setdefault(key, text)
+        with self._stats_lock:
+            self._stats.hits += len(texts) - len(misses)
+            self._stats.misses += len(misses)
+        return keys, found, list(misses.values())
+
+    def _store(
+        self,
+        kind: str,
+        texts: list[str],
+        embeddings: list[Embedding],
+        found: dict[str, Embedding],
+    ) -> None:
+        items = {}
+        for text, embedding in zip(texts, embeddings, strict=True):
+            key = self._get_key(kind, text)
+            items[key] = encode_embedding(embedding)
+            found[key] = embedding
+        try:
+            self._backend.set_many(items)
+        except Exception as e:
+            logger.warning(f"Unable to write to embedding cache: {e}")
+
+    def _embed(
+        self,
+        kind: str,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], list[Embedding]],
+    ) -> list[Embedding]:
+        keys, found, misses = self._lookup(kind, texts)
+        if misses:
+            self._store(kind, misses, embed_fn(misses), found)
+        return [found[key] for key in keys]
+
+    async def _aembed(
+        self,
+        kind: str,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], Awaitable[list[Embedding]]],
+    ) -> list[Embedding]:
+        keys, found, misses = self._lookup(kind, texts)
+        if misses:
+            self._store(kind, misses, await embed_fn(misses), found)
+        return [found[key] for key in keys]
+
+    def embed_texts(
+        self, texts: list[str], embed_fn: Callable[[list[str]], list[Embedding]]
+    ) -> list[Embedding]:
+        """Gets text embeddings, embedding the misses with `embed_fn`.
+
+        Lets callers control how the misses are sent to the provider.
+        """
+        return self._embed(Constants.TEXT, texts, embed_fn)
+
+    async def aembed_texts(
+        self,
+        texts: list[str],
+        embed_fn: Callable[[list[str]], Awaitable[list[Embedding]]],
+    ) -> list[Embedding]:
+        """Async version of `embed_texts()`."""
+        return await self._aembed(Constants.TEXT, texts, embed_fn)
+
+    def embed_query(self, query: str, embed_fn: Callable[[str], Embedding]) -> Embedding:
+        """Gets a query embedding, embedding a miss with `embed_fn`."""
+        return self._embed(
+            Constants.QUERY, [query], lambda queries: [embed_fn(queries[0])]
+        )[0]
+
+    async def aembed_query(
+        self, query: str, embed_fn: Callable[[str], Awaitable[Embedding]]
+    ) -> Embedding:
+        """Async version of `embed_query()`."""
+
+        async def _embed_query(queries: list[str]) -> list[Embedding]:
+            return [await embed_fn(queries[0])]
+
+        return (await self._aembed(Constants.QUERY, [query], _embed_query))[0]
+
+    def get_query_embedding(self, query: str) -> Embedding:
+        return self._embed(
+            Constants.QUERY,
+            [query],
+            lambda queries: [self._embedding.get_query_embedding(queries[0])],
+        )[0]
+
+    async def aget_query_embedding(self, query: str) -> Embedding:
+        async def _embed_query(queries: list[str]) -> list[Embedding]:
+            return [await self._embedding.aget_query_embedding(queries[0])]
+
+        return (await self._aembed(Constants.QUERY, [query], _embed_query))[0]
+
+    def get_text_embedding(self, text: str) -> Embedding:
+        return self.get_text_embedding_batch([text])[0]
+
+    async def aget_text_embedding(self, text: str) -> Embedding:
+        return (await self.aget_text_embedding_batch([text]))[0]
+
+    def get_text_embedding_batch(
+        self, texts: list[str], show_progress: bool = False, **kwargs: Any
+    ) -> list[Embedding]:
+        return self._embed(
+            Constants.TEXT,
+            texts,
+            lambda misses: self._embedding.get_text_embedding_batch(
+                misses, show_progress=show_progress, **kwargs
+            ),
+        )
+
+    async def aget_text_embedding_batch(
+        self, texts: list[str], show_progress: bool = False
+    ) -> list[Embedding]:
+        return await self._aembed(
+            Constants.TEXT,
+            texts,
+            lambda misses: self._embedding.aget_text_embedding_batch(
+                misses, show_progress=show_progress
+            ),
+        )
+
+    # Uncached, the public methods above are what llama-index calls
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self._embedding._get_query_embedding(query)
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return await self._embedding._aget_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._embedding._get_text_embedding(text)
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        return self._embedding._get_text_embeddings(texts)
@@ -0,0 +1,182 @@
+import math
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from llama_index.core.schema import (
+    BaseNode,
+    MetadataMode,
+    NodeRelationship,
+    TransformComponent,
+)
+from unstract.sdk.adapters.vectordb.constants import VectorDbConstants
+from unstract.sdk.utils.tool_utils import ToolUtils
+
+
+class Constants:
+    CHUNK_INDEX = VectorDbConstants.CHUNK_INDEX
+    CHUNK_HASH = "chunk_hash"
+    # Namespace for the deterministic node IDs. Node IDs need to be UUIDs
+    # since some vector DBs (Qdrant, Weaviate) reject other formats.
+    NODE_ID_NAMESPACE = uuid.UUID("3f2b8c4e-7a1d-5e9b-9c0f-6d4a2b1e8f75")
+
+
+@dataclass
+class ChunkDiff:
+    """Difference between the chunks of a document and what's stored for it.
+
+    Attributes:
+        to_add (list[BaseNode]): New or changed chunks which need to be
+            written. Chunks whose content is already stored at another
+            position carry the stored embedding and need not be embedded.
+        to_delete (list[str]): IDs of stored nodes which are stale
+        unchanged (int): Number of stored chunks which are retained as is
+    """
+
+    to_add: list[BaseNode] = field(default_factory=list)
+    to_delete: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def to_embed(self) -> list[BaseNode]:
+        return [node for node in self.to_add if node.embedding is None]
+
+
+def _chunk_key(node: BaseNode) -> tuple[str, int] | None:
+    chunk_hash = node.metadata.get(Constants.CHUNK_HASH)
+    chunk_index = node.metadata.get(Constants.CHUNK_INDEX)
+    if chunk_hash is None or chunk_index is None:
+        return None
+    # Some vector DBs return numeric metadata as float / str
+    return str(chunk_hash), int(chunk_index)
+
+
+def annotate_chunks(nodes: Sequence[BaseNode]) -> Sequence[BaseNode]:
+    """Stamps each node with its position and a hash of its content.
+
+    Positions are counted within each document. Node IDs are derived from the
+    document ID, position and content hash so that re-splitting the same text
+    always produces the same nodes. The keys are excluded from the text which
+    is embedded or sent to an LLM.
+
+    Args:
+        nodes (Sequence[BaseNode]): Nodes in document order
+
+    Returns:
+        Sequence[BaseNode]: The same nodes, annotated in place
+    """
+    positions: dict[str | None, int] = {}
+    previous: dict[str | None, BaseNode] = {}
+    for node in nodes:
+        for excluded_keys in (
+            node.excluded_embed_metadata_keys,
+            node.excluded_llm_metadata_keys,
+        ):
+            for key in (Constants.CHUNK_INDEX, Constants.CHUNK_HASH):
+                if key not in excluded_keys:
+                    excluded_keys.append(key)
+
+        ref_doc_id = node.ref_doc_id
+        chunk_index = positions.get(ref_doc_id, 0)
+        positions[ref_doc_id] = chunk_index + 1
+        chunk_hash = ToolUtils.hash_str(
+            node.get_content(metadata_mode=MetadataMode.EMBED)
+        )
+        node.metadata[Constants.CHUNK_INDEX] = chunk_index
+        node.metadata[Constants.CHUNK_HASH] = chunk_hash
+        node.id_ = str(
+            uuid.uuid5(
+                Constants.NODE_ID_NAMESPACE,
+                f"{ref_doc_id}:{chunk_index}:{chunk_hash}",
+            )
+        )
+
+        # IDs changed above, relink neighbours within the document
+        node.relationships.pop(NodeRelationship.PREVIOUS, None)
+        node.relationships.pop(NodeRelationship.NEXT, None)
+        prev_node = previous.get(ref_doc_id)
+        if prev_node is not None:
+            node.relationships[NodeRelationship.PREVIOUS] = (
+                prev_node.as_related_node_info()
+            )
+            prev_node.relationships[NodeRelationship.NEXT] = (
+                node.as_related_node_info()
+            )
+        previous[ref_doc_id] = node
+    return nodes
+
+
+def diff_chunks(
+    new_nodes: Sequence[BaseNode], stored_nodes: Sequence[BaseNode]
+) -> ChunkDiff:
+    """Compares freshly split chunks of a document with the stored ones.
+
+    A chunk is retained when a stored node has the same content hash at the
+    same position. Stored nodes without chunk metadata (indexed by older
+    versions of the SDK) or duplicates are treated as stale.
+
+    Args:
+        new_nodes (Sequence[BaseNode]): Nodes annotated with `annotate_chunks()`
+        stored_nodes (Sequence[BaseNode]): Nodes currently in the vector DB
+
+    Returns:
+        ChunkDiff: Nodes to add and node IDs to delete
+    """
+    diff = ChunkDiff()
+    stored_by_key: dict[tuple[str, int], BaseNode] = {}
+    embeddings_by_hash: dict[str, list[float]] = {}
+    for node in stored_nodes:
+        key = _chunk_key(node)
+        if key is None or key in stored_by_key:
+            diff.to_delete.append(node.node_id)
+            continue
+        stored_by_key[key] = node
+        if node.embedding is not None and len(node.embedding) > 0:
+            embeddings_by_hash.setdefault(key[0], node.embedding)
+
+    for node in new_nodes:
+        key = _chunk_key(node)
+        if key is not None and stored_by_key.pop(key, None) is not None:
+            diff.unchanged += 1
+            continue
+        stored_embedding: Any = embeddings_by_hash.get(key[0]) if key else None
+        if stored_embedding is not None:
+            # Same content moved to a different position, reuse its embedding
+            node.embedding = [float(value) for value in stored_embedding]
+        diff.to_add.append(node)
+
+    diff.to_delete.extend(node.node_id for node in stored_by_key.values())
+    return diff
+
+
+def _chunk_position(node: BaseNode) -> tuple[float, float]:
+    chunk_index = node.metadata.get(Constants.CHUNK_INDEX)
+    start_char_idx = node.start_char_idx
+    return (
+        int(chunk_index) if chunk_index is not None else math.inf,
+        start_char_idx if start_char_idx is not None else math.inf,
+    )
+
+
+def sort_chunks(nodes: Sequence[BaseNode]) -> list[BaseNode]:
+    """Orders the nodes of a document by their position in it.
+
+    Nodes are ordered by the position stamped by `annotate_chunks()`. Nodes
+    indexed by older versions of the SDK are ordered by their start offset
+    in the document instead.
+
+    Args:
+        nodes (Sequence[BaseNode]): Nodes of a document, in any order
+
+    Returns:
+        list[BaseNode]: Nodes in document order
+    """
+    return sorted(nodes, key=_chunk_position)
+
+
+class ChunkAnnotator(TransformComponent):
+    """Transformation which applies `annotate_chunks()` to parsed nodes."""
+
+    def __call__(self, nodes: Sequence[BaseNode], **kwargs: Any) -> Sequence[BaseNode]:
+        return annotate_chunks(nodes)
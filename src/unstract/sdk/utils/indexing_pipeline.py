@@ -0,0 +1,218 @@
+import logging
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from llama_index.core.node_parser import NodeParser
+from llama_index.core.schema import (
+    BaseNode,
+    Document,
+    MetadataMode,
+    TransformComponent,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    DEFAULT_MAX_PENDING_BATCHES = 4
+    DEFAULT_UPSERT_BATCH_SIZE = 256
+    QUEUE_POLL_INTERVAL = 0.1
+
+
+# Marks the end of a stage's output
+_END_OF_STAGE = object()
+
+
+class IndexingPipeline:
+    """Splits, embeds and upserts documents in overlapping stages.
+
+    Each stage runs on its own thread and hands work to the next one through
+    a bounded queue:
+
+        split -> [embed queue] -> embed -> [upsert queue] -> upsert
+
+    This lets network bound embedding calls of a batch overlap with the
+    network bound vector DB writes of the previous batch, while the bounded
+    queues apply backpressure so that at most a few batches wait to be
+    embedded or written. Documents are split one at a time by the parser,
+    which returns all the nodes of a document at once, so those are held in
+    memory until they are queued.
+    The first error raised by any stage stops the pipeline and is re-raised
+    to the caller.
+    """
+
+    def __init__(
+        self,
+        parser: NodeParser,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        upsert_fn: Callable[[list[BaseNode]], Any],
+        embed_batch_size: int,
+        max_pending_batches: int = Constants.DEFAULT_MAX_PENDING_BATCHES,
+        upsert_batch_size: int = Constants.DEFAULT_UPSERT_BATCH_SIZE,
+        transformations: Sequence[TransformComponent] = (),
+    ) -> None:
+        """Creates a pipeline for indexing documents.
+
+        Args:
+            parser (NodeParser): Parser used to split documents into nodes
+            embed_fn (Callable[[list[str]], list[list[float]]]): Embeds a batch
+                of texts, typically `BaseEmbedding.get_text_embedding_batch`
+            upsert_fn (Callable[[list[BaseNode]], Any]): Writes embedded nodes
+                to the vector DB
+            embed_batch_size (int): Number of nodes sent per embedding call
+            max_pending_batches (int, optional): Capacity of each inter-stage
+                queue in batches. Defaults to 4.
+            upsert_batch_size (int, optional): Maximum number of nodes written
+                per upsert. Already embedded batches waiting in the queue are
+                coalesced up to this size. Defaults to 256.
+            transformations (Sequence[TransformComponent], optional): Applied
+                in order to the nodes of each document after it is split.
+                Defaults to ().
+        """
+        if embed_batch_size < 1:
+            raise ValueError("`embed_batch_size` must be at least 1")
+        if max_pending_batches < 1:
+            raise ValueError("`max_pending_batches` must be at least 1")
+        self._parser = parser
+        self._embed_fn = embed_fn
+        self._upsert_fn = upsert_fn
+        self._embed_batch_size = embed_batch_size
+        self._max_pending_batches = max_pending_batches
+        self._upsert_batch_size = max(upsert_batch_size, embed_batch_size)
+        self._transformations = list(transformations)
+        self._stop = threading.Event()
+        self._errors: list[Exception] = []
+
+    def run(self, documents: Sequence[Document]) -> int:
+        """Runs the documents through all the stages.
+
+        Args:
+            documents (Sequence[Document]): Documents to index
+
+        Returns:
+            int: Number of nodes written to the vector DB
+        """
+        self._stop.clear()
+        self._errors = []
+        embed_queue: queue.Queue = queue.Queue(maxsize=self._max_pending_batches)
+        upsert_queue: queue.Queue = queue.Queue(maxsize=self._max_pending_batches)
+        stages = [
+            threading.Thread(
+                target=self._split_stage,
+                args=(documents, embed_queue),
+                name="indexing-split",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._embed_stage,
+                args=(embed_queue, upsert_queue),
+                name="indexing-embed",
+                daemon=True,
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+        # Upserts happen on the caller's thread
+        try:
+            node_count = self._upsert_stage(upsert_queue)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._stop.set()
+            for stage in stages:
+                stage.join()
+
+        if self._errors:
+            raise self._errors[0]
+        logger.info(f"Indexed {node_count} node(s) through the pipeline")
+        return node_count
+
+    def _fail(self, e: Exception) -> None:
+        self._errors.append(e)
+        self._stop.set()
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """Blocks until the item is queued or the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=Constants.QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: queue.Queue) -> Any:
+        """Blocks until an item is available or the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=Constants.QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END_OF_STAGE
+
+    def _split_stage(self, documents: Sequence[Document], out_q: queue.Queue) -> None:
+        try:
+            batch: list[BaseNode] = []
+            for document in documents:
+                nodes = self._parser.get_nodes_from_documents([document])
+                for transformation in self._transformations:
+                    nodes = transformation(nodes)
+                for node in nodes:
+                    batch.append(node)
+                    if len(batch) < self._embed_batch_size:
+                        continue
+                    if not self._put(out_q, batch):
+                        return
+                    batch = []
+            if batch:
+                self._put(out_q, batch)
+        except Exception as e:
+            logger.error(f"Error while splitting documents: {e}")
+            self._fail(e)
+        finally:
+            self._put(out_q, _END_OF_STAGE)
+
+    def _embed_stage(self, in_q: queue.Queue, out_q: queue.Queue) -> None:
+        try:
+            while True:
+                batch = self._get(in_q)
+                if batch is _END_OF_STAGE:
+                    break
+                texts = [
+                    node.get_content(metadata_mode=MetadataMode.EMBED)
+                    for node in batch
+                ]
+                embeddings = self._embed_fn(texts)
+                for node, node_embedding in zip(batch, embeddings, strict=True):
+                    node.embedding = node_embedding
+                if not self._put(out_q, batch):
+                    return
+        except Exception as e:
+            logger.error(f"Error while embedding nodes: {e}")
+            self._fail(e)
+        finally:
+            self._put(out_q, _END_OF_STAGE)
+
+    def _upsert_stage(self, in_q: queue.Queue) -> int:
+        node_count = 0
+        end_reached = False
+        while not end_reached:
+            batch = self._get(in_q)
+            if batch is _END_OF_STAGE:
+                break
+            nodes = list(batch)
+            # Coalesce batches which are already embedded to save round trips
+            while len(nodes) < self._upsert_batch_size:
+                try:
+                    pending = in_q.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is _END_OF_STAGE:
+                    end_reached = True
+                    break
+                nodes.extend(pending)
+            self._upsert_fn(nodes)
+            node_count += len(nodes)
+        return node_count
@@ -37,11 +37,14 @@ class IndexingUtils:
         # Whole adapter config is used currently even though it contains some keys
         # which might not be relevant to indexing. This is easier for now than
         # marking certain keys of the adapter config as necessary.
+        adapter_configs = ToolAdapter.get_adapter_configs(
+            tool, [vector_db, embedding, x2text]
+        )
         index_key = {
             "file_hash": file_hash,
-            "vector_db_config": ToolAdapter.get_adapter_config(tool, vector_db),
-            "embedding_config": ToolAdapter.get_adapter_config(tool, embedding),
-            "x2text_config": ToolAdapter.get_adapter_config(tool, x2text),
+            "vector_db_config": adapter_configs[vector_db],
+            "embedding_config": adapter_configs[embedding],
+            "x2text_config": adapter_configs[x2text],
             # Typed and hashed as strings since the final hash is persisted
             # and this is required to be backward compatible
             "chunk_size": str(chunk_size),
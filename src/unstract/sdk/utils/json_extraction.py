@@ -0,0 +1,268 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+OPENERS = {"{": "}", "[": "]"}
+_OPENER = re.compile(r"[{\[]")
+_STRUCTURE = re.compile(r'[{}\[\]"]')
+# Rest of a string after its opening quote, skipping escaped characters
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def strip_selection_marker(text: str, marker: str) -> str:
+    """Narrows text down to what lies between selection markers.
+
+    Everything before the first marker and after the last one is dropped,
+    a missing marker leaves that side of the text as is.
+    """
+    start = text.find(marker)
+    if start != -1:
+        text = text[start + len(marker) :].lstrip()
+    end = text.rfind(marker)
+    if end != -1:
+        text = text[:end].rstrip()
+    return text
+
+
+def _find_balanced_end(text: str, start: int) -> int:
+    """Finds the end of the JSON value opened at `start`.
+
+    Brackets inside strings are ignored, honouring escapes.
+
+    Returns:
+        int: Index of the closing bracket, -1 if the brackets aren't balanced
+    """
+    expected = [OPENERS[text[start]]]
+    position = start + 1
+    while match := _STRUCTURE.search(text, position):
+        char = match.group()
+        if char == '"':
+            string_rest = _STRING_REST.match(text, match.end())
+            if not string_rest:
+                return -1
+            position = string_rest.end()
+            continue
+        position = match.end()
+        if char in OPENERS:
+            expected.append(OPENERS[char])
+        elif char != expected.pop():
+            return -1
+        elif not expected:
+            return match.start()
+    return -1
+
+
+def _find_greedy(text: str) -> str | None:
+    r"""Matches from the first opener to the last closer of the same kind.
+
+    Same as the regex `\[(?:.|\n)*\]|\{(?:.|\n)*\}` previously used,
+    in linear time. Used for text whose brackets don't balance, such as a
+    truncated completion.
+    """
+    last_closer = {"{": text.rfind("}"), "[": text.rfind("]")}
+    for opener in _OPENER.finditer(text):
+        end = last_closer[opener.group()]
+        if end > opener.start():
+            return text[opener.start() : end + 1]
+    return None
+
+
+def extract_json(text: str, selection_marker: str | None = None) -> str | None:
+    """Extracts the JSON object or array in a text, such as an LLM's reply.
+
+    Runs in time linear to the length of the text. The text is first parsed
+    as a whole, which is the common case of a reply that's only JSON.
+    Else the text is scanned for balanced `{...}` / `[...]` spans, aware of
+    strings and escapes, and the first span that parses as JSON is returned,
+    else the first balanced span. If no span balances, the text from the
+    first opening bracket to the last matching closing bracket is returned.
+
+    Args:
+        text (str): Text to extract JSON from
+        selection_marker (Optional[str], optional): If the text contains this
+            marker, only the text between the first and last occurrence is
+            considered. Defaults to None.
+
+    Returns:
+        Optional[str]: Extracted JSON text, None if the text has none
+    """
+    if selection_marker:
+        text = strip_selection_marker(text, selection_marker)
+
+    stripped = text.strip()
+    if stripped[:1] in OPENERS:
+        try:
+            json.loads(stripped)
+            return stripped
+        except ValueError:
+            pass
+
+    first_balanced = None
+    opener = _OPENER.search(text)
+    while opener:
+        end = _find_balanced_end(text, opener.start())
+        if end == -1:
+            # Rescanning from the brackets within would be quadratic
+            break
+        candidate = text[opener.start() : end + 1]
+        try:
+            json.loads(candidate)
+            return candidate
+        except ValueError:
+            first_balanced = first_balanced or candidate
+        opener = _OPENER.search(text, end + 1)
+    if first_balanced is not None:
+        return first_balanced
+    return _find_greedy(text)
+
+
+@dataclass
+class PartialJson:
+    """JSON value parsed so far from a streamed text.
+
+    Attributes:
+        text (str): Text received so far
+        json_text (Optional[str]): Text of the JSON value received so far
+        value (Any): JSON value parsed so far, with open strings, arrays and
+            objects closed. None until the first member is received.
+        complete (bool): Whether the top-level value is closed
+    """
+
+    text: str
+    json_text: str | None = None
+    value: Any = None
+    complete: bool = False
+
+
+class IncrementalJsonParser:
+    """Parses a JSON value as its text is streamed in chunks.
+
+    The value starts at the first `{` or `[` received. Strings and escapes
+    are tracked across chunks, so feeding text costs time linear to its
+    length. Partial values are parsed by closing what's open, else by
+    cutting the text back to the last complete member.
+    """
+
+    def __init__(self) -> None:
+        """Creates a parser waiting for a JSON value to start."""
+        self._chunks: list[str] = []
+        self._json_chunks: list[str] = []
+        self._json_length = 0
+        self._expected: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._complete = False
+        # Length of the JSON text it can be cut at and the closers to append
+        self._cut: tuple[int, str] | None = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._json_chunks)
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    @property
+    def json_text(self) -> str | None:
+        return "".join(self._json_chunks) if self.started else None
+
+    def _set_cut(self, length: int) -> None:
+        self._cut = (length, "".join(reversed(self._expected)))
+
+    def feed(self, chunk: str) -> bool:
+        """Feeds the next chunk of text.
+
+        Text after the top-level value closes is kept in `text` but not
+        parsed.
+
+        Args:
+            chunk (str): Next chunk of the streamed text
+
+        Returns:
+            bool: Whether a member of the value completed, or the value
+                started or closed, that is whether `partial()` has changed
+        """
+        self._chunks.append(chunk)
+        if self._complete:
+            return False
+        start = 0
+        changed = False
+        if not self.started:
+            opener = _OPENER.search(chunk)
+            if not opener:
+                return False
+            start = opener.start()
+            self._expected.append(OPENERS[opener.group()])
+            self._set_cut(1)
+            changed = True
+        # Characters before `scan_from` were already accounted for
+        scan_from = start + 1 if not self.started else 0
+        offset = self._json_length - start
+        end = len(chunk)
+        for index in range(scan_from, len(chunk)):
+            # Length of the JSON text up to and including this character
+            member_changed = self._scan(chunk[index], offset + index + 1)
+            changed = changed or member_changed
+            if self._complete:
+                end = index + 1
+                break
+        json_chunk = chunk[start:end]
+        self._json_chunks.append(json_chunk)
+        self._json_length += len(json_chunk)
+        return changed
+
+    def _scan(self, char: str, length: int) -> bool:
+        """Updates the state with the next character of the JSON text.
+
+        Returns:
+            bool: Whether a member of the value completed or the value closed
+        """
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+            return False
+        if char == '"':
+            self._in_string = True
+        elif char in OPENERS:
+            self._expected.append(OPENERS[char])
+            self._set_cut(length)
+        elif char == "}" or char == "]":
+            self._expected.pop()
+            if not self._expected:
+                self._complete = True
+            else:
+                self._set_cut(length)
+            return True
+        elif char == ",":
+            self._set_cut(length - 1)
+            return True
+        return False
+
+    def partial(self) -> PartialJson:
+        """Parses the value received so far."""
+        json_text = self.json_text
+        result = PartialJson(text=self.text, json_text=json_text, complete=self._complete)
+        if json_text is None:
+            return result
+        closers = "".join(reversed(self._expected))
+        candidates = [json_text + ('"' if self._in_string else "") + closers]
+        if self._cut and not self._complete:
+            length, cut_closers = self._cut
+            candidates.append(json_text[:length] + cut_closers)
+        for candidate in candidates:
+            try:
+                result.value = json.loads(candidate)
+                break
+            except ValueError:
+                continue
+        return result
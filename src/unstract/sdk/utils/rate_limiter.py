@@ -0,0 +1,319 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from redis.exceptions import WatchError
+
+from unstract.sdk.utils.cache_backends import create_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    REQUESTS_PER_MINUTE = "requests_per_minute"
+    TOKENS_PER_MINUTE = "tokens_per_minute"
+    REQUESTS = "requests"
+    TOKENS = "tokens"
+    # Selects the backend shared by adapters, "memory" or "redis"
+    BACKEND = "RATE_LIMIT_BACKEND"
+    MEMORY_BACKEND = "memory"
+    REDIS_BACKEND = "redis"
+    REDIS_KEY_PREFIX = "unstract_rate_limit"
+    # Buckets idle for this long are full again, so they can be dropped
+    REDIS_KEY_TTL = 120
+    # Rough ratio of characters to tokens of English text for GPT tokenizers
+    CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimates the tokens of a text to reserve rate limit capacity."""
+    return max(len(text) // Constants.CHARS_PER_TOKEN, 1)
+
+
+def _take(
+    level: float | None,
+    updated_at: float | None,
+    now: float,
+    capacity: float,
+    refill_rate: float,
+    amount: float,
+) -> tuple[float, float]:
+    """Takes `amount` from a token bucket, if available.
+
+    Args:
+        level (Optional[float]): Level of the bucket when last updated, full
+            if None
+        updated_at (Optional[float]): When the bucket was last updated
+        now (float): Current time
+        capacity (float): Size of the bucket
+        refill_rate (float): Units added to the bucket per second
+        amount (float): Units to take
+
+    Returns:
+        tuple[float, float]: New level of the bucket and the seconds to wait
+            before retrying, 0 if `amount` was taken
+    """
+    if level is None or updated_at is None:
+        level = capacity
+    else:
+        level = min(capacity, level + max(now - updated_at, 0) * refill_rate)
+    # A request larger than the bucket would never fit, let it drain the bucket
+    amount = min(amount, capacity)
+    if level >= amount:
+        return level - amount, 0.0
+    return level, (amount - level) / refill_rate
+
+
+class RateLimitBackend(ABC):
+    """Store of token buckets used by `RateLimiter`.
+
+    Taking from a bucket is atomic, so a backend can be shared across
+    threads, and across processes if it's remote.
+    """
+
+    @abstractmethod
+    def take(
+        self, key: str, capacity: float, refill_rate: float, amount: float
+    ) -> float:
+        """Takes `amount` from a bucket, if available.
+
+        Args:
+            key (str): Key of the bucket
+            capacity (float): Size of the bucket, which starts full
+            refill_rate (float): Units added to the bucket per second
+            amount (float): Units to take
+
+        Returns:
+            float: Seconds to wait before retrying, 0 if `amount` was taken
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets in memory, limiting the threads of a process."""
+
+    def __init__(self) -> None:
+        """Creates an empty store."""
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def take(
+        self, key: str, capacity: float, refill_rate: float, amount: float
+    ) -> float:
+        with self._lock:
+            now = time.monotonic()
+            level, updated_at = self._buckets.get(key, (None, None))
+            level, wait = _take(level, updated_at, now, capacity, refill_rate, amount)
+            self._buckets[key] = (level, now)
+            return wait
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets in Redis, limiting all the workers using it.
+
+    Buckets are updated in an optimistic transaction against Redis' clock,
+    so that workers on different hosts agree on the time. The client needs
+    the `pipeline` of `redis.Redis`.
+    """
+
+    def __init__(
+        self, client: Any, key_prefix: str = Constants.REDIS_KEY_PREFIX
+    ) -> None:
+        """Creates a store on top of a Redis client.
+
+        Args:
+            client (Any): Redis client
+            key_prefix (str, optional): Prefix for the keys holding buckets.
+                Defaults to "unstract_rate_limit".
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_env(
+        cls, key_prefix: str = Constants.REDIS_KEY_PREFIX
+    ) -> "RedisRateLimitBackend":
+        """Creates a store for the Redis configured in the environment.
+
+        See `create_redis_client()`.
+        """
+        return cls(client=create_redis_client(), key_prefix=key_prefix)
+
+    def take(
+        self, key: str, capacity: float, refill_rate: float, amount: float
+    ) -> float:
+        redis_key = f"{self._key_prefix}:{key}"
+        while True:
+            with self._client.pipeline() as pipeline:
+                try:
+                    pipeline.watch(redis_key)
+                    seconds, microseconds = pipeline.time()
+                    now = seconds + microseconds / 1e6
+                    bucket = {
+                        k.decode() if isinstance(k, bytes) else k: float(v)
+                        for k, v in pipeline.hgetall(redis_key).items()
+                    }
+                    level, wait = _take(
+                        bucket.get("level"),
+                        bucket.get("updated_at"),
+                        now,
+                        capacity,
+                        refill_rate,
+                        amount,
+                    )
+                    pipeline.multi()
+                    pipeline.hset(redis_key, mapping={"level": level, "updated_at": now})
+                    pipeline.expire(redis_key, Constants.REDIS_KEY_TTL)
+                    pipeline.execute()
+                    return wait
+                except WatchError:
+                    # Another worker updated the bucket, retry with its level
+                    continue
+
+
+_default_backend: RateLimitBackend | None = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend() -> RateLimitBackend:
+    """Gets the process-wide backend selected by RATE_LIMIT_BACKEND."""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            backend = os.environ.get(Constants.BACKEND, Constants.MEMORY_BACKEND)
+            if backend.lower() == Constants.REDIS_BACKEND:
+                _default_backend = RedisRateLimitBackend.from_env()
+            else:
+                _default_backend = MemoryRateLimitBackend()
+        return _default_backend
+
+
+def _get_limit(metadata: dict[str, Any], key: str) -> float | None:
+    value = metadata.get(key)
+    if value in (None, ""):
+        return None
+    try:
+        limit = float(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid rate limit {key}: {value}")
+        return None
+    return limit if limit > 0 else None
+
+
+class RateLimiter:
+    """Client-side rate limiter of an adapter instance.
+
+    Limits requests and tokens per minute with a token bucket each. The
+    buckets start full, allowing a minute's worth of burst, and refill
+    continuously. Callers acquire capacity before calling the provider and
+    wait when there's none, instead of being rejected with a 429. With a
+    Redis backend the limits apply across all workers.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        backend: RateLimitBackend,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Creates a rate limiter.
+
+        Args:
+            key (str): Identifies the limited resource, such as the adapter
+                instance ID
+            backend (RateLimitBackend): Store of the buckets
+            requests_per_minute (Optional[float], optional): Requests allowed
+                per minute, unlimited if None. Defaults to None.
+            tokens_per_minute (Optional[float], optional): Tokens allowed per
+                minute, unlimited if None. Defaults to None.
+            sleep (Callable[[float], None], optional): Used to wait for
+                capacity. Defaults to time.sleep.
+        """
+        self._key = key
+        self._backend = backend
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._sleep = sleep
+
+    @classmethod
+    def from_adapter(
+        cls, adapter_instance_id: str, adapter_metadata: dict[str, Any] | None
+    ) -> "RateLimiter | None":
+        """Creates a rate limiter from the limits set on an adapter.
+
+        Args:
+            adapter_instance_id (str): UUID of the adapter
+            adapter_metadata (Optional[dict[str, Any]]): Adapter's metadata,
+                read for `requests_per_minute` and `tokens_per_minute`
+
+        Returns:
+            Optional[RateLimiter]: Rate limiter on the default backend, None
+                if the adapter has no limits
+        """
+        metadata = adapter_metadata or {}
+        requests_per_minute = _get_limit(metadata, Constants.REQUESTS_PER_MINUTE)
+        tokens_per_minute = _get_limit(metadata, Constants.TOKENS_PER_MINUTE)
+        if not requests_per_minute and not tokens_per_minute:
+            return None
+        return cls(
+            key=adapter_instance_id,
+            backend=get_default_backend(),
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+
+    def _get_buckets(self, tokens: int) -> list[tuple[str, float, float]]:
+        buckets = []
+        if self._requests_per_minute:
+            buckets.append((Constants.REQUESTS, self._requests_per_minute, 1))
+        if self._tokens_per_minute and tokens:
+            buckets.append((Constants.TOKENS, self._tokens_per_minute, tokens))
+        return buckets
+
+    def _take(self, bucket: str, per_minute: float, amount: float) -> float:
+        return self._backend.take(
+            key=f"{self._key}:{bucket}",
+            capacity=per_minute,
+            refill_rate=per_minute / 60,
+            amount=amount,
+        )
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Waits until a request of `tokens` tokens is allowed.
+
+        Args:
+            tokens (int, optional): Tokens the request is expected to use.
+                Defaults to 0.
+
+        Returns:
+            float: Seconds waited
+        """
+        waited = 0.0
+        for bucket, per_minute, amount in self._get_buckets(tokens):
+            while wait := self._take(bucket, per_minute, amount):
+                self._sleep(wait)
+                waited += wait
+        if waited:
+            logger.info(f"Rate limited {self._key} for {waited:.2f}s")
+        return waited
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async version of `acquire()`.
+
+        The backend is called in a thread, since a Redis round trip would
+        otherwise block the event loop.
+        """
+        waited = 0.0
+        for bucket, per_minute, amount in self._get_buckets(tokens):
+            while wait := await asyncio.to_thread(self._take, bucket, per_minute, amount):
+                await asyncio.sleep(wait)
+                waited += wait
+        if waited:
+            logger.info(f"Rate limited {self._key} for {waited:.2f}s")
+        return waited
@@ -1,6 +1,8 @@
 """Generic retry utilities with custom exponential backoff implementation."""
 
+import asyncio
 import errno
+import inspect
 import logging
 import os
 import random
@@ -9,6 +11,7 @@ from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
+import httpx
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,7 @@ def is_retryable_error(error: Exception) -> bool:
 
     Handles:
     - ConnectionError and Timeout from requests
+    - TransportError and HTTPStatusError with the same status codes from httpx
     - HTTPError with status codes 502, 503, 504
     - OSError with specific errno codes (ECONNREFUSED, ECONNRESET, etc.)
 
@@ -32,6 +36,13 @@ def is_retryable_error(error: Exception) -> bool:
     if isinstance(error, (ConnectionError, Timeout)):
         return True
 
+    # httpx connection, timeout and network errors, raised by async clients
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code in [502, 503, 504]:
+            return True
+
     # HTTP errors with specific status codes
     if isinstance(error, HTTPError):
         if hasattr(error, "response") and error.response is not None:
@@ -113,96 +124,105 @@ def retry_with_exponential_backoff(
         Decorator function
     """
 
+    def get_delay(func: Callable, attempt: int, start_time: float, e: Exception) -> float:
+        """Gets the delay before retrying a failed attempt.
+
+        Re-raises the error being handled if it shouldn't be retried.
+        """
+        # Check if the error should trigger a retry
+        # First check if it's in the allowed exception types (already caught)
+        # Then check using the predicate if provided
+        should_retry = True
+        if retry_predicate is not None:
+            should_retry = retry_predicate(e)
+
+        # Check if we've exceeded max time
+        elapsed_time = time.time() - start_time
+        if elapsed_time >= max_time:
+            logger_instance.exception(
+                "Giving up '%s' after %.1fs (max time exceeded): %s",
+                func.__name__,
+                elapsed_time,
+                e,
+            )
+            raise
+
+        # If not retryable or last attempt, raise the error
+        if not should_retry or attempt == max_retries:
+            if attempt > 0:
+                logger_instance.exception(
+                    "Giving up '%s' after %d attempt(s) for %s",
+                    func.__name__,
+                    attempt + 1,
+                    prefix,
+                )
+            raise
+
+        # Calculate delay for next retry
+        delay = calculate_delay(attempt, base_delay, multiplier, max_time, jitter)
+
+        # Ensure we don't exceed max_time with the delay
+        remaining_time = max_time - elapsed_time
+        if delay >= remaining_time:
+            logger_instance.exception(
+                "Giving up '%s' - next delay %.1fs would exceed max time %.1fs",
+                func.__name__,
+                delay,
+                max_time,
+            )
+            raise
+
+        # Log retry attempt
+        logger_instance.warning(
+            "Retry %d/%d for %s: %s (waiting %.1fs)",
+            attempt + 1,
+            max_retries,
+            prefix,
+            e,
+            delay,
+        )
+        return delay
+
+    def log_success(func: Callable, attempt: int) -> None:
+        # If successful and we had retried, log success
+        if attempt > 0:
+            logger_instance.info(
+                "Successfully completed '%s' after %d retry attempt(s)",
+                func.__name__,
+                attempt,
+            )
+
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start_time = time.time()
+                for attempt in range(max_retries + 1):  # +1 for initial attempt
+                    try:
+                        result = await func(*args, **kwargs)
+                        log_success(func, attempt)
+                        return result
+                    except exceptions as e:
+                        delay = get_delay(func, attempt, start_time, e)
+                    # Wait before retrying, without blocking the event loop
+                    await asyncio.sleep(delay)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             start_time = time.time()
-            last_exception = None
-
             for attempt in range(max_retries + 1):  # +1 for initial attempt
                 try:
                     # Try to execute the function
                     result = func(*args, **kwargs)
-
-                    # If successful and we had retried, log success
-                    if attempt > 0:
-                        logger_instance.info(
-                            "Successfully completed '%s' after %d retry attempt(s)",
-                            func.__name__,
-                            attempt,
-                        )
-
+                    log_success(func, attempt)
                     return result
-
                 except exceptions as e:
-                    last_exception = e
-
-                    # Check if the error should trigger a retry
-                    # First check if it's in the allowed exception types (already caught)
-                    # Then check using the predicate if provided
-                    should_retry = True
-                    if retry_predicate is not None:
-                        should_retry = retry_predicate(e)
-
-                    # Check if we've exceeded max time
-                    elapsed_time = time.time() - start_time
-                    if elapsed_time >= max_time:
-                        logger_instance.exception(
-                            "Giving up '%s' after %.1fs (max time exceeded): %s",
-                            func.__name__,
-                            elapsed_time,
-                            e,
-                        )
-                        raise
-
-                    # If not retryable or last attempt, raise the error
-                    if not should_retry or attempt == max_retries:
-                        if attempt > 0:
-                            logger_instance.exception(
-                                "Giving up '%s' after %d attempt(s) for %s",
-                                func.__name__,
-                                attempt + 1,
-                                prefix,
-                            )
-                        raise
-
-                    # Calculate delay for next retry
-                    delay = calculate_delay(
-                        attempt, base_delay, multiplier, max_time, jitter
-                    )
-
-                    # Ensure we don't exceed max_time with the delay
-                    remaining_time = max_time - elapsed_time
-                    if delay >= remaining_time:
-                        logger_instance.exception(
-                            "Giving up '%s' - next delay %.1fs would exceed max time %.1fs",
-                            func.__name__,
-                            delay,
-                            max_time,
-                        )
-                        raise
-
-                    # Log retry attempt
-                    logger_instance.warning(
-                        "Retry %d/%d for %s: %s (waiting %.1fs)",
-                        attempt + 1,
-                        max_retries,
-                        prefix,
-                        e,
-                        delay,
-                    )
-
-                    # Wait before retrying
-                    time.sleep(delay)
-
-                except Exception as e:
-                    # Exception not in the exceptions tuple - don't retry
-                    last_exception = e
-                    raise
-
-            # This should never be reached, but just in case
-            if last_exception:
-                raise last_exception
+                    delay = get_delay(func, attempt, start_time, e)
+                # Wait before retrying
+                time.sleep(delay)
 
         return wrapper
 
@@ -221,6 +241,7 @@ def create_retry_decorator(
         prefix: Environment variable prefix for configuration
         exceptions: Tuple of exception types to retry on.
                    Defaults to (ConnectionError, HTTPError, Timeout, OSError)
+                   and httpx's TransportError and HTTPStatusError
         retry_predicate: Optional callable to determine if exception should trigger retry.
                         If only exceptions list provided, retry on those exceptions.
                         If only predicate provided, use predicate (catch all exceptions).
@@ -240,7 +261,14 @@ def create_retry_decorator(
     # Handle different combinations of exceptions and predicate
     if exceptions is None and retry_predicate is None:
         # Default case: use specific exceptions with is_retryable_error predicate
-        exceptions = (ConnectionError, HTTPError, Timeout, OSError)
+        exceptions = (
+            ConnectionError,
+            HTTPError,
+            Timeout,
+            OSError,
+            httpx.TransportError,
+            httpx.HTTPStatusError,
+        )
         retry_predicate = is_retryable_error
     elif exceptions is None and retry_predicate is not None:
         # Only predicate provided: catch all exceptions and use predicate
@@ -14,12 +14,13 @@ class TokenCounter:
     total_llm_token_count: int = 0
     total_embedding_token_count: int = 0
 
-    def __init__(self, input_tokens, output_tokens):
+    def __init__(self, input_tokens, output_tokens, embedding_tokens=0):
         self.prompt_llm_token_count = input_tokens
         self.completion_llm_token_count = output_tokens
         self.total_llm_token_count = (
             self.prompt_llm_token_count + self.completion_llm_token_count
         )
+        self.total_embedding_token_count = embedding_tokens
 
     # TODO: Add unit test cases for the following function
     #  for ease of manintenance
@@ -55,7 +56,9 @@ class TokenCounter:
         prompt_tokens, completion_tokens = 0, 0
         if isinstance(response, CompletionResponse) or isinstance(response, ChatResponse):
             raw_response = response.raw
-            if not isinstance(raw_response, dict):
+            if raw_response is None:
+                raw_response = {}
+            elif not isinstance(raw_response, dict):
                 raw_response = dict(raw_response)
 
             usage = raw_response.get("usage", None)
@@ -66,7 +69,7 @@ class TokenCounter:
             ):
                 usage = response.additional_kwargs
             elif hasattr(response, "raw"):
-                completion_raw = response.raw
+                completion_raw = response.raw or {}
                 if ("_raw_response" in completion_raw) and hasattr(
                     completion_raw["_raw_response"], "usage_metadata"
                 ):
@@ -84,7 +87,7 @@ class TokenCounter:
                                 completion_tokens = result.get("tokenCount", 0)
                     return prompt_tokens, completion_tokens
                 else:
-                    usage = response.raw
+                    usage = completion_raw
             else:
                 usage = response
 
@@ -0,0 +1,285 @@
+import base64
+import hashlib
+import logging
+import os
+import threading
+import types
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+
+import numpy as np
+import tiktoken
+from tiktoken.load import read_file
+from tiktoken_ext import openai_public
+
+logger = logging.getLogger(__name__)
+
+
+class Constants:
+    # Encoding of models unknown to tiktoken, such as non OpenAI ones
+    FALLBACK_MODEL = "gpt-3.5-turbo"
+    # Batches smaller than this are counted on the calling thread
+    MIN_PARALLEL_BATCH = 16
+    DEFAULT_NUM_THREADS = 8
+    # Directory encodings are read from, named as tiktoken's cache
+    CACHE_DIR_ENV = "TIKTOKEN_CACHE_DIR"
+    # Download encodings which aren't cached, instead of estimating tokens
+    DOWNLOAD_ENV = "TOKENIZER_DOWNLOAD"
+    BUNDLED_CACHE_DIR = "static/tiktoken"
+    # Rough ratio of characters to tokens, used when no encoding is available
+    CHARS_PER_TOKEN = 4
+
+
+# Files of the encodings used by OpenAI models, as named in tiktoken's cache
+ENCODING_URLS = {
+    "cl100k_base": (
+        "https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken"
+    ),
+    "o200k_base": (
+        "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+    ),
+    "p50k_base": (
+        "https://openaipublic.blob.core.windows.net/encodings/p50k_base.tiktoken"
+    ),
+    "r50k_base": (
+        "https://openaipublic.blob.core.windows.net/encodings/r50k_base.tiktoken"
+    ),
+}
+
+
+class EstimatedEncoding:
+    """Stands in for an encoding which can't be loaded, such as offline.
+
+    Yields one placeholder token per `CHARS_PER_TOKEN` characters, which is
+    only meant for counting tokens.
+    """
+
+    name = "estimated"
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        return [0] * self._count(text)
+
+    def encode_to_numpy(self, text: str, **kwargs: object) -> np.ndarray:
+        return np.zeros(self._count(text), dtype=np.uint32)
+
+    @staticmethod
+    def _count(text: str) -> int:
+        return -(-len(text) // Constants.CHARS_PER_TOKEN)
+
+
+Encoding = tiktoken.Encoding | EstimatedEncoding
+
+# Encodings by model name and by encoding name
+_encodings: dict[str, Encoding] = {}
+_encodings_by_name: dict[str, Encoding] = {}
+_encodings_lock = threading.RLock()
+
+
+def is_download_enabled() -> bool:
+    return os.environ.get(Constants.DOWNLOAD_ENV, "").lower() in ("1", "true", "yes")
+
+
+def get_cache_dir() -> str:
+    """Gets the directory encodings are read from.
+
+    That's TIKTOKEN_CACHE_DIR if set, else the directory bundled with the SDK,
+    filled by the `unstract-tiktoken-cache` command when building an image.
+    """
+    cache_dir = os.environ.get(Constants.CACHE_DIR_ENV)
+    if cache_dir:
+        return cache_dir
+    return str(files("unstract.sdk").joinpath(Constants.BUNDLED_CACHE_DIR))
+
+
+def get_cache_path(encoding_name: str, cache_dir: str | None = None) -> str | None:
+    """Gets the file tiktoken caches an encoding in, None if it's unknown."""
+    url = ENCODING_URLS.get(encoding_name)
+    if url is None:
+        return None
+    cache_key = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(cache_dir or get_cache_dir(), cache_key)
+
+
+def _download(encoding_name: str, cache_path: str) -> None:
+    """Downloads the file of an encoding into its cache path."""
+    data = read_file(ENCODING_URLS[encoding_name])
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, cache_path)
+
+
+def _read_encoding(encoding_name: str, cache_path: str) -> tiktoken.Encoding:
+    """Builds an encoding from its cached file.
+
+    tiktoken's constructor of the encoding is run with its loader swapped
+    for one reading `cache_path`, since tiktoken would otherwise look the
+    file up in TIKTOKEN_CACHE_DIR and download it if missing.
+    """
+
+    def load_cached_bpe(url: str, expected_hash: str | None = None) -> dict[bytes, int]:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if expected_hash and hashlib.sha256(data).hexdigest() != expected_hash:
+            raise ValueError(f"{cache_path} doesn't match the hash of {url}")
+        return {
+            base64.b64decode(token): int(rank)
+            for token, rank in (line.split() for line in data.splitlines() if line)
+        }
+
+    constructor = openai_public.ENCODING_CONSTRUCTORS[encoding_name]
+    constructor = types.FunctionType(
+        constructor.__code__,
+        {**constructor.__globals__, "load_tiktoken_bpe": load_cached_bpe},
+    )
+    return tiktoken.Encoding(**constructor())
+
+
+def _load_encoding(encoding_name: str) -> Encoding:
+    """Loads an encoding from the cache directory.
+
+    An encoding missing from the directory is downloaded into it only if
+    TOKENIZER_DOWNLOAD is set. If it can't be loaded, tokens are estimated.
+    """
+    cache_dir = get_cache_dir()
+    cache_path = get_cache_path(encoding_name, cache_dir)
+    if cache_path is None:
+        logger.warning(f"Unknown encoding '{encoding_name}', estimating tokens instead")
+        return EstimatedEncoding()
+    try:
+        if not os.path.exists(cache_path):
+            if not is_download_enabled():
+                logger.warning(
+                    f"Encoding '{encoding_name}' isn't cached in {cache_dir}, "
+                    "estimating tokens instead"
+                )
+                return EstimatedEncoding()
+            _download(encoding_name, cache_path)
+        return _read_encoding(encoding_name, cache_path)
+    except (OSError, ValueError) as e:
+        # Includes network errors, which are raised by requests as OSError
+        logger.warning(
+            f"Unable to load encoding '{encoding_name}', estimating tokens "
+            f"instead: {e}"
+        )
+        return EstimatedEncoding()
+
+
+def _get_encoding_by_name(encoding_name: str) -> Encoding:
+    with _encodings_lock:
+        if encoding_name not in _encodings_by_name:
+            _encodings_by_name[encoding_name] = _load_encoding(encoding_name)
+        return _encodings_by_name[encoding_name]
+
+
+def get_encoding(model_name: str | None = None) -> Encoding:
+    """Gets the tiktoken encoding of a model, loading it once per process.
+
+    Models unknown to tiktoken share the encoding of "gpt-3.5-turbo", which
+    is close enough to estimate their usage. Encodings are read from the
+    cache directory, see `get_cache_dir()`.
+
+    Args:
+        model_name (Optional[str], optional): Name of the model. Defaults to
+            None, for the fallback encoding.
+
+    Returns:
+        Encoding: Encoding of the model
+    """
+    model_name = model_name or Constants.FALLBACK_MODEL
+    encoding = _encodings.get(model_name)
+    if encoding is not None:
+        return encoding
+    with _encodings_lock:
+        if model_name not in _encodings:
+            try:
+                encoding_name = tiktoken.encoding_name_for_model(model_name)
+            except KeyError as e:
+                logger.warning(
+                    f"No tokenizer for model '{model_name}', counting tokens as "
+                    f"{Constants.FALLBACK_MODEL}: {e}"
+                )
+                encoding_name = tiktoken.encoding_name_for_model(
+                    Constants.FALLBACK_MODEL
+                )
+            _encodings[model_name] = _get_encoding_by_name(encoding_name)
+        return _encodings[model_name]
+
+
+def warm_up(
+    encoding_names: Sequence[str] | None = None, cache_dir: str | None = None
+) -> list[str]:
+    """Downloads encodings into the cache directory.
+
+    Meant to run when building an image, so that workers start without
+    downloading anything.
+
+    Args:
+        encoding_names (Optional[Sequence[str]], optional): Encodings to
+            download. Defaults to None, for all encodings of OpenAI models.
+        cache_dir (Optional[str], optional): Directory to download into.
+            Defaults to None, for `get_cache_dir()`.
+
+    Returns:
+        list[str]: Paths of the cached encodings
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    paths = []
+    for encoding_name in encoding_names or ENCODING_URLS:
+        cache_path = get_cache_path(encoding_name, cache_dir)
+        _download(encoding_name, cache_path)
+        # Fails on a corrupt download
+        _read_encoding(encoding_name, cache_path)
+        paths.append(cache_path)
+    return paths
+
+
+def get_tokenizer(model_name: str | None = None) -> Callable[[str], list[int]]:
+    """Gets the tokenizer of a model, as expected by llama-index.
+
+    Special tokens found in the text are tokenized as plain text instead of
+    raising an error, since the text only has its tokens counted.
+    """
+    return get_encoding(model_name).encode_ordinary
+
+
+def count_tokens(text: str, model_name: str | None = None) -> int:
+    """Counts the tokens of a text.
+
+    Tokens are encoded into a numpy buffer, which is cheaper than building
+    a list of Python ints only to take its length.
+    """
+    return len(get_encoding(model_name).encode_to_numpy(text, disallowed_special=()))
+
+
+def count_tokens_batch(
+    texts: Sequence[str],
+    model_name: str | None = None,
+    num_threads: int = Constants.DEFAULT_NUM_THREADS,
+) -> list[int]:
+    """Counts the tokens of each text in a batch.
+
+    tiktoken releases the GIL while encoding, so large batches are counted
+    across threads.
+
+    Args:
+        texts (Sequence[str]): Texts to count the tokens of
+        model_name (Optional[str], optional): Name of the model. Defaults to
+            None, for the fallback encoding.
+        num_threads (int, optional): Threads used for large batches.
+            Defaults to 8.
+
+    Returns:
+        list[int]: Token count of each text
+    """
+    encoding = get_encoding(model_name)
+
+    def _count(text: str) -> int:
+        return len(encoding.encode_to_numpy(text, disallowed_special=()))
+
+    if len(texts) < Constants.MIN_PARALLEL_BATCH or num_threads <= 1:
+        return [_count(text) for text in texts]
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return list(executor.map(_count, texts))
@@ -0,0 +1,41 @@
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend
+
+
+class TTLCache(MemoryCacheBackend):
+    """Thread safe in-memory LRU cache whose entries expire after a TTL.
+
+    Once `maxsize` entries are held, the least recently used entry is evicted
+    to make room for a new one. A `ttl` of 0 disables caching.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Creates an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries held
+            ttl (float): Seconds for which an entry is valid
+            timer (Callable[[], float], optional): Clock used for expiry.
+                Defaults to time.monotonic.
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=timer)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.get_many([key]).get(key, default)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        self.set_many({key: value})
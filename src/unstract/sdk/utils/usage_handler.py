@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 from llama_index.core.callbacks import CBEventType, TokenCountingHandler
@@ -29,6 +30,9 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
         - event_ends_to_ignore (Optional[list[CBEventType]]): A list of event
           types to ignore at the end.
         - verbose (bool): A flag indicating whether to print verbose output.
+
+    The token counter may be shared by embedding events ending concurrently,
+    so each event only reports the counts recorded under its own event ID.
     """
 
     def __init__(
@@ -49,6 +53,7 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
         self.llm_model = llm_model
         self.embed_model = embed_model
         self.platform_api_key = platform_api_key
+        self._token_counter_lock = threading.Lock()
         super().__init__(
             log_level=log_level,  # StreamMixin's args
             event_starts_to_ignore=event_starts_to_ignore or [],
@@ -116,9 +121,26 @@ class UsageHandler(StreamMixin, BaseCallbackHandler):
             )
             Audit(log_level=self.log_level).push_usage_data(
                 platform_api_key=self.platform_api_key,
-                token_counter=self.token_counter,
+                token_counter=TokenCounter(
+                    input_tokens=0,
+                    output_tokens=0,
+                    embedding_tokens=self._pop_embedding_token_count(event_id),
+                ),
                 event_type=event_type,
                 model_name=self.embed_model.model_name,
                 kwargs=self.kwargs,
             )
-            self.token_counter.reset_counts()
+
+    def _pop_embedding_token_count(self, event_id: str) -> int:
+        """Takes the embedding tokens counted for an event off the counter.
+
+        Counts of other events, possibly still being recorded by other
+        threads, are left in place. Items are removed one by one, since
+        rebuilding the list could drop a count appended meanwhile.
+        """
+        with self._token_counter_lock:
+            counts = self.token_counter.embedding_token_counts
+            events = [count for count in list(counts) if count.event_id == event_id]
+            for count in events:
+                counts.remove(count)
+        return sum(count.total_token_count for count in events)
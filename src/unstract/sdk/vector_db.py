@@ -1,15 +1,21 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from deprecated import deprecated
 from llama_index.core import StorageContext, VectorStoreIndex
 from llama_index.core.indices.base import IndexType
 from llama_index.core.node_parser import SentenceSplitter
-from llama_index.core.schema import BaseNode, Document
+from llama_index.core.schema import BaseNode, Document, MetadataMode
+from llama_index.core.vector_stores import (
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
     VectorStore,
+    VectorStoreQuery,
     VectorStoreQueryResult,
 )
 from unstract.sdk.adapter import ToolAdapter
@@ -21,8 +27,17 @@ from unstract.sdk.constants import LogLevel, ToolEnv
 from unstract.sdk.embedding import Embedding
 from unstract.sdk.exceptions import SdkError, VectorDBError
 from unstract.sdk.helper import SdkHelper
+from unstract.sdk.index_registry import IndexRegistry
 from unstract.sdk.platform import PlatformHelper
 from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.utils.incremental_indexing import (
+    ChunkAnnotator,
+    ChunkDiff,
+    annotate_chunks,
+    diff_chunks,
+    sort_chunks,
+)
+from unstract.sdk.utils.indexing_pipeline import IndexingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -43,17 +58,23 @@ class VectorDB:
         tool: BaseTool,
         adapter_instance_id: str | None = None,
         embedding: Embedding | None = None,
+        registry: IndexRegistry | None = None,
     ):
         self._tool = tool
         self._adapter_instance_id = adapter_instance_id
+        # Records of deleted documents are removed from the registry
+        self._registry = registry
         self._vector_db_instance = None
+        self._embedding: Embedding | None = None
         self._embedding_instance = None
         self._embedding_dimension = VectorDB.DEFAULT_EMBEDDING_DIMENSION
         self._initialise(embedding)
 
     def _initialise(self, embedding: Embedding | None = None):
         if embedding:
-            self._embedding_instance = embedding._embedding_instance
+            self._embedding = embedding
+            # Embeds through the Embedding, with its rate limit and batching
+            self._embedding_instance = embedding.get_embed_model()
             self._embedding_dimension = embedding._length
         if self._adapter_instance_id:
             self._vector_db_instance: BasePydanticVectorStore | VectorStore = (
@@ -139,11 +160,141 @@ class VectorDB:
             storage_context=storage_context,
             show_progress=show_progress,
             embed_model=self._embedding_instance,
-            transformations=[parser],
+            transformations=[parser, ChunkAnnotator()],
             callback_manager=self._embedding_instance.callback_manager,
             **index_kwargs,
         )
 
+    def index_document_pipelined(
+        self,
+        documents: Sequence[Document],
+        chunk_size: int = 1024,
+        chunk_overlap: int = 128,
+        embed_batch_size: int | None = None,
+        max_pending_batches: int = 4,
+    ) -> int:
+        """Indexes documents by overlapping the split, embed and upsert stages.
+
+        Unlike `index_document()`, which splits, embeds and inserts every node
+        in one blocking call, embedding of a batch runs while the previous
+        batch is being written to the vector DB. Bounded queues between the
+        stages limit the embedded nodes held in memory, though the nodes of a
+        document are split at once.
+
+        Args:
+            documents (Sequence[Document]): Documents to index
+            chunk_size (int, optional): Chunk size. Defaults to 1024.
+            chunk_overlap (int, optional): Chunk overlap. Defaults to 128.
+            embed_batch_size (Optional[int], optional): Nodes handed to the
+                embed stage at a time, which are further batched to the
+                provider's limits by `Embedding.get_text_embeddings()`.
+                Defaults to the batch size of the embedding model.
+            max_pending_batches (int, optional): Batches buffered between
+                stages before the upstream stage blocks. Defaults to 4.
+
+        Returns:
+            int: Number of nodes added to the vector DB
+        """
+        if not self._embedding_instance:
+            raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
+        parser = SentenceSplitter.from_defaults(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            callback_manager=self._embedding_instance.callback_manager,
+        )
+        pipeline = IndexingPipeline(
+            parser=parser,
+            embed_fn=self._embed_texts,
+            upsert_fn=lambda nodes: self.add(nodes[0].ref_doc_id, nodes=nodes),
+            embed_batch_size=(
+                embed_batch_size or self._embedding_instance.embed_batch_size
+            ),
+            max_pending_batches=max_pending_batches,
+            transformations=[ChunkAnnotator()],
+        )
+        return pipeline.run(documents)
+
+    def index_document_incremental(
+        self,
+        documents: Sequence[Document],
+        chunk_size: int = 1024,
+        chunk_overlap: int = 128,
+        embed_batch_size: int | None = None,
+    ) -> ChunkDiff | None:
+        """Re-indexes documents by writing only the chunks that changed.
+
+        The documents are split and each chunk is compared by its content
+        hash and position with the nodes already stored for the document.
+        Only new or changed chunks are embedded and added, and only stale
+        nodes are deleted. Chunks which merely moved reuse their stored
+        embedding.
+
+        Args:
+            documents (Sequence[Document]): Documents to re-index
+            chunk_size (int, optional): Chunk size. Defaults to 1024.
+            chunk_overlap (int, optional): Chunk overlap. Defaults to 128.
+            embed_batch_size (Optional[int], optional): Nodes per embedding
+                call. Defaults to batches adapted to the provider's limits,
+                see `Embedding.get_text_embeddings()`.
+
+        Returns:
+            Optional[ChunkDiff]: Changes applied to the vector DB or None if
+                the vector DB doesn't support listing and deleting individual
+                nodes, in which case nothing is modified.
+        """
+        if not self._embedding_instance:
+            raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
+        parser = SentenceSplitter.from_defaults(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            callback_manager=self._embedding_instance.callback_manager,
+        )
+        nodes = annotate_chunks(parser.get_nodes_from_documents(documents))
+
+        stored_nodes: list[BaseNode] = []
+        for ref_doc_id in {node.ref_doc_id for node in nodes}:
+            try:
+                stored_nodes.extend(self.get_nodes(ref_doc_id=ref_doc_id))
+            except NotImplementedError as e:
+                logger.info(f"Incremental re-indexing is not possible: {e}")
+                return None
+        diff = diff_chunks(nodes, stored_nodes)
+
+        to_embed = diff.to_embed
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in to_embed]
+        if embed_batch_size:
+            embeddings = []
+            for start in range(0, len(texts), embed_batch_size):
+                embeddings.extend(
+                    self._embedding_instance.get_text_embedding_batch(
+                        texts[start : start + embed_batch_size]
+                    )
+                )
+        else:
+            embeddings = self._embed_texts(texts)
+        for node, node_embedding in zip(to_embed, embeddings, strict=True):
+            node.embedding = node_embedding
+        # New nodes are written before stale ones are removed so that a
+        # failure midway never leaves the document with missing chunks
+        nodes_by_doc: dict[str, list[BaseNode]] = {}
+        for node in diff.to_add:
+            nodes_by_doc.setdefault(node.ref_doc_id, []).append(node)
+        for ref_doc_id, doc_nodes in nodes_by_doc.items():
+            self.add(ref_doc_id, nodes=doc_nodes)
+        if diff.to_delete:
+            self.delete_nodes(node_ids=diff.to_delete)
+        logger.info(
+            f"Re-indexed incrementally, added: {len(diff.to_add)} "
+            f"(embedded: {len(to_embed)}), deleted: {len(diff.to_delete)}, "
+            f"unchanged: {diff.unchanged}"
+        )
+        return diff
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if self._embedding:
+            return self._embedding.get_text_embeddings(texts)
+        return self._embedding_instance.get_text_embedding_batch(texts)
+
     @deprecated(version="0.47.0", reason="Use index_document() instead")
     def get_vector_store_index_from_storage_context(
         self,
@@ -186,10 +337,141 @@ class VectorDB:
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         if not self.vector_db_adapter_class:
             raise VectorDBError("Vector DB is not initialised properly")
+        if self._registry:
+            try:
+                self._registry.remove(ref_doc_id)
+            except Exception as e:
+                logger.warning(f"Unable to unregister doc_id {ref_doc_id}: {e}")
         self.vector_db_adapter_class.delete(
             ref_doc_id=ref_doc_id, delete_kwargs=delete_kwargs
         )
 
+    def count_nodes(self, ref_doc_id: str) -> int:
+        """Counts the nodes stored for a document.
+
+        Vector DBs which support it count natively by metadata without
+        embedding anything. Others fall back to a similarity search with a
+        placeholder query embedding, which costs an embedding call and
+        counts at most one node.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be counted
+
+        Returns:
+            int: Number of nodes stored for the document
+        """
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        try:
+            return self.vector_db_adapter_class.count_nodes(ref_doc_id=ref_doc_id)
+        except NotImplementedError:
+            logger.debug(
+                f"Native count not supported by {self.vector_db_adapter_class.name}"
+                ", querying with an embedding instead"
+            )
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+
+        if not self._embedding_instance:
+            raise VectorDBError(self.EMBEDDING_INSTANCE_ERROR)
+        doc_id_eq_filter = MetadataFilter.from_dict(
+            {
+                "key": VectorDbConstants.DOC_ID,
+                "operator": FilterOperator.EQ,
+                "value": ref_doc_id,
+            }
+        )
+        q = VectorStoreQuery(
+            query_embedding=self._embedding_instance.get_query_embedding(" "),
+            doc_ids=[ref_doc_id],
+            filters=MetadataFilters(filters=[doc_id_eq_filter]),
+        )
+        return len(self.query(query=q).nodes)
+
+    def doc_exists(self, ref_doc_id: str) -> bool:
+        """Checks if any nodes are stored for a document.
+
+        Args:
+            ref_doc_id (str): Document to check
+
+        Returns:
+            bool: True if the document has been indexed
+        """
+        return self.count_nodes(ref_doc_id=ref_doc_id) > 0
+
+    def get_nodes(self, ref_doc_id: str) -> list[BaseNode]:
+        """Fetches all the nodes stored for a document.
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support listing nodes
+        """
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        try:
+            return self.vector_db_adapter_class.get_nodes(ref_doc_id=ref_doc_id)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+
+    def get_sorted_nodes(
+        self, ref_doc_id: str, with_embeddings: bool = False
+    ) -> Iterator[BaseNode]:
+        """Fetches all the nodes stored for a document in document order.
+
+        Nodes are fetched from the vector DB a page at a time with a metadata
+        filter, without any similarity search and so without a cap on the
+        number of nodes. Vector DBs which can order by position, such as
+        Qdrant and Postgres, are read lazily in order, so a single page is
+        held in memory at a time. Others return pages in arbitrary order, so
+        every page is loaded and sorted before the first node is yielded,
+        holding the whole document in memory. Skipping the embeddings keeps
+        this to roughly the size of the document's text.
+
+        Args:
+            ref_doc_id (str): Document whose nodes are to be fetched
+            with_embeddings (bool, optional): Whether to fetch embeddings of
+                the nodes. Defaults to False.
+
+        Yields:
+            BaseNode: Nodes of the document, ordered by their position
+
+        Raises:
+            NotImplementedError: If the vector DB doesn't support listing nodes
+        """
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        adapter = self.vector_db_adapter_class
+        try:
+            try:
+                pages = adapter.iter_sorted_node_pages(
+                    ref_doc_id=ref_doc_id, with_embeddings=with_embeddings
+                )
+            except NotImplementedError as e:
+                logger.debug(f"Sorting nodes of {ref_doc_id} in memory: {e}")
+                nodes = [
+                    node
+                    for page in adapter.iter_node_pages(
+                        ref_doc_id=ref_doc_id, with_embeddings=with_embeddings
+                    )
+                    for node in page
+                ]
+                pages = [sort_chunks(nodes)]
+            for page in pages:
+                yield from page
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            raise parse_vector_db_err(e, adapter) from e
+
+    def delete_nodes(self, node_ids: list[str]) -> None:
+        if not self.vector_db_adapter_class:
+            raise VectorDBError("Vector DB is not initialised properly")
+        try:
+            self.vector_db_adapter_class.delete_nodes(node_ids=node_ids)
+        except Exception as e:
+            raise parse_vector_db_err(e, self.vector_db_adapter_class) from e
+
     def add(
         self,
         ref_doc_id,
@@ -202,6 +484,20 @@ class VectorDB:
             nodes=nodes,
         )
 
+    def is_healthy(self) -> bool:
+        """Checks if the vector DB's client is still usable, such as when pooled.
+
+        Returns:
+            bool: False if the client is known to be unusable
+        """
+        if not self._vector_db_instance:
+            return False
+        try:
+            return self.vector_db_adapter_class.is_healthy()
+        except Exception as e:
+            logger.warning(f"Health check of {self._adapter_instance_id} failed: {e}")
+            return False
+
     def close(self, **kwargs):
         if not self.vector_db_adapter_class:
             raise VectorDBError("Vector DB is not initialised properly")
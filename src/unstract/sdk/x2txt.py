@@ -19,6 +19,7 @@ from unstract.sdk.file_storage import FileStorage, FileStorageProvider
 from unstract.sdk.helper import SdkHelper
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.utils import ToolUtils
+from unstract.sdk.utils.rate_limiter import RateLimiter
 
 
 class X2Text(metaclass=ABCMeta):
@@ -33,6 +34,7 @@ class X2Text(metaclass=ABCMeta):
         self._adapter_instance_id = adapter_instance_id
         self._x2text_instance: X2TextAdapter = None
         self._usage_kwargs = usage_kwargs
+        self._rate_limiter: RateLimiter | None = None
         self._initialise()
 
     @property
@@ -58,6 +60,9 @@ class X2Text(metaclass=ABCMeta):
                     Common.METADATA
                 ][Common.ADAPTER]
                 x2text_metadata = x2text_config.get(Common.ADAPTER_METADATA)
+                self._rate_limiter = RateLimiter.from_adapter(
+                    self._adapter_instance_id, x2text_metadata
+                )
                 # Add x2text service host, port and platform_service_key
                 x2text_metadata[X2TextConstants.X2TEXT_HOST] = self._tool.get_env_or_die(
                     X2TextConstants.X2TEXT_HOST
@@ -98,6 +103,8 @@ class X2Text(metaclass=ABCMeta):
             text_extraction_result = TextExtractionResult(
                 extracted_text=extracted_text, extraction_metadata=None
             )
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
         text_extraction_result = self._x2text_instance.process(
             input_file_path, output_file_path, fs, **kwargs
         )
@@ -0,0 +1,129 @@
+"""Fake adapters to create `LLM` and `Embedding` instances in tests.
+
+Usage:
+    @fake_adapter(LLM.llm_adapters, FAKE_LLM_ADAPTER_ID, MyMockLLM)
+    class MyTest(unittest.TestCase):
+        def test_complete(self):
+            llm = create_llm()
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any, TypeVar
+from unittest.mock import MagicMock, patch
+
+from unstract.sdk.adapters.constants import Common
+from unstract.sdk.adapters.embedding.helper import EmbeddingHelper
+from unstract.sdk.embedding import Embedding
+from unstract.sdk.llm import LLM
+from unstract.sdk.utils.tokenizer import Constants as TokenizerConstants
+
+FAKE_LLM_ADAPTER_ID = "fake|llm"
+FAKE_EMBEDDING_ADAPTER_ID = "fake|embedding"
+
+T = TypeVar("T")
+
+
+class FakeAdapter:
+    """Adapter serving the models created by `create_model()`."""
+
+    create_model: Callable[[], Any]
+
+    def __init__(self, settings: dict[str, Any]) -> None:
+        self.config = settings
+
+    @staticmethod
+    def get_name() -> str:
+        return "Fake"
+
+    @staticmethod
+    def get_provider() -> str:
+        return "fake"
+
+    def get_llm_instance(self) -> Any:
+        return self.create_model()
+
+    def get_embedding_instance(self) -> Any:
+        return self.create_model()
+
+    def get_embedding_dimension(self) -> int | None:
+        return EmbeddingHelper.get_embedding_dimension(self.config)
+
+
+def fake_adapter(
+    adapters: dict[str, Any], adapter_id: str, create_model: Callable[[], Any]
+) -> Callable[[T], T]:
+    """Registers a `FakeAdapter` for the duration of the decorated tests.
+
+    Encodings are never downloaded, tokens are estimated for those not cached.
+
+    Args:
+        adapters (dict[str, Any]): Registry of adapters, such as
+            `LLM.llm_adapters`
+        adapter_id (str): ID the adapter is registered with
+        create_model (Callable[[], Any]): Creates the llama-index model served
+
+    Returns:
+        Callable[[T], T]: Decorator of a test case or function
+    """
+    adapter = type(
+        "FakeAdapter", (FakeAdapter,), {"create_model": staticmethod(create_model)}
+    )
+
+    def decorator(target: T) -> T:
+        target = patch.dict(os.environ, {TokenizerConstants.DOWNLOAD_ENV: ""})(target)
+        return patch.dict(
+            adapters, {adapter_id: {Common.METADATA: {Common.ADAPTER: adapter}}}
+        )(target)
+
+    return decorator
+
+
+def _get_config(adapter_id: str, metadata: dict[str, Any] | None) -> dict[str, Any]:
+    return {Common.ADAPTER_ID: adapter_id, Common.ADAPTER_METADATA: dict(metadata or {})}
+
+
+def create_llm(
+    metadata: dict[str, Any] | None = None, tool: Any = None, **kwargs: Any
+) -> LLM:
+    """Creates an `LLM` of the fake adapter registered with `fake_adapter()`.
+
+    Args:
+        metadata (Optional[dict[str, Any]], optional): Adapter's metadata.
+            Defaults to None.
+        tool (Any, optional): Tool of the LLM. Defaults to None, for a mock.
+        kwargs: Further arguments of `LLM`
+    """
+    with patch(
+        "unstract.sdk.llm.ToolAdapter.get_adapter_config",
+        return_value=_get_config(FAKE_LLM_ADAPTER_ID, metadata),
+    ):
+        return LLM(
+            tool=tool or MagicMock(),
+            adapter_instance_id="instance",
+            usage_kwargs={},
+            **kwargs,
+        )
+
+
+def create_embedding(
+    metadata: dict[str, Any] | None = None, tool: Any = None, **kwargs: Any
+) -> Embedding:
+    """Creates an `Embedding` of the fake adapter registered with `fake_adapter()`.
+
+    Args:
+        metadata (Optional[dict[str, Any]], optional): Adapter's metadata.
+            Defaults to None.
+        tool (Any, optional): Tool of the embedding. Defaults to None, for a mock.
+        kwargs: Further arguments of `Embedding`
+    """
+    with patch(
+        "unstract.sdk.embedding.ToolAdapter.get_adapter_config",
+        return_value=_get_config(FAKE_EMBEDDING_ADAPTER_ID, metadata),
+    ):
+        return Embedding(
+            tool=tool or MagicMock(),
+            adapter_instance_id="instance",
+            usage_kwargs={},
+            **kwargs,
+        )
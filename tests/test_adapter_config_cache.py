@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from unstract.sdk.adapter import ToolAdapter
+from unstract.sdk.constants import ToolEnv
+from unstract.sdk.utils.ttl_cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.cache = TTLCache(maxsize=2, ttl=10, timer=self.timer)
+
+    def test_expiry(self):
+        self.cache.set("a", 1)
+        self.timer.now = 9.9
+        self.assertEqual(self.cache.get("a"), 1)
+        self.timer.now = 10
+        self.assertIsNone(self.cache.get("a"))
+
+    def test_lru_eviction(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_disabled(self):
+        cache = TTLCache(maxsize=2, ttl=0, timer=self.timer)
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_delete_matching(self):
+        self.cache.set(("org1", "x"), 1)
+        self.cache.set(("org2", "x"), 2)
+        self.assertEqual(self.cache.delete_matching(lambda key: key[1] == "x"), 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+def mock_response(status_code: int, data: dict) -> MagicMock:
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = data
+    return response
+
+
+class ToolAdapterConfigCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tool = MagicMock()
+        self.tool.get_env_or_die.side_effect = {
+            ToolEnv.PLATFORM_HOST: "http://localhost",
+            ToolEnv.PLATFORM_PORT: "3001",
+            ToolEnv.PLATFORM_API_KEY: "api-key",
+        }.get
+        ToolAdapter.invalidate_adapter_config()
+
+    def tearDown(self):
+        ToolAdapter.invalidate_adapter_config()
+
+    @staticmethod
+    def config(adapter_instance_id: str) -> dict:
+        return {
+            "adapter_id": f"openai|{adapter_instance_id}",
+            "adapter_metadata": {"model": "m"},
+            "adapter_name": "name",
+        }
+
+    @patch("unstract.sdk.platform.requests.Session.get")
+    def test_config_is_cached(self, mock_get):
+        mock_get.return_value = mock_response(200, self.config("a"))
+        first = ToolAdapter.get_adapter_config(self.tool, "a")
+        # Callers mutate the config they receive
+        first["adapter_metadata"]["model"] = "changed"
+        second = ToolAdapter.get_adapter_config(self.tool, "a")
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(second["adapter_metadata"]["model"], "m")
+        self.assertNotIn("adapter_name", second)
+
+    @patch("unstract.sdk.platform.requests.Session.get")
+    def test_invalidate(self, mock_get):
+        mock_get.return_value = mock_response(200, self.config("a"))
+        ToolAdapter.get_adapter_config(self.tool, "a")
+        ToolAdapter.invalidate_adapter_config("a")
+        ToolAdapter.get_adapter_config(self.tool, "a")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("unstract.sdk.platform.requests.Session.get")
+    def test_bulk_fetch(self, mock_get):
+        mock_get.return_value = mock_response(
+            200, {"a": self.config("a"), "b": self.config("b")}
+        )
+        configs = ToolAdapter.get_adapter_configs(self.tool, ["a", "b", "a"])
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(set(configs), {"a", "b"})
+        self.assertEqual(configs["b"]["adapter_id"], "openai|b")
+        # Served from the cache afterwards
+        ToolAdapter.get_adapter_config(self.tool, "b")
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("unstract.sdk.platform.requests.Session.get")
+    def test_bulk_fetch_fallback(self, mock_get):
+        mock_get.side_effect = [
+            mock_response(404, {}),
+            mock_response(200, self.config("a")),
+            mock_response(200, self.config("b")),
+        ]
+        configs = ToolAdapter.get_adapter_configs(self.tool, ["a", "b"])
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(configs["a"]["adapter_id"], "openai|a")
+        self.assertEqual(configs["b"]["adapter_id"], "openai|b")
+
+
+if __name__ == "__main__":
+    unittest.main()
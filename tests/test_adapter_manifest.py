@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from unstract.sdk.adapters import manifest
+from unstract.sdk.adapters.constants import Common
+from unstract.sdk.adapters.llm.no_op.src import NoOpLLM
+from unstract.sdk.adapters.manifest import Constants, LazyAdapter
+
+try:
+    from unstract.sdk.adapters.adapterkit import Adapterkit
+except ImportError:
+    # Imports every adapter type, whose clients may not all be installed
+    Adapterkit = None
+
+LLM_PACKAGE = "unstract.sdk.adapters.llm"
+LLM_DIR = os.path.join(manifest.ADAPTERS_DIR, "llm")
+
+
+class AdapterManifestTest(unittest.TestCase):
+    def setUp(self):
+        entry = manifest._describe(NoOpLLM, "no_op")
+        stale_entry = dict(entry, **{Constants.ID: "removed", Constants.ADAPTER_DIR: "x"})
+        self.manifest = {
+            Constants.VERSION_KEY: Constants.VERSION,
+            Constants.ADAPTERS: {
+                LLM_PACKAGE: {NoOpLLM.get_id(): entry, "removed": stale_entry}
+            },
+            Constants.INACTIVE: {LLM_PACKAGE: ["palm"]},
+        }
+        manifest_file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        with manifest_file:
+            json.dump(self.manifest, manifest_file)
+        self.addCleanup(os.remove, manifest_file.name)
+        for patcher in (
+            patch.object(manifest, "MANIFEST_PATH", manifest_file.name),
+            patch.object(manifest, "_manifest", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_register_lazy_adapters(self):
+        adapters = {}
+        skipped = manifest.register_lazy_adapters(LLM_PACKAGE, LLM_DIR, adapters)
+
+        self.assertEqual(skipped, {"no_op", "palm"})
+        self.assertEqual(list(adapters), [NoOpLLM.get_id()])
+        adapter = adapters[NoOpLLM.get_id()]
+        self.assertIsInstance(adapter, LazyAdapter)
+        self.assertFalse(adapter.loaded)
+        self.assertIs(adapter[Common.METADATA][Common.ADAPTER], NoOpLLM)
+        self.assertTrue(adapter.loaded)
+
+    @unittest.skipIf(Adapterkit is None, "adapter clients are not all installed")
+    def test_lists_without_importing(self):
+        adapters = {}
+        manifest.register_lazy_adapters(LLM_PACKAGE, LLM_DIR, adapters)
+        lazy_adapter = adapters[NoOpLLM.get_id()]
+
+        kit = Adapterkit()
+        with patch.dict(kit.adapters, adapters, clear=True):
+            from_manifest = kit.get_adapters_list()
+            self.assertFalse(lazy_adapter.loaded)
+            kit.get_adapter_class_by_adapter_id(NoOpLLM.get_id())
+            self.assertTrue(lazy_adapter.loaded)
+            self.assertEqual(kit.get_adapters_list(), from_manifest)
+
+    def test_disabled(self):
+        with patch.dict(os.environ, {Constants.USE_MANIFEST_ENV: "false"}):
+            self.assertEqual(manifest.load_manifest(), {})
+
+    def test_other_version_ignored(self):
+        with open(manifest.MANIFEST_PATH, "w") as f:
+            json.dump(dict(self.manifest, **{Constants.VERSION_KEY: 0}), f)
+        with self.assertLogs(manifest.logger, "WARNING"):
+            self.assertEqual(manifest.load_manifest(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
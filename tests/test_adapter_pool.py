@@ -0,0 +1,154 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from unstract.sdk.adapter_pool import AdapterPool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+        self.healthy = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class AdapterPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.pool = AdapterPool(
+            max_idle=2, idle_timeout=60, health_check_interval=10, timer=self.clock
+        )
+        self.addCleanup(self.pool.close)
+        self.created: list[FakeClient] = []
+
+    def _create(self) -> FakeClient:
+        client = FakeClient()
+        self.created.append(client)
+        return client
+
+    def _lease(self, key: str = "vector_db"):
+        return self.pool.lease(
+            key,
+            factory=self._create,
+            close=FakeClient.close,
+            health_check=lambda client: client.healthy,
+        )
+
+    def test_reuses_idle_instance(self):
+        with self._lease() as first:
+            # Leased exclusively, so a concurrent lease gets another instance
+            with self._lease() as second:
+                self.assertIsNot(first, second)
+        # The most recently returned instance is leased first
+        with self._lease() as third:
+            self.assertIs(third, first)
+        with self._lease("other") as other:
+            self.assertNotIn(other, (first, second))
+        self.assertEqual(len(self.created), 3)
+        self.assertFalse(first.closed)
+
+    def test_bounded_idle(self):
+        for key in ("a", "b", "c"):
+            with self._lease(key):
+                pass
+        self.assertEqual(self.pool.idle_count, 2)
+        # The least recently returned instance is closed
+        self.assertEqual([client.closed for client in self.created], [True, False, False])
+
+    def test_idle_timeout(self):
+        with self._lease() as first:
+            pass
+        self.clock.now = 60
+        with self._lease() as second:
+            self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+
+    def test_health_check(self):
+        with self._lease() as first:
+            first.healthy = False
+        self.clock.now = 5
+        with self._lease() as client:
+            # Not checked until idle for the interval
+            self.assertIs(client, first)
+        self.clock.now = 20
+        with self._lease() as client:
+            self.assertIsNot(client, first)
+        self.assertTrue(first.closed)
+
+    def test_closed_on_error(self):
+        with self.assertRaises(ValueError), self._lease() as first:
+            raise ValueError
+        self.assertTrue(first.closed)
+        self.assertEqual(self.pool.idle_count, 0)
+
+    def test_close(self):
+        with self._lease() as idle:
+            pass
+        with self._lease("other") as leased:
+            self.pool.close()
+            self.assertTrue(idle.closed)
+            self.assertFalse(leased.closed)
+        self.assertTrue(leased.closed)
+        with self.assertRaises(RuntimeError), self._lease():
+            pass
+
+    def test_thread_safe(self):
+        def _use() -> None:
+            for _ in range(50):
+                with self._lease():
+                    pass
+
+        threads = [threading.Thread(target=_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(len(self.created), 8)
+        self.assertLessEqual(self.pool.idle_count, 2)
+
+
+class LeaseVectorDBTest(unittest.TestCase):
+    @patch("unstract.sdk.adapter_pool.VectorDB")
+    @patch("unstract.sdk.adapter_pool.Embedding")
+    @patch("unstract.sdk.adapter_pool.ToolAdapter.get_adapter_config")
+    def test_keyed_by_config(self, get_adapter_config, embedding_cls, vector_db_cls):
+        configs = {"embedding": {"model": "a"}, "vector_db": {"url": "x"}}
+        get_adapter_config.side_effect = lambda tool, instance_id: configs[instance_id]
+        embedding_cls.side_effect = lambda **kwargs: MagicMock()
+        vector_db_cls.side_effect = lambda **kwargs: MagicMock()
+        pool = AdapterPool()
+        self.addCleanup(pool.close)
+        tool = MagicMock()
+
+        def _lease(run_id: str):
+            return pool.lease_vector_db(
+                tool=tool,
+                embedding_instance_id="embedding",
+                vector_db_instance_id="vector_db",
+                usage_kwargs={"run_id": run_id},
+            )
+
+        with _lease("1") as (embedding, vector_db):
+            pass
+        with _lease("2") as (reused_embedding, reused_vector_db):
+            self.assertIs(reused_vector_db, vector_db)
+            reused_embedding.set_usage_kwargs.assert_called_with({"run_id": "2"})
+
+        configs["embedding"] = {"model": "b"}
+        with _lease("3") as (_, new_vector_db):
+            self.assertIsNot(new_vector_db, vector_db)
+        self.assertEqual(vector_db_cls.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
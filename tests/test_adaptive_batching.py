@@ -0,0 +1,210 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from unstract.sdk.utils.adaptive_batching import (
+    AdaptiveEmbeddingBatcher,
+    get_retry_after,
+    is_rate_limit_error,
+    is_size_limit_error,
+)
+
+
+class ProviderError(Exception):
+    def __init__(
+        self, message: str, status_code: int, headers: dict | None = None
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = MagicMock(status_code=status_code, headers=headers or {})
+
+
+class ThrottlingException(Exception):  # noqa: N818, named after the Bedrock error
+    pass
+
+
+class FakeProvider:
+    """Accepts batches up to `capacity` texts, rate limiting larger ones."""
+
+    def __init__(self, capacity: int, retry_after: str | None = None) -> None:
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.batches: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        if len(texts) > self.capacity:
+            headers = {"retry-after": self.retry_after} if self.retry_after else {}
+            raise ProviderError("Rate limit reached", 429, headers)
+        self.batches.append(texts)
+        return [[float(text)] for text in texts]
+
+
+class ErrorClassificationTest(unittest.TestCase):
+    def test_rate_limit(self):
+        self.assertTrue(is_rate_limit_error(ProviderError("slow down", 429)))
+        self.assertTrue(is_rate_limit_error(ThrottlingException("slow down")))
+        self.assertFalse(is_rate_limit_error(Exception("Throttling exception")))
+        self.assertFalse(is_rate_limit_error(ProviderError("bad key", 401)))
+
+    def test_size_limit(self):
+        self.assertTrue(is_size_limit_error(ProviderError("invalid input", 400)))
+        self.assertTrue(is_size_limit_error(ProviderError("too large", 413)))
+        self.assertFalse(is_size_limit_error(ProviderError("too many tokens", 500)))
+        self.assertFalse(is_size_limit_error(Exception("maximum context length")))
+
+    def test_retry_after(self):
+        self.assertEqual(get_retry_after(ProviderError("", 429, {"retry-after": "2"})), 2)
+        self.assertEqual(
+            get_retry_after(ProviderError("", 429, {"retry-after-ms": "250"})), 0.25
+        )
+        self.assertIsNone(get_retry_after(ProviderError("", 429)))
+
+
+class AdaptiveEmbeddingBatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.sleep = MagicMock()
+        self.texts = [str(i) for i in range(100)]
+
+    def test_grows_on_success(self):
+        provider = FakeProvider(capacity=1000)
+        batcher = AdaptiveEmbeddingBatcher(
+            provider,
+            count_tokens=len,
+            initial_batch_size=10,
+            max_batch_size=30,
+            sleep=self.sleep,
+        )
+        result = batcher.embed(self.texts)
+
+        self.assertEqual(result, [[float(i)] for i in range(100)])
+        self.assertEqual(
+            [len(batch) for batch in provider.batches[:5]], [10, 18, 26, 30, 16]
+        )
+        self.assertEqual(batcher.batch_size, 30)
+
+    def test_grows_up_to_initial_batch_size(self):
+        provider = FakeProvider(capacity=12)
+        batcher = AdaptiveEmbeddingBatcher(
+            provider, count_tokens=len, initial_batch_size=16, sleep=self.sleep
+        )
+        batcher.embed(self.texts)
+        self.assertLessEqual(max(len(batch) for batch in provider.batches), 16)
+        self.assertLessEqual(batcher.batch_size, 16)
+
+    def test_batch_size_shared_by_key(self):
+        key = object()
+        batcher = AdaptiveEmbeddingBatcher(
+            FakeProvider(capacity=12), count_tokens=len, initial_batch_size=40, key=key
+        )
+        batcher._shrink(40)
+        other = AdaptiveEmbeddingBatcher(
+            FakeProvider(capacity=12), count_tokens=len, initial_batch_size=40, key=key
+        )
+        self.assertEqual(other.batch_size, 20)
+        unshared = AdaptiveEmbeddingBatcher(
+            FakeProvider(capacity=12), count_tokens=len, initial_batch_size=40
+        )
+        self.assertEqual(unshared.batch_size, 40)
+
+    def test_shrinks_and_honours_retry_after(self):
+        provider = FakeProvider(capacity=12, retry_after="3")
+        batcher = AdaptiveEmbeddingBatcher(
+            provider, count_tokens=len, initial_batch_size=40, sleep=self.sleep
+        )
+        result = batcher.embed(self.texts)
+
+        self.assertEqual(result, [[float(i)] for i in range(100)])
+        self.assertTrue(all(len(batch) <= 12 for batch in provider.batches))
+        self.sleep.assert_any_call(3.0)
+
+    def test_packs_by_token_budget(self):
+        provider = FakeProvider(capacity=1000)
+        batcher = AdaptiveEmbeddingBatcher(
+            provider,
+            count_tokens=lambda text: 10,
+            initial_batch_size=50,
+            max_batch_tokens=100,
+            sleep=self.sleep,
+        )
+        batcher.embed(self.texts)
+        self.assertTrue(all(len(batch) == 10 for batch in provider.batches))
+
+    def test_size_error_splits_batch(self):
+        calls = []
+
+        def embed(texts):
+            calls.append(len(texts))
+            if len(texts) > 4:
+                raise ProviderError("Too many inputs in the batch size", 400)
+            return [[0.0]] * len(texts)
+
+        batcher = AdaptiveEmbeddingBatcher(
+            embed, count_tokens=len, initial_batch_size=16, sleep=self.sleep
+        )
+        self.assertEqual(len(batcher.embed(self.texts[:8])), 8)
+        self.assertEqual(calls[:3], [8, 4, 4])
+        self.sleep.assert_not_called()
+
+    def test_bad_request_raised_for_single_text(self):
+        embed = MagicMock(side_effect=ProviderError("invalid input", 400))
+        batcher = AdaptiveEmbeddingBatcher(
+            embed, count_tokens=len, initial_batch_size=4, sleep=self.sleep
+        )
+        with self.assertRaises(ProviderError):
+            batcher.embed(self.texts[:4])
+        self.assertEqual([len(call.args[0]) for call in embed.call_args_list], [4, 2, 1])
+
+    def test_other_errors_are_raised(self):
+        embed = MagicMock(side_effect=ProviderError("Invalid API key", 401))
+        batcher = AdaptiveEmbeddingBatcher(
+            embed, count_tokens=len, initial_batch_size=16, sleep=self.sleep
+        )
+        with self.assertRaises(ProviderError):
+            batcher.embed(self.texts)
+        embed.assert_called_once()
+
+    def test_gives_up_after_max_retries(self):
+        provider = FakeProvider(capacity=0)
+        batcher = AdaptiveEmbeddingBatcher(
+            provider,
+            count_tokens=len,
+            initial_batch_size=4,
+            max_retries=2,
+            sleep=self.sleep,
+        )
+        with self.assertRaises(ProviderError):
+            batcher.embed(self.texts)
+        self.assertEqual(self.sleep.call_count, 2)
+
+    def test_split(self):
+        batcher = AdaptiveEmbeddingBatcher(
+            FakeProvider(capacity=1000), count_tokens=len, initial_batch_size=30
+        )
+        groups = batcher.split(self.texts)
+        self.assertEqual([len(group) for group in groups], [30, 30, 30, 10])
+        self.assertEqual(sum(groups, []), self.texts)
+
+    def test_aembed(self):
+        provider = FakeProvider(capacity=12)
+
+        async def aembed(texts):
+            return provider(texts)
+
+        batcher = AdaptiveEmbeddingBatcher(
+            provider,
+            count_tokens=len,
+            initial_batch_size=40,
+            sleep=self.sleep,
+            aembed_fn=aembed,
+        )
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            result = asyncio.run(batcher.aembed(self.texts))
+
+        self.assertEqual(result, [[float(i)] for i in range(100)])
+        self.assertTrue(all(len(batch) <= 12 for batch in provider.batches))
+        sleep.assert_awaited()
+        self.sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
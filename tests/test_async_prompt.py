@@ -0,0 +1,73 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from unstract.sdk.constants import ToolEnv
+from unstract.sdk.prompt import AsyncPromptTool
+
+
+class AsyncPromptToolTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tool = MagicMock()
+        self.tool.get_env_or_die.side_effect = {ToolEnv.PLATFORM_API_KEY: "key"}.get
+        self.prompt_tool = AsyncPromptTool(
+            tool=self.tool,
+            prompt_host="http://prompt",
+            prompt_port="3003",
+            request_id="request",
+            max_concurrency=2,
+        )
+        self.addAsyncCleanup(self.prompt_tool.aclose)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _mock_transport(self, handler) -> None:
+        self.prompt_tool._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+    async def test_gather(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            payload = json.loads(request.content)
+            # Later requests answer first
+            await asyncio.sleep(0.01 * (5 - payload["index"]))
+            self.in_flight -= 1
+            self.assertEqual(request.headers["Authorization"], "Bearer key")
+            return httpx.Response(200, json={"output": payload["index"]})
+
+        self._mock_transport(handler)
+        answers = await self.prompt_tool.gather(
+            *(self.prompt_tool.answer_prompt({"index": index}) for index in range(5))
+        )
+        self.assertEqual([answer["output"] for answer in answers], list(range(5)))
+        self.assertEqual(self.max_in_flight, 2)
+
+    async def test_error_streamed(self):
+        self._mock_transport(
+            lambda request: httpx.Response(400, json={"error": "Invalid payload"})
+        )
+        await self.prompt_tool.index({})
+        self.tool.stream_error_and_exit.assert_called_once()
+        msg, error = self.tool.stream_error_and_exit.call_args.args
+        self.assertEqual(msg, "Error while indexing. Invalid payload")
+        self.assertIsInstance(error, httpx.HTTPStatusError)
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_retried_when_unavailable(self, sleep):
+        responses = [
+            httpx.Response(503, text="Unavailable"),
+            httpx.Response(200, json={"doc_id": "doc"}),
+        ]
+        self._mock_transport(lambda request: responses.pop(0))
+        self.assertEqual(await self.prompt_tool.index({}), "doc")
+        sleep.assert_awaited_once()
+        self.tool.stream_error_and_exit.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
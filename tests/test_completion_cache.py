@@ -0,0 +1,139 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, ClassVar
+from unittest.mock import MagicMock, patch
+
+from llama_index.core.llms import CompletionResponse, MockLLM
+from unstract.sdk.llm import LLM
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend, SQLiteCacheBackend
+from unstract.sdk.utils.completion_cache import (
+    CompletionCache,
+    decode_completion,
+    encode_completion,
+)
+
+from tests.fake_adapters import FAKE_LLM_ADAPTER_ID, create_llm, fake_adapter
+
+
+class CountingLLM(MockLLM):
+    prompts: ClassVar[list[str]] = []
+    temperature: float = 0
+
+    def complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        CountingLLM.prompts.append(prompt)
+        return CompletionResponse(
+            text=f'Answer: {{"prompt": "{prompt}"}}',
+            raw={"usage": {"prompt_tokens": 5, "completion_tokens": 3}},
+        )
+
+
+class CompletionCacheTest(unittest.TestCase):
+    def test_encoding_round_trip(self):
+        response = CompletionResponse(
+            text="hello", additional_kwargs={"a": 1}, raw={"usage": {"x": 1}}
+        )
+        decoded = decode_completion(encode_completion(response))
+        self.assertEqual(decoded.text, "hello")
+        self.assertEqual(decoded.additional_kwargs, {"a": 1})
+        self.assertEqual(decoded.raw, {"usage": {"x": 1}})
+
+    def test_key_covers_request(self):
+        cache = CompletionCache(MemoryCacheBackend(), config_hash="abc", model="m")
+        key = cache.get_key("prompt", temperature=0)
+        self.assertEqual(key, cache.get_key("prompt", temperature=0))
+        self.assertNotEqual(key, cache.get_key("prompt", temperature=1))
+        self.assertNotEqual(key, cache.get_key("prompt "))
+        other = CompletionCache(MemoryCacheBackend(), config_hash="def", model="m")
+        self.assertNotEqual(key, other.get_key("prompt", temperature=0))
+
+    def test_stats(self):
+        cache = CompletionCache(MemoryCacheBackend(), config_hash="abc", model="m")
+        key = cache.get_key("prompt")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, CompletionResponse(text="hello"))
+        self.assertEqual(cache.get(key).text, "hello")
+        self.assertEqual(cache.get_stats().hits, 1)
+        self.assertEqual(cache.get_stats().misses, 1)
+
+
+class CacheBackendEvictionTest(unittest.TestCase):
+    def test_memory_ttl(self):
+        backend = MemoryCacheBackend(ttl=1)
+        backend.set("key", b"value")
+        self.assertEqual(backend.get("key"), b"value")
+        with patch("time.monotonic", return_value=time.monotonic() + 2):
+            self.assertIsNone(backend.get("key"))
+
+    def test_sqlite_max_entries(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = SQLiteCacheBackend(
+                os.path.join(tmp_dir, "cache.db"), max_entries=2
+            )
+            for key in ("a", "b", "c"):
+                backend.set(key, key.encode())
+            self.assertEqual(backend.get_many(["a", "b", "c"]), {"b": b"b", "c": b"c"})
+            backend.close()
+
+
+@fake_adapter(LLM.llm_adapters, FAKE_LLM_ADAPTER_ID, CountingLLM)
+@patch("unstract.sdk.llm.SdkHelper.is_public_adapter", return_value=False)
+@patch("unstract.sdk.llm.CallbackManager.set_callback")
+@patch("unstract.sdk.llm.Audit.push_usage_data")
+class CachedCompletionTest(unittest.TestCase):
+    def setUp(self):
+        CountingLLM.prompts = []
+        self.tool = MagicMock()
+        self.tool.get_env_or_die.return_value = "api-key"
+
+    def create_llm(self, **kwargs: Any) -> LLM:
+        return create_llm(tool=self.tool, **kwargs)
+
+    def test_cache_hit_skips_provider(self, push_usage_data, *_):
+        llm = self.create_llm(cache_backend=MemoryCacheBackend())
+
+        first = llm.complete("question")
+        push_usage_data.assert_not_called()
+        second = llm.complete("question")
+
+        self.assertEqual(CountingLLM.prompts, ["question"])
+        self.assertEqual(second[LLM.RESPONSE].text, '{"prompt": "question"}')
+        self.assertEqual(first[LLM.RESPONSE].text, second[LLM.RESPONSE].text)
+        self.assertEqual(llm.get_metrics()[LLM.CACHE_HITS], 1)
+        self.assertEqual(llm.get_metrics()[LLM.CACHE_MISSES], 1)
+        push_usage_data.assert_called_once()
+        self.assertTrue(push_usage_data.call_args.kwargs["cached"])
+        token_counter = push_usage_data.call_args.kwargs["token_counter"]
+        self.assertEqual(token_counter.prompt_llm_token_count, 5)
+        self.assertEqual(token_counter.completion_llm_token_count, 3)
+
+    def test_sampled_completions_are_not_cached(self, *_):
+        llm = self.create_llm(cache_backend=MemoryCacheBackend())
+        llm.complete("question", temperature=0.7)
+        llm.complete("question", temperature=0.7)
+        self.assertEqual(CountingLLM.prompts, ["question", "question"])
+        self.assertEqual(llm.get_cache_stats().misses, 0)
+
+        llm._llm_instance.temperature = 1
+        llm.complete("question")
+        self.assertEqual(len(CountingLLM.prompts), 3)
+
+    def test_cache_keeps_raw_text(self, *_):
+        llm = self.create_llm(cache_backend=MemoryCacheBackend())
+        llm.complete("question")
+        response = llm.complete("question", extract_json=False)[LLM.RESPONSE]
+        self.assertEqual(response.text, 'Answer: {"prompt": "question"}')
+
+    def test_disabled_by_default(self, *_):
+        llm = self.create_llm()
+        llm.complete("question")
+        llm.complete("question")
+        self.assertEqual(len(CountingLLM.prompts), 2)
+        self.assertIsNone(llm.get_cache_stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import MagicMock
+
+from psycopg2.errors import UndefinedTable
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+from unstract.sdk.adapters.vectordb.no_op.src.no_op_vectordb import NoOpVectorDB
+from unstract.sdk.adapters.vectordb.postgres.src.postgres import Postgres
+from unstract.sdk.adapters.vectordb.qdrant.src.qdrant import Qdrant
+from unstract.sdk.adapters.vectordb.weaviate.src.weaviate import Weaviate
+from unstract.sdk.vector_db import VectorDB
+from weaviate.classes.query import Filter
+
+
+class QdrantCountNodesTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = Qdrant.__new__(Qdrant)
+        self.adapter._client = QdrantClient(location=":memory:")
+        self.adapter._collection_name = "unstract_2"
+
+    def test_missing_collection(self):
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-1"), 0)
+
+    def test_counts_by_doc_id(self):
+        self.adapter._client.create_collection(
+            collection_name="unstract_2",
+            vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+        )
+        self.adapter._client.upsert(
+            collection_name="unstract_2",
+            points=[
+                PointStruct(
+                    id=i,
+                    vector=[1.0, float(i)],
+                    payload={"doc_id": "doc-1" if i < 3 else "doc-2"},
+                )
+                for i in range(5)
+            ],
+        )
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-1"), 3)
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-2"), 2)
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-3"), 0)
+
+
+class WeaviateCountNodesTest(unittest.TestCase):
+    def test_filters_on_doc_id(self):
+        adapter = Weaviate.__new__(Weaviate)
+        adapter._client = MagicMock()
+        adapter._collection_name = "Unstract_2"
+        collection = adapter._client.collections.get.return_value
+        collection.aggregate.over_all.return_value.total_count = 4
+
+        self.assertEqual(adapter.count_nodes(ref_doc_id="doc-1"), 4)
+        self.assertEqual(
+            collection.aggregate.over_all.call_args.kwargs["filters"],
+            Filter.by_property("doc_id").equal("doc-1"),
+        )
+
+
+class PostgresCountNodesTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = Postgres.__new__(Postgres)
+        self.adapter._client = MagicMock()
+        self.adapter._schema_name = "public"
+        self.adapter._collection_name = "unstract_2"
+        self.cursor = self.adapter._client.cursor.return_value.__enter__.return_value
+
+    def test_counts_by_doc_id(self):
+        self.cursor.fetchone.return_value = (6,)
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-1"), 6)
+        self.assertEqual(self.cursor.execute.call_args.args[1], ("doc-1",))
+
+    def test_missing_table(self):
+        self.cursor.execute.side_effect = UndefinedTable()
+        self.assertEqual(self.adapter.count_nodes(ref_doc_id="doc-1"), 0)
+        self.adapter._client.rollback.assert_called_once()
+
+
+class NoOpCountNodesTest(unittest.TestCase):
+    def test_always_one(self):
+        adapter = NoOpVectorDB.__new__(NoOpVectorDB)
+        self.assertEqual(adapter.count_nodes(ref_doc_id="doc-1"), 1)
+        self.assertEqual(adapter.count_nodes(ref_doc_id="missing"), 1)
+
+
+class VectorDBDocExistsTest(unittest.TestCase):
+    def setUp(self):
+        self.vector_db = VectorDB(tool=MagicMock())
+        self.vector_db.vector_db_adapter_class = MagicMock()
+        self.vector_db._embedding_instance = MagicMock()
+        self.count_nodes = self.vector_db.vector_db_adapter_class.count_nodes
+
+    def test_native_count(self):
+        self.count_nodes.return_value = 0
+        self.assertFalse(self.vector_db.doc_exists(ref_doc_id="doc-1"))
+        self.count_nodes.return_value = 2
+        self.assertTrue(self.vector_db.doc_exists(ref_doc_id="doc-1"))
+        self.assertEqual(self.vector_db.count_nodes(ref_doc_id="doc-1"), 2)
+        self.vector_db._embedding_instance.get_query_embedding.assert_not_called()
+
+    def test_falls_back_to_query(self):
+        self.count_nodes.side_effect = NotImplementedError
+        self.vector_db.vector_db_adapter_class.name = "Supabase"
+        self.vector_db.query = MagicMock(return_value=MagicMock(nodes=[MagicMock()]))
+        self.assertTrue(self.vector_db.doc_exists(ref_doc_id="doc-1"))
+        self.vector_db._embedding_instance.get_query_embedding.assert_called_once()
+        query = self.vector_db.query.call_args.kwargs["query"]
+        self.assertEqual(query.doc_ids, ["doc-1"])
+        self.assertEqual(query.filters.filters[0].key, "doc_id")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import ClassVar
+
+from llama_index.core.callbacks import CallbackManager, CBEventType, EventPayload
+from llama_index.core.callbacks.base_handler import BaseCallbackHandler
+from llama_index.core.embeddings import MockEmbedding
+from unstract.sdk.utils.cache_backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+)
+from unstract.sdk.utils.embedding_cache import (
+    CachedEmbedding,
+    decode_embedding,
+    encode_embedding,
+)
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+class CountingEmbedding(MockEmbedding):
+    calls: ClassVar[list[list[str]]] = []
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        return [[float(len(text))] * self.embed_dim for text in texts]
+
+    async def _aget_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        return self._get_text_embeddings(texts)
+
+    def _get_query_embedding(self, query: str) -> list[float]:
+        self.calls.append([query])
+        return [0.5] * self.embed_dim
+
+
+class ChunkRecorder(BaseCallbackHandler):
+    def __init__(self) -> None:
+        super().__init__(event_starts_to_ignore=[], event_ends_to_ignore=[])
+        self.chunks: list[str] = []
+
+    def on_event_start(self, event_type, payload=None, event_id="", **kwargs):
+        return event_id
+
+    def on_event_end(self, event_type, payload=None, event_id="", **kwargs):
+        if event_type == CBEventType.EMBEDDING and payload:
+            self.chunks.extend(payload.get(EventPayload.CHUNKS, []))
+
+    def start_trace(self, trace_id=None):
+        pass
+
+    def end_trace(self, trace_id=None, trace_map=None):
+        pass
+
+
+class CacheBackendTestMixin:
+    backend: CacheBackend
+
+    def test_set_and_get_many(self):
+        self.backend.set_many({"a": b"1", "b": b"2"})
+        self.assertEqual(self.backend.get_many(["a", "b", "c"]), {"a": b"1", "b": b"2"})
+        self.assertEqual(self.backend.get("a"), b"1")
+        self.assertIsNone(self.backend.get("c"))
+
+    def test_delete(self):
+        self.backend.set("a", b"1")
+        self.backend.delete("a")
+        self.assertIsNone(self.backend.get("a"))
+
+
+class MemoryCacheBackendTest(CacheBackendTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.backend = MemoryCacheBackend(maxsize=2)
+
+    def test_lru_eviction(self):
+        self.backend.set_many({"a": b"1", "b": b"2"})
+        self.backend.get("a")
+        self.backend.set("c", b"3")
+        self.assertEqual(set(self.backend.get_many(["a", "b", "c"])), {"a", "c"})
+
+
+class SQLiteCacheBackendTest(CacheBackendTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "cache.db")
+        self.backend = SQLiteCacheBackend(self.db_path)
+
+    def tearDown(self):
+        self.backend.close()
+        self.tmp_dir.cleanup()
+
+    def test_persists_across_instances(self):
+        self.backend.set("a", b"1")
+        other = SQLiteCacheBackend(self.db_path)
+        self.assertEqual(other.get("a"), b"1")
+        other.close()
+
+    def test_many_keys(self):
+        items = {str(i): bytes([i % 256]) for i in range(1200)}
+        self.backend.set_many(items)
+        self.assertEqual(self.backend.get_many(list(items)), items)
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class RedisCacheBackendTest(CacheBackendTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.backend = RedisCacheBackend(client=fakeredis.FakeRedis())
+
+
+class CachedEmbeddingTest(unittest.TestCase):
+    def setUp(self):
+        CountingEmbedding.calls = []
+        self.recorder = ChunkRecorder()
+        self.base = CountingEmbedding(
+            embed_dim=4, callback_manager=CallbackManager([self.recorder])
+        )
+        self.backend = MemoryCacheBackend()
+        self.embedding = CachedEmbedding(
+            embedding=self.base, backend=self.backend, config_hash="config"
+        )
+
+    def test_float32_round_trip(self):
+        vector = [0.25, -1.5, 3.0]
+        self.assertEqual(decode_embedding(encode_embedding(vector)), vector)
+        self.assertEqual(len(encode_embedding(vector)), 12)
+
+    def test_only_misses_are_embedded(self):
+        first = self.embedding.get_text_embedding_batch(["a", "bb", "a"])
+        second = self.embedding.get_text_embedding_batch(["bb", "ccc"])
+
+        self.assertEqual(CountingEmbedding.calls, [["a", "bb"], ["ccc"]])
+        self.assertEqual(first[1], second[0])
+        self.assertEqual(second[1], [3.0] * 4)
+        stats = self.embedding.get_stats()
+        self.assertEqual((stats.hits, stats.misses), (2, 3))
+        # Usage is only recorded for the texts sent to the provider
+        self.assertEqual(self.recorder.chunks, ["a", "bb", "ccc"])
+
+    def test_query_and_text_are_cached_separately(self):
+        self.embedding.get_text_embedding("a")
+        self.assertEqual(self.embedding.get_query_embedding("a"), [0.5] * 4)
+        self.embedding.get_query_embedding("a")
+        self.assertEqual(CountingEmbedding.calls, [["a"], ["a"]])
+
+    def test_config_is_part_of_key(self):
+        self.embedding.get_text_embedding("a")
+        other = CachedEmbedding(
+            embedding=self.base, backend=self.backend, config_hash="other"
+        )
+        other.get_text_embedding("a")
+        self.assertEqual(len(CountingEmbedding.calls), 2)
+
+    def test_async(self):
+        self.embedding.get_text_embedding_batch(["a"])
+        result = asyncio.run(self.embedding.aget_text_embedding_batch(["a", "bb"]))
+        self.assertEqual(result, [[1.0] * 4, [2.0] * 4])
+        self.assertEqual(CountingEmbedding.calls, [["a"], ["bb"]])
+
+    def test_backend_errors_are_misses(self):
+        class FailingBackend(MemoryCacheBackend):
+            def get_many(self, keys):
+                raise ConnectionError("down")
+
+        embedding = CachedEmbedding(
+            embedding=self.base, backend=FailingBackend(), config_hash="config"
+        )
+        self.assertEqual(embedding.get_text_embedding("a"), [1.0] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
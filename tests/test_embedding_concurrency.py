@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+from llama_index.core.callbacks import CallbackManager, CBEventType, EventPayload
+from llama_index.core.callbacks.base_handler import BaseCallbackHandler
+from llama_index.core.embeddings import MockEmbedding
+from unstract.sdk.embedding import Embedding
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend
+from unstract.sdk.utils.callback_manager import CallbackManager as UsageCallbackManager
+from unstract.sdk.utils.tokenizer import count_tokens_batch
+
+from tests.fake_adapters import FAKE_EMBEDDING_ADAPTER_ID, create_embedding, fake_adapter
+
+
+class RecordingEmbedding(MockEmbedding):
+    """Tracks the batches sent and how many were in flight at once."""
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _in_flight: int = PrivateAttr(default=0)
+    batches: list[list[str]] = Field(default_factory=list)
+    max_in_flight: int = 0
+
+    def _enter(self, texts: list[str]) -> None:
+        with self._lock:
+            self.batches.append(texts)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self._enter(texts)
+        try:
+            threading.Event().wait(0.02)
+            return [[float(text)] * self.embed_dim for text in texts]
+        finally:
+            self._exit()
+
+    async def _aget_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self._enter(texts)
+        try:
+            await asyncio.sleep(0.02)
+            return [[float(text)] * self.embed_dim for text in texts]
+        finally:
+            self._exit()
+
+
+class ChunkRecorder(BaseCallbackHandler):
+    def __init__(self) -> None:
+        super().__init__(event_starts_to_ignore=[], event_ends_to_ignore=[])
+        self.events = 0
+        self.chunks: list[str] = []
+
+    def on_event_start(self, event_type, payload=None, event_id="", **kwargs):
+        return event_id
+
+    def on_event_end(self, event_type, payload=None, event_id="", **kwargs):
+        if event_type == CBEventType.EMBEDDING and payload:
+            self.events += 1
+            self.chunks.extend(payload.get(EventPayload.CHUNKS, []))
+
+    def start_trace(self, trace_id=None):
+        pass
+
+    def end_trace(self, trace_id=None, trace_map=None):
+        pass
+
+
+@fake_adapter(
+    Embedding.embedding_adapters,
+    FAKE_EMBEDDING_ADAPTER_ID,
+    lambda: RecordingEmbedding(embed_dim=2, embed_batch_size=10),
+)
+@patch("unstract.sdk.embedding.SdkHelper.is_public_adapter", return_value=True)
+class ConcurrentEmbeddingTest(unittest.TestCase):
+    def setUp(self):
+        Embedding.clear_dimension_cache()
+        self.texts = [str(i) for i in range(100)]
+        self.expected = [[float(i)] * 2 for i in range(100)]
+        self.recorder = ChunkRecorder()
+
+    def create_embedding(self, **kwargs: Any) -> Embedding:
+        embedding = create_embedding(
+            metadata={"model": "fake", "embedding_dimension": 2}, **kwargs
+        )
+        embedding._get_base_embedding().callback_manager = CallbackManager(
+            [self.recorder]
+        )
+        return embedding
+
+    def test_concurrent_preserves_order(self, _):
+        embedding = self.create_embedding()
+        model = embedding._get_base_embedding()
+
+        result = embedding.get_text_embeddings_concurrent(self.texts, max_in_flight=4)
+
+        self.assertEqual(result, self.expected)
+        self.assertGreater(model.max_in_flight, 1)
+        self.assertLessEqual(model.max_in_flight, 4)
+        self.assertEqual(self.recorder.events, len(model.batches))
+        self.assertCountEqual(self.recorder.chunks, self.texts)
+
+    def test_async_preserves_order(self, _):
+        embedding = self.create_embedding()
+        model = embedding._get_base_embedding()
+
+        result = asyncio.run(embedding.aget_text_embeddings(self.texts, max_in_flight=3))
+
+        self.assertEqual(result, self.expected)
+        self.assertGreater(model.max_in_flight, 1)
+        self.assertLessEqual(model.max_in_flight, 3)
+        self.assertCountEqual(self.recorder.chunks, self.texts)
+
+    def test_async_query(self, _):
+        embedding = self.create_embedding()
+        self.assertEqual(
+            asyncio.run(embedding.aget_query_embedding("query")),
+            embedding.get_query_embedding("query"),
+        )
+
+    def test_cached_texts_are_not_resent(self, _):
+        embedding = self.create_embedding(cache_backend=MemoryCacheBackend())
+        embedding.get_text_embeddings_concurrent(self.texts[:50])
+
+        result = asyncio.run(embedding.aget_text_embeddings(self.texts))
+
+        self.assertEqual(result, self.expected)
+        self.assertCountEqual(self.recorder.chunks, self.texts)
+        self.assertEqual(embedding.get_cache_stats().hits, 50)
+
+    @patch("unstract.sdk.utils.usage_handler.Audit.push_usage_data")
+    def test_concurrent_usage(self, push_usage_data, _):
+        embedding = self.create_embedding()
+        model = embedding._get_base_embedding()
+        model.callback_manager = UsageCallbackManager.get_callback_manager(
+            model, platform_api_key="api-key", kwargs={}
+        )
+        reported = []
+
+        def _push_usage_data(token_counter, **kwargs):
+            reported.append(token_counter.total_embedding_token_count)
+            # Lets other batches end while this one is being reported
+            threading.Event().wait(0.01)
+
+        push_usage_data.side_effect = _push_usage_data
+
+        embedding.get_text_embeddings_concurrent(self.texts, max_in_flight=4)
+
+        self.assertGreater(model.max_in_flight, 1)
+        self.assertEqual(len(reported), len(model.batches))
+        self.assertEqual(
+            sum(reported), sum(count_tokens_batch(self.texts, model.model_name))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
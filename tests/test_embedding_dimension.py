@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from typing import Any, ClassVar
+from unittest.mock import MagicMock, patch
+
+from llama_index.core.embeddings import MockEmbedding
+from unstract.sdk.adapters.embedding.helper import EmbeddingHelper
+from unstract.sdk.adapters.embedding.open_ai.src import OpenAI
+from unstract.sdk.embedding import Constants, Embedding
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend
+
+from tests.fake_adapters import FAKE_EMBEDDING_ADAPTER_ID, create_embedding, fake_adapter
+
+
+class ProbedEmbedding(MockEmbedding):
+    probes: ClassVar[int] = 0
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        ProbedEmbedding.probes += 1
+        return super()._get_text_embedding(text)
+
+
+class EmbeddingHelperDimensionTest(unittest.TestCase):
+    def test_declared_dimension(self):
+        self.assertEqual(
+            EmbeddingHelper.get_embedding_dimension({"embedding_dimension": "768"}), 768
+        )
+        self.assertIsNone(EmbeddingHelper.get_embedding_dimension({}))
+
+    def test_known_model(self):
+        self.assertEqual(
+            OpenAI({"model": "text-embedding-3-large"}).get_embedding_dimension(), 3072
+        )
+        self.assertIsNone(OpenAI({"model": "custom"}).get_embedding_dimension())
+
+
+@fake_adapter(
+    Embedding.embedding_adapters,
+    FAKE_EMBEDDING_ADAPTER_ID,
+    lambda: ProbedEmbedding(embed_dim=8),
+)
+class EmbeddingDimensionCacheTest(unittest.TestCase):
+    def setUp(self):
+        ProbedEmbedding.probes = 0
+        Embedding.clear_dimension_cache()
+        self.tool = MagicMock()
+        self.tool.get_env_or_die.return_value = "api-key"
+        self.metadata: dict[str, Any] = {}
+
+    def tearDown(self):
+        Embedding.clear_dimension_cache()
+
+    def create_embedding(self, **kwargs: Any) -> Embedding:
+        return create_embedding(metadata=self.metadata, tool=self.tool, **kwargs)
+
+    def test_probed_once_per_config(self):
+        self.assertEqual(self.create_embedding()._length, 8)
+        self.assertEqual(self.create_embedding()._length, 8)
+        self.assertEqual(ProbedEmbedding.probes, 1)
+
+        self.metadata["model"] = "other"
+        self.create_embedding()
+        self.assertEqual(ProbedEmbedding.probes, 2)
+
+    def test_declared_dimension_is_not_probed(self):
+        self.metadata["embedding_dimension"] = 8
+        self.assertEqual(self.create_embedding()._length, 8)
+        self.assertEqual(ProbedEmbedding.probes, 0)
+
+    def test_persisted_in_cache_backend(self):
+        backend = MemoryCacheBackend()
+        self.create_embedding(cache_backend=backend)
+        Embedding.clear_dimension_cache()
+        self.assertEqual(self.create_embedding(cache_backend=backend)._length, 8)
+        self.assertEqual(ProbedEmbedding.probes, 1)
+
+    def test_persisted_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "dimensions.db")
+            with patch.dict(os.environ, {Constants.DIMENSION_CACHE_PATH: db_path}):
+                self.create_embedding()
+                Embedding.clear_dimension_cache()
+                self.create_embedding()
+                Embedding._dimension_cache_backend.close()
+                Embedding._dimension_cache_backend = None
+        self.assertEqual(ProbedEmbedding.probes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from unstract.sdk.file_storage import (
+    ExtractionCache,
+    FileStorage,
+    FileStorageProvider,
+)
+
+
+class ExtractionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fs = FileStorage(provider=FileStorageProvider.LOCAL)
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.cache = ExtractionCache(cache_dir=self.cache_dir, fs=self.fs)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_generate_key(self):
+        config = {"adapter_id": "llmwhisperer|1", "mode": "high_quality"}
+        key = ExtractionCache.generate_key("hash", config, enable_highlight=False)
+        reordered = dict(reversed(list(config.items())))
+        self.assertEqual(
+            key, ExtractionCache.generate_key("hash", reordered, enable_highlight=False)
+        )
+        self.assertNotEqual(
+            key, ExtractionCache.generate_key("hash", config, enable_highlight=True)
+        )
+        self.assertNotEqual(
+            key,
+            ExtractionCache.generate_key(
+                "hash", {**config, "mode": "form"}, enable_highlight=False
+            ),
+        )
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("key"))
+        self.cache.put("key", extracted_text="text", whisper_hash="whisper")
+        entry = self.cache.get("key")
+        self.assertEqual(entry.extracted_text, "text")
+        self.assertEqual(entry.whisper_hash, "whisper")
+        self.assertIsNone(entry.highlight_metadata)
+
+    def test_restore_output_with_highlight_metadata(self):
+        output_dir = os.path.join(self.tmp_dir.name, "project_1", "extract")
+        metadata_dir = os.path.join(output_dir, "metadata")
+        os.makedirs(metadata_dir)
+        output_path = os.path.join(output_dir, "doc.txt")
+        with open(os.path.join(metadata_dir, "doc.json"), "w") as f:
+            f.write('{"line_metadata": []}')
+        self.cache.put("key", extracted_text="text", output_file_path=output_path)
+
+        # Same document extracted for another project
+        other_output_path = os.path.join(self.tmp_dir.name, "project_2", "doc.txt")
+        os.makedirs(os.path.dirname(other_output_path))
+        self.cache.restore_output(self.cache.get("key"), other_output_path)
+
+        with open(other_output_path) as f:
+            self.assertEqual(f.read(), "text")
+        other_metadata_path = os.path.join(
+            self.tmp_dir.name, "project_2", "metadata", "doc.json"
+        )
+        with open(other_metadata_path) as f:
+            self.assertEqual(f.read(), '{"line_metadata": []}')
+
+    def test_eviction(self):
+        cache = ExtractionCache(cache_dir=self.cache_dir, fs=self.fs, max_size_bytes=250)
+        for key in ("a", "b", "c"):
+            cache.put(key, extracted_text="x" * 100)
+            # Modification times need to differ for the eviction order
+            time.sleep(0.01)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_entries_listed_when_over_limit(self):
+        cache = ExtractionCache(cache_dir=self.cache_dir, fs=self.fs, max_size_bytes=250)
+        with patch.object(self.fs, "ls", wraps=self.fs.ls) as ls:
+            cache.put("a", extracted_text="x" * 10)
+            cache.put("b", extracted_text="x" * 10)
+            # Listed on the first write only
+            self.assertEqual(ls.call_count, 1)
+            cache.put("c", extracted_text="x" * 300)
+            self.assertEqual(ls.call_count, 2)
+
+    def test_default_storage(self):
+        cache = ExtractionCache(cache_dir=self.cache_dir)
+        cache.put("key", extracted_text="text")
+        self.assertEqual(cache.get("key").extracted_text, "text")
+
+    def test_delete(self):
+        self.cache.put("key", extracted_text="text")
+        self.cache.delete("key")
+        self.assertIsNone(self.cache.get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+from requests.adapters import HTTPAdapter
+
+from unstract.sdk import platform
+from unstract.sdk.cache import ToolCache
+from unstract.sdk.constants import ToolEnv
+from unstract.sdk.platform import HttpService, HttpSessionConfig
+from unstract.sdk.scripts.http_session_benchmark import _StandInHandler
+
+
+class HttpSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        _StandInHandler.connections = 0
+        patcher = patch.dict(platform._sessions, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(platform.close_http_sessions)
+
+    def test_connections_reused(self):
+        session = platform.get_http_session()
+        for _ in range(5):
+            session.get(f"{self.url}/platform_details").raise_for_status()
+        self.assertEqual(_StandInHandler.connections, 1)
+        self.assertIs(platform.get_http_session(), session)
+        self.assertIsNot(platform.get_http_session(HttpService.PROMPT), session)
+
+    def test_clients_share_session(self):
+        tool = MagicMock()
+        host, port = self.url.rsplit(":", 1)
+        tool.get_env_or_die.side_effect = {
+            ToolEnv.PLATFORM_API_KEY: "api-key",
+        }.get
+        cache = ToolCache(tool=tool, platform_host=host, platform_port=int(port))
+        for key in ("a", "b", "c"):
+            cache.get(key)
+        self.assertEqual(_StandInHandler.connections, 1)
+
+    def test_default_timeout(self):
+        session = platform.create_http_session(
+            HttpSessionConfig(connect_timeout=1, read_timeout=2)
+        )
+        self.addCleanup(session.close)
+        adapter = session.get_adapter(self.url)
+        with patch.object(
+            HTTPAdapter, "send", autospec=True, side_effect=HTTPAdapter.send
+        ) as send:
+            session.get(self.url)
+            self.assertEqual(send.call_args.kwargs["timeout"], (1, 2))
+            session.get(self.url, timeout=5)
+            self.assertEqual(send.call_args.kwargs["timeout"], 5)
+        self.assertEqual(adapter.max_retries.connect, 2)
+
+    def test_config_from_env(self):
+        env = {
+            "PLATFORM_SERVICE_POOL_MAXSIZE": "32",
+            "PLATFORM_SERVICE_READ_TIMEOUT": "0",
+        }
+        with patch.dict(os.environ, env):
+            config = HttpSessionConfig.from_env(HttpService.PLATFORM)
+        self.assertEqual(config.pool_maxsize, 32)
+        self.assertIsNone(config.read_timeout)
+        self.assertIsNone(HttpSessionConfig.from_env(HttpService.PROMPT).read_timeout)
+        config = HttpSessionConfig.from_env(HttpService.PLATFORM)
+        self.assertEqual(config.read_timeout, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+import json
+import unittest
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+from llama_index.core.schema import (
+    MetadataMode,
+    NodeRelationship,
+    RelatedNodeInfo,
+    TextNode,
+)
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
+from llama_index.vector_stores.qdrant import QdrantVectorStore
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import Distance, PointStruct, VectorParams
+from unstract.sdk.adapters.vectordb.postgres.src.postgres import Postgres
+from unstract.sdk.adapters.vectordb.qdrant.src.qdrant import Qdrant
+from unstract.sdk.utils.incremental_indexing import (
+    Constants,
+    annotate_chunks,
+    diff_chunks,
+    sort_chunks,
+)
+from unstract.sdk.vector_db import VectorDB
+
+
+def make_nodes(texts: list[str], doc_id: str = "doc-1") -> list[TextNode]:
+    nodes = []
+    for text in texts:
+        node = TextNode(text=text, metadata={"section": "full"})
+        node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id=doc_id)
+        nodes.append(node)
+    return annotate_chunks(nodes)
+
+
+def store(nodes: list[TextNode]) -> list[TextNode]:
+    for node in nodes:
+        node.embedding = [float(len(node.text))]
+    return nodes
+
+
+class AnnotateChunksTest(unittest.TestCase):
+    def test_ids_are_deterministic(self):
+        first = make_nodes(["alpha", "beta"])
+        second = make_nodes(["alpha", "beta"])
+        self.assertEqual(
+            [node.node_id for node in first], [node.node_id for node in second]
+        )
+        self.assertNotEqual(first[0].node_id, first[1].node_id)
+
+    def test_metadata_is_not_embedded(self):
+        node = make_nodes(["alpha"])[0]
+        self.assertEqual(node.metadata[Constants.CHUNK_INDEX], 0)
+        content = node.get_content(metadata_mode=MetadataMode.EMBED)
+        self.assertNotIn(Constants.CHUNK_HASH, content)
+        self.assertNotIn(Constants.CHUNK_INDEX, content)
+
+    def test_neighbours_are_relinked(self):
+        nodes = make_nodes(["alpha", "beta", "gamma"])
+        self.assertEqual(nodes[1].prev_node.node_id, nodes[0].node_id)
+        self.assertEqual(nodes[1].next_node.node_id, nodes[2].node_id)
+        self.assertIsNone(nodes[0].prev_node)
+        self.assertIsNone(nodes[2].next_node)
+
+
+class DiffChunksTest(unittest.TestCase):
+    def test_unchanged_document(self):
+        stored = store(make_nodes(["alpha", "beta"]))
+        diff = diff_chunks(make_nodes(["alpha", "beta"]), stored)
+        self.assertEqual(diff.unchanged, 2)
+        self.assertEqual(diff.to_add, [])
+        self.assertEqual(diff.to_delete, [])
+
+    def test_changed_chunk(self):
+        stored = store(make_nodes(["alpha", "beta", "gamma"]))
+        diff = diff_chunks(make_nodes(["alpha", "BETA", "gamma"]), stored)
+        self.assertEqual(diff.unchanged, 2)
+        self.assertEqual([node.text for node in diff.to_embed], ["BETA"])
+        self.assertEqual(diff.to_delete, [stored[1].node_id])
+
+    def test_moved_chunk_reuses_embedding(self):
+        stored = store(make_nodes(["alpha", "beta"]))
+        diff = diff_chunks(make_nodes(["intro", "alpha", "beta"]), stored)
+        self.assertEqual(diff.unchanged, 0)
+        self.assertEqual([node.text for node in diff.to_embed], ["intro"])
+        self.assertEqual(len(diff.to_add), 3)
+        self.assertEqual(diff.to_add[1].embedding, [5.0])
+        self.assertCountEqual(diff.to_delete, [node.node_id for node in stored])
+
+    def test_legacy_nodes_are_stale(self):
+        legacy = TextNode(text="alpha", embedding=[1.0])
+        diff = diff_chunks(make_nodes(["alpha"]), [legacy])
+        self.assertEqual(len(diff.to_embed), 1)
+        self.assertEqual(diff.to_delete, [legacy.node_id])
+
+
+
+class SortChunksTest(unittest.TestCase):
+    def test_orders_by_chunk_index(self):
+        nodes = make_nodes([f"chunk {i}" for i in range(12)])
+        shuffled = nodes[6:] + nodes[:6]
+        # Some vector DBs return numeric metadata as float
+        shuffled[0].metadata[Constants.CHUNK_INDEX] = 6.0
+        self.assertEqual(
+            [node.text for node in sort_chunks(shuffled)],
+            [node.text for node in nodes],
+        )
+
+    def test_legacy_nodes_ordered_by_offset(self):
+        nodes = [
+            TextNode(text="second", start_char_idx=10),
+            TextNode(text="first", start_char_idx=0),
+        ]
+        self.assertEqual([node.text for node in sort_chunks(nodes)], ["first", "second"])
+
+
+class SortedNodesTest(unittest.TestCase):
+    def setUp(self):
+        self.nodes = make_nodes([f"chunk {i}" for i in range(9)])
+        self.vector_db = VectorDB(tool=MagicMock())
+        self.vector_db.vector_db_adapter_class = MagicMock()
+        self.adapter = self.vector_db.vector_db_adapter_class
+
+    def test_sorted_across_pages(self):
+        self.adapter.iter_sorted_node_pages.side_effect = NotImplementedError
+        # Pages come back in no particular order
+        self.adapter.iter_node_pages.return_value = iter(
+            [self.nodes[6:], self.nodes[:3], self.nodes[3:6]]
+        )
+        self.assertEqual(
+            [node.text for node in self.vector_db.get_sorted_nodes(ref_doc_id="doc-1")],
+            [node.text for node in self.nodes],
+        )
+
+    def test_ordered_pages_are_read_lazily(self):
+        fetched = []
+
+        def pages() -> Iterator[list[TextNode]]:
+            for start in range(0, 9, 3):
+                fetched.append(start)
+                yield self.nodes[start : start + 3]
+
+        self.adapter.iter_sorted_node_pages.return_value = pages()
+        nodes = self.vector_db.get_sorted_nodes(ref_doc_id="doc-1")
+
+        self.assertEqual(next(nodes).text, "chunk 0")
+        self.assertEqual(fetched, [0])
+        self.assertEqual([node.text for node in nodes][-1], "chunk 8")
+        self.assertEqual(fetched, [0, 3, 6])
+        self.adapter.iter_node_pages.assert_not_called()
+
+
+class QdrantSortedNodesTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = Qdrant.__new__(Qdrant)
+        self.adapter._client = QdrantClient(location=":memory:")
+        self.adapter._collection_name = "unstract_2"
+        self.adapter._chunk_index_indexed = False
+        self.adapter._vector_db_instance = QdrantVectorStore(
+            client=self.adapter._client, collection_name="unstract_2"
+        )
+        self.adapter._client.create_collection(
+            collection_name="unstract_2",
+            vectors_config=VectorParams(size=2, distance=Distance.COSINE),
+        )
+
+    def add(self, nodes: list[TextNode]) -> None:
+        points = []
+        for i, node in enumerate(nodes):
+            payload = node_to_metadata_dict(node)
+            payload["doc_id"] = node.ref_doc_id
+            points.append(PointStruct(id=node.node_id, vector=[1.0, i], payload=payload))
+        # Inserted out of order
+        self.adapter._client.upsert(collection_name="unstract_2", points=points[::-1])
+
+    @patch(
+        "unstract.sdk.adapters.vectordb.qdrant.src.qdrant.Constants.SCROLL_PAGE_SIZE", 3
+    )
+    def test_pages_in_order(self):
+        nodes = make_nodes([f"chunk {i}" for i in range(8)])
+        self.add(nodes)
+        self.add(make_nodes(["other"], doc_id="doc-2"))
+
+        pages = list(self.adapter.iter_sorted_node_pages("doc-1", with_embeddings=False))
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 2])
+        self.assertEqual(
+            [node.text for page in pages for node in page],
+            [node.text for node in nodes],
+        )
+
+    def test_nodes_without_chunk_index(self):
+        node = TextNode(text="legacy")
+        node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id="doc-1")
+        self.add([*make_nodes(["chunk 0"]), node])
+        with self.assertRaises(NotImplementedError):
+            self.adapter.iter_sorted_node_pages("doc-1")
+
+
+class PostgresSortedNodesTest(unittest.TestCase):
+    def setUp(self):
+        self.adapter = Postgres.__new__(Postgres)
+        self.adapter._client = MagicMock()
+        self.adapter._schema_name = "public"
+        self.adapter._collection_name = "unstract_2"
+        self.cursor = self.adapter._client.cursor.return_value.__enter__.return_value
+
+    def test_pages_in_order(self):
+        rows = [
+            (node.text, node_to_metadata_dict(node), json.dumps([1.0, i]))
+            for i, node in enumerate(make_nodes([f"chunk {i}" for i in range(5)]))
+        ]
+        self.cursor.fetchmany.side_effect = [rows[:3], rows[3:], []]
+
+        pages = list(self.adapter.iter_sorted_node_pages("doc-1"))
+
+        self.assertEqual([len(page) for page in pages], [3, 2])
+        self.assertEqual(pages[1][1].text, "chunk 4")
+        self.assertEqual(pages[1][1].embedding, [1.0, 4])
+        # Read through a server side cursor, ordered by the database
+        self.assertIn("name", self.adapter._client.cursor.call_args.kwargs)
+        query = self.cursor.execute.call_args.args[0]
+        self.assertIn("ORDER BY", repr(query))
+        self.adapter._client.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
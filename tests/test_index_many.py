@@ -0,0 +1,89 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from unstract.sdk.exceptions import IndexingError
+from unstract.sdk.index import Index, IndexFileResult, IndexFileSpec
+
+
+@patch("unstract.sdk.index.X2Text")
+@patch("unstract.sdk.index.VectorDB")
+@patch("unstract.sdk.index.Embedding")
+class IndexManyTest(unittest.TestCase):
+    def setUp(self):
+        self.index = Index(tool=MagicMock())
+        patcher = patch.object(
+            Index,
+            "generate_index_key",
+            side_effect=lambda file_path, **kwargs: f"doc-{file_path}",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls: list[dict] = []
+
+    def _index_file(self, **kwargs) -> str:
+        self.calls.append(kwargs)
+        file_path = kwargs["file_path"]
+        # Earlier files finish last, to check the results are ordered
+        time.sleep(0.01 * (5 - int(file_path[-1])))
+        if file_path == "file-2":
+            raise IndexingError("No text available to index")
+        if file_path == "file-3":
+            raise KeyError("unexpected")
+        return kwargs["doc_id"]
+
+    def _index_many(self, files: list[IndexFileSpec]) -> list[IndexFileResult]:
+        with patch.object(Index, "_index_file", side_effect=self._index_file):
+            return self.index.index_many(
+                files=files,
+                embedding_instance_id="embedding",
+                vector_db_instance_id="vector_db",
+                x2text_instance_id="x2text",
+                chunk_size=512,
+                chunk_overlap=64,
+                max_workers=4,
+            )
+
+    def test_results_ordered(self, embedding_cls, vector_db_cls, x2text_cls):
+        files = [IndexFileSpec(file_path=f"file-{i}") for i in range(5)]
+        results = self._index_many(files)
+        self.assertEqual(
+            [result.file_path for result in results], [f"file-{i}" for i in range(5)]
+        )
+        self.assertEqual(results[0].doc_id, "doc-file-0")
+
+    def test_errors_captured(self, embedding_cls, vector_db_cls, x2text_cls):
+        files = [IndexFileSpec(file_path=f"file-{i}") for i in range(5)]
+        results = self._index_many(files)
+        self.assertEqual(
+            [result.is_success for result in results], [True, True, False, False, True]
+        )
+        self.assertIsInstance(results[2].error, IndexingError)
+        self.assertIsInstance(results[3].error, KeyError)
+
+    def test_adapters_shared(self, embedding_cls, vector_db_cls, x2text_cls):
+        files = [
+            IndexFileSpec(file_path="file-0", reindex=True, tags=["a"]),
+            IndexFileSpec(file_path="file-1"),
+        ]
+        self._index_many(files)
+        embedding_cls.assert_called_once()
+        vector_db_cls.assert_called_once()
+        x2text_cls.assert_called_once()
+        for call in self.calls:
+            self.assertIs(call["embedding"], embedding_cls.return_value)
+            self.assertIs(call["vector_db"], vector_db_cls.return_value)
+            self.assertIs(call["x2text"], x2text_cls.return_value)
+        options = {
+            call["file_path"]: (call["reindex"], call["tags"]) for call in self.calls
+        }
+        self.assertEqual(options, {"file-0": (True, ["a"]), "file-1": (False, None)})
+        vector_db_cls.return_value.close.assert_called_once()
+
+    def test_no_files(self, embedding_cls, vector_db_cls, x2text_cls):
+        self.assertEqual(self._index_many([]), [])
+        embedding_cls.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
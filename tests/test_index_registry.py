@@ -0,0 +1,151 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from unstract.sdk.exceptions import IndexingError
+from unstract.sdk.index import Index
+from unstract.sdk.index_registry import (
+    IndexRegistry,
+    RedisIndexRegistry,
+    SQLiteIndexRegistry,
+)
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend
+from unstract.sdk.vector_db import VectorDB
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+class IndexRegistryTestMixin:
+    registry: IndexRegistry
+
+    def test_record_and_get(self):
+        self.assertIsNone(self.registry.get("doc-1"))
+        self.registry.record("doc-1", node_count=12)
+        record = self.registry.get("doc-1")
+        self.assertEqual(record.doc_id, "doc-1")
+        self.assertEqual(record.node_count, 12)
+        self.assertGreater(record.indexed_at, 0)
+        self.assertTrue(self.registry.contains("doc-1"))
+
+    def test_record_replaces(self):
+        self.registry.record("doc-1", node_count=12)
+        self.registry.record("doc-1", node_count=3)
+        self.assertEqual(self.registry.get("doc-1").node_count, 3)
+
+    def test_remove(self):
+        self.registry.record("doc-1")
+        self.registry.remove("doc-1")
+        self.assertFalse(self.registry.contains("doc-1"))
+        # Removing a missing doc_id is a no-op
+        self.registry.remove("doc-1")
+
+
+class MemoryIndexRegistryTest(IndexRegistryTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.registry = IndexRegistry(MemoryCacheBackend())
+
+
+class SQLiteIndexRegistryTest(IndexRegistryTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "registry", "index.db")
+        self.registry = SQLiteIndexRegistry(self.db_path)
+
+    def tearDown(self):
+        self.registry.close()
+        self.tmp_dir.cleanup()
+
+    def test_persists_across_instances(self):
+        self.registry.record("doc-1", node_count=5)
+        other = SQLiteIndexRegistry(self.db_path)
+        self.assertEqual(other.get("doc-1").node_count, 5)
+        other.close()
+
+    def test_concurrent_access(self):
+        doc_ids = [f"doc-{i}" for i in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.registry.record, doc_ids))
+        self.assertTrue(all(self.registry.contains(doc_id) for doc_id in doc_ids))
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class RedisIndexRegistryTest(IndexRegistryTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.registry = RedisIndexRegistry(client=fakeredis.FakeRedis())
+
+
+class IndexNodeCountTest(unittest.TestCase):
+    def _index(self, pipelined: bool) -> tuple[int | None, MagicMock]:
+        vector_db = MagicMock()
+        vector_db.index_document_pipelined.return_value = 5
+        vector_db.count_nodes.return_value = 7
+        node_count = Index(tool=MagicMock(), pipelined=pipelined).index_to_vector_db(
+            vector_db=vector_db,
+            embedding=MagicMock(),
+            chunk_size=512,
+            chunk_overlap=64,
+            text_to_idx="Some text",
+            doc_id="doc-1",
+            doc_id_found=False,
+        )
+        return node_count, vector_db
+
+    def test_not_pipelined_by_default(self):
+        self.assertFalse(Index(tool=MagicMock())._pipelined)
+
+    def test_node_count(self):
+        node_count, vector_db = self._index(pipelined=False)
+        vector_db.index_document.assert_called_once()
+        vector_db.count_nodes.assert_called_once_with(ref_doc_id="doc-1")
+        self.assertEqual(node_count, 7)
+
+    def test_node_count_pipelined(self):
+        node_count, vector_db = self._index(pipelined=True)
+        vector_db.index_document.assert_not_called()
+        vector_db.count_nodes.assert_not_called()
+        self.assertEqual(node_count, 5)
+
+
+class IndexRegistryInvalidationTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = IndexRegistry(MemoryCacheBackend())
+        self.registry.record("doc-1", node_count=3)
+
+    def test_removed_on_delete(self):
+        vector_db = VectorDB(tool=MagicMock(), registry=self.registry)
+        vector_db.vector_db_adapter_class = MagicMock()
+        vector_db.delete(ref_doc_id="doc-1")
+        self.assertFalse(self.registry.contains("doc-1"))
+
+    @patch.object(Index, "extract_text", return_value="Some text")
+    @patch.object(Index, "index_to_vector_db", side_effect=IndexingError("failed"))
+    def test_removed_on_failed_index(self, index_to_vector_db, extract_text):
+        index = Index(tool=MagicMock(), registry=self.registry)
+        with self.assertRaises(IndexingError):
+            index._index_file(
+                doc_id="doc-1",
+                embedding=MagicMock(),
+                vector_db=MagicMock(),
+                vector_db_instance_id="vector_db",
+                x2text_instance_id="x2text",
+                file_path="file.pdf",
+                chunk_size=512,
+                chunk_overlap=64,
+                reindex=True,
+                output_file_path=None,
+                enable_highlight=False,
+                usage_kwargs={},
+                process_text=None,
+                fs=MagicMock(),
+                tags=None,
+            )
+        self.assertFalse(self.registry.contains("doc-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
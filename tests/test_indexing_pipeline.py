@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+from llama_index.core.schema import Document, TextNode
+from unstract.sdk.utils.indexing_pipeline import IndexingPipeline
+
+
+class MockParser:
+    """Splits a document into fixed size character chunks."""
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+
+    def get_nodes_from_documents(self, documents: list[Document]) -> list[TextNode]:
+        nodes = []
+        for document in documents:
+            text = document.text
+            for start in range(0, len(text), self.chunk_size):
+                nodes.append(TextNode(text=text[start : start + self.chunk_size]))
+        return nodes
+
+
+class IndexingPipelineTest(unittest.TestCase):
+    def test_all_nodes_are_embedded_and_upserted(self):
+        upserted = []
+        lock = threading.Lock()
+
+        def upsert(nodes):
+            with lock:
+                upserted.extend(nodes)
+
+        pipeline = IndexingPipeline(
+            parser=MockParser(chunk_size=10),
+            embed_fn=lambda texts: [[float(len(text))] for text in texts],
+            upsert_fn=upsert,
+            embed_batch_size=3,
+            max_pending_batches=1,
+        )
+        count = pipeline.run([Document(text="x" * 95)])
+
+        self.assertEqual(count, 10)
+        self.assertEqual(len(upserted), 10)
+        self.assertTrue(all(node.embedding is not None for node in upserted))
+        self.assertEqual(upserted[-1].embedding, [5.0])
+
+    def test_embedding_error_is_raised(self):
+        def embed(texts):
+            raise RuntimeError("rate limited")
+
+        pipeline = IndexingPipeline(
+            parser=MockParser(chunk_size=10),
+            embed_fn=embed,
+            upsert_fn=lambda nodes: None,
+            embed_batch_size=2,
+            max_pending_batches=1,
+        )
+        with self.assertRaisesRegex(RuntimeError, "rate limited"):
+            pipeline.run([Document(text="x" * 1000)])
+
+    def test_upsert_error_is_raised(self):
+        def upsert(nodes):
+            raise RuntimeError("vector DB down")
+
+        pipeline = IndexingPipeline(
+            parser=MockParser(chunk_size=10),
+            embed_fn=lambda texts: [[1.0] for _ in texts],
+            upsert_fn=upsert,
+            embed_batch_size=2,
+            max_pending_batches=1,
+        )
+        with self.assertRaisesRegex(RuntimeError, "vector DB down"):
+            pipeline.run([Document(text="x" * 1000)])
+
+
+if __name__ == "__main__":
+    unittest.main()
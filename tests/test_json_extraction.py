@@ -0,0 +1,148 @@
+import json
+import re
+import timeit
+import unittest
+
+import pytest
+
+from unstract.sdk.utils.json_extraction import IncrementalJsonParser, extract_json
+
+# Regex previously used by LLM.complete(), for comparison
+JSON_REGEX = re.compile(r"\[(?:.|\n)*\]|\{(?:.|\n)*\}")
+MARKER = "§§§"
+
+
+def make_table_output(rows: int) -> str:
+    """Builds a table-heavy completion, as returned for line item prompts."""
+    items = [
+        {
+            "line": index,
+            "description": f'Item {index} with "quotes", [brackets] and {{braces}}',
+            "amounts": [index * 1.5, index * 2.25, None],
+        }
+        for index in range(rows)
+    ]
+    return f"Here are the line items:\n```json\n{json.dumps(items, indent=2)}\n```\n"
+
+
+class ExtractJsonTest(unittest.TestCase):
+    def test_whole_text(self):
+        self.assertEqual(extract_json(' {"a": 1}\n'), '{"a": 1}')
+        self.assertEqual(extract_json("[1, 2]"), "[1, 2]")
+
+    def test_surrounded_by_text(self):
+        text = 'Sure! {"a": [1, 2]} Hope it helps'
+        self.assertEqual(extract_json(text), '{"a": [1, 2]}')
+
+    def test_brackets_in_strings(self):
+        text = 'Result: {"a": "} ] \\" {", "b": [1]} done'
+        self.assertEqual(extract_json(text), '{"a": "} ] \\" {", "b": [1]}')
+
+    def test_skips_invalid_spans(self):
+        text = 'Use {placeholders} like [this, one] to get {"valid": true}'
+        self.assertEqual(extract_json(text), '{"valid": true}')
+
+    def test_first_balanced_span_if_none_parse(self):
+        self.assertEqual(extract_json("Value: {'a': 1} or {'b': 2}"), "{'a': 1}")
+
+    def test_unbalanced_falls_back_to_greedy(self):
+        text = 'Truncated {"a": [{"b": 1}, {"c": 2}, {"d":'
+        self.assertEqual(extract_json(text), JSON_REGEX.search(text).group(0))
+
+    def test_no_json(self):
+        self.assertIsNone(extract_json("No JSON here"))
+        self.assertIsNone(extract_json("Unclosed { and ["))
+
+    def test_selection_marker(self):
+        text = f'Ignore {{"x": 1}} {MARKER}{{"a": 1}}{MARKER} and {{"y": 2}}'
+        self.assertEqual(extract_json(text, MARKER), '{"a": 1}')
+
+    def test_matches_regex_on_single_json(self):
+        text = make_table_output(50)
+        self.assertEqual(extract_json(text), JSON_REGEX.search(text).group(0))
+
+
+class IncrementalJsonParserTest(unittest.TestCase):
+    TEXT = (
+        'Sure: {"name": "Jo\\"hn", "items": [1, 2, {"a": "x}"}], "ok": true}'
+        " Let me know if you need anything else"
+    )
+
+    def stream(self, chunk_size: int) -> tuple[IncrementalJsonParser, list]:
+        parser = IncrementalJsonParser()
+        values = []
+        for start in range(0, len(self.TEXT), chunk_size):
+            if parser.feed(self.TEXT[start : start + chunk_size]):
+                values.append(parser.partial().value)
+            if parser.complete:
+                break
+        return parser, values
+
+    def test_stops_at_end_of_value(self):
+        for chunk_size in (1, 3, 16):
+            parser, values = self.stream(chunk_size)
+            self.assertTrue(parser.complete)
+            self.assertEqual(
+                json.loads(parser.json_text),
+                {"name": 'Jo"hn', "items": [1, 2, {"a": "x}"}], "ok": True},
+            )
+            self.assertEqual(values[-1], json.loads(parser.json_text))
+            self.assertNotIn("anything else", parser.text)
+
+    def test_partial_values_grow(self):
+        _, values = self.stream(1)
+        self.assertEqual(values[0], {})
+        self.assertIn({"name": 'Jo"hn'}, values)
+        self.assertIn({"name": 'Jo"hn', "items": [1]}, values)
+
+    def test_open_string_is_closed(self):
+        parser = IncrementalJsonParser()
+        parser.feed('{"a": 1, "b": "hel')
+        self.assertEqual(parser.partial().value, {"a": 1, "b": "hel"})
+        parser.feed('lo", "c')
+        self.assertEqual(parser.partial().value, {"a": 1, "b": "hello"})
+        self.assertFalse(parser.complete)
+
+    def test_no_value(self):
+        parser = IncrementalJsonParser()
+        self.assertFalse(parser.feed("No JSON yet"))
+        self.assertIsNone(parser.partial().value)
+
+
+@pytest.mark.slow
+class ExtractJsonBenchmark(unittest.TestCase):
+    """Micro-benchmark against the regex on 100KB+ completions.
+
+    Run with `pytest tests/test_json_extraction.py -m slow -s`.
+    """
+
+    def time(self, func, text: str, number: int = 5) -> float:
+        return min(timeit.repeat(lambda: func(text), number=1, repeat=number))
+
+    def test_table_output(self):
+        for rows in (1000, 5000):
+            text = make_table_output(rows)
+            self.assertGreater(len(text), 100 * 1024)
+            scanner = self.time(extract_json, text)
+            regex = self.time(JSON_REGEX.search, text)
+            print(
+                f"\n{len(text) // 1024}KB table: scanner {scanner * 1000:.2f}ms, "
+                f"regex {regex * 1000:.2f}ms"
+            )
+            self.assertEqual(extract_json(text), JSON_REGEX.search(text).group(0))
+
+    def test_unbalanced_output(self):
+        # Openers without closers make the regex retry from each of them
+        text = "{" * 500 + " text" * 20500
+        self.assertGreater(len(text), 100 * 1024)
+        scanner = self.time(extract_json, text)
+        regex = self.time(JSON_REGEX.search, text, number=1)
+        print(
+            f"\n{len(text) // 1024}KB unbalanced: scanner {scanner * 1000:.2f}ms, "
+            f"regex {regex * 1000:.2f}ms"
+        )
+        self.assertLess(scanner, regex)
+
+
+if __name__ == "__main__":
+    unittest.main()
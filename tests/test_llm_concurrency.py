@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.llms import CompletionResponse, MockLLM
+from unstract.sdk.exceptions import SdkError
+from unstract.sdk.llm import LLM
+
+from tests.fake_adapters import FAKE_LLM_ADAPTER_ID, create_llm, fake_adapter
+
+
+class SlowLLM(MockLLM):
+    """Echoes the prompt as JSON after a delay, failing prompts with 'fail'."""
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _in_flight: int = PrivateAttr(default=0)
+    max_in_flight: int = 0
+
+    def _respond(self, prompt: str) -> CompletionResponse:
+        if "fail" in prompt:
+            raise ValueError(f"Provider rejected {prompt}")
+        return CompletionResponse(text=f'Sure: {{"prompt": "{prompt}"}}')
+
+    def complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            threading.Event().wait(0.05)
+            return self._respond(prompt)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def acomplete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        await asyncio.sleep(0.05)
+        return self._respond(prompt)
+
+
+@fake_adapter(LLM.llm_adapters, FAKE_LLM_ADAPTER_ID, SlowLLM)
+@patch("unstract.sdk.llm.SdkHelper.is_public_adapter", return_value=True)
+class LLMConcurrencyTest(unittest.TestCase):
+    def test_acomplete(self, _):
+        llm = create_llm()
+        result = asyncio.run(llm.acomplete("a"))
+        self.assertEqual(result[LLM.RESPONSE].text, '{"prompt": "a"}')
+
+        result = asyncio.run(llm.acomplete("a", extract_json=False))
+        self.assertEqual(result[LLM.RESPONSE].text, 'Sure: {"prompt": "a"}')
+
+    def test_acomplete_error(self, _):
+        llm = create_llm()
+        with self.assertRaises(SdkError):
+            asyncio.run(llm.acomplete("fail"))
+
+    def test_complete_many(self, _):
+        llm = create_llm()
+        prompts = [f"p{i}" for i in range(10)]
+        prompts[3] = "fail"
+
+        results = llm.complete_many(
+            prompts,
+            max_concurrency=4,
+            process_text=lambda response, extract_json: {"length": len(response.text)},
+        )
+
+        self.assertEqual(len(results), 10)
+        self.assertIsInstance(results[3], SdkError)
+        for index, result in enumerate(results):
+            if index == 3:
+                continue
+            self.assertEqual(
+                result[LLM.RESPONSE].text, f'{{"prompt": "p{index}"}}'
+            )
+            self.assertEqual(result["length"], len(result[LLM.RESPONSE].text))
+        max_in_flight = llm._llm_instance.max_in_flight
+        self.assertGreater(max_in_flight, 1)
+        self.assertLessEqual(max_in_flight, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.callbacks import CallbackManager, CBEventType, EventPayload
+from llama_index.core.callbacks.base_handler import BaseCallbackHandler
+from llama_index.core.llms import CompletionResponse, CompletionResponseGen, MockLLM
+from llama_index.core.llms.callbacks import llm_completion_callback
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice, ChoiceDelta
+from unstract.sdk.llm import LLM
+from unstract.sdk.utils.token_counter import TokenCounter
+from unstract.sdk.utils.tokenizer import count_tokens
+from unstract.sdk.utils.usage_handler import UsageHandler
+
+from tests.fake_adapters import FAKE_LLM_ADAPTER_ID, create_llm, fake_adapter
+
+REPLY = 'Here you go: {"invoice": "INV-1", "lines": [{"amount": 10}]} Anything else?'
+
+
+class StreamingLLM(MockLLM):
+    """Streams a reply a few characters at a time, counting those sent."""
+
+    _sent: int = PrivateAttr(default=0)
+
+    @llm_completion_callback()
+    def stream_complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponseGen:
+        def gen() -> CompletionResponseGen:
+            text = ""
+            for start in range(0, len(REPLY), 4):
+                delta = REPLY[start : start + 4]
+                text += delta
+                self._sent = len(text)
+                yield CompletionResponse(text=text, delta=delta, raw=_chunk(delta))
+
+        return gen()
+
+
+def _chunk(delta: str) -> ChatCompletionChunk:
+    """Chunk as streamed by OpenAI, which has no usage until the last one."""
+    return ChatCompletionChunk(
+        id="chunk",
+        object="chat.completion.chunk",
+        created=0,
+        model="gpt-4o",
+        choices=[Choice(index=0, delta=ChoiceDelta(content=delta))],
+    )
+
+
+class CompletionRecorder(BaseCallbackHandler):
+    def __init__(self) -> None:
+        super().__init__(event_starts_to_ignore=[], event_ends_to_ignore=[])
+        self.completions: list[str] = []
+
+    def on_event_start(self, event_type, payload=None, event_id="", **kwargs):
+        return event_id
+
+    def on_event_end(self, event_type, payload=None, event_id="", **kwargs):
+        if event_type == CBEventType.LLM and EventPayload.COMPLETION in payload:
+            self.completions.append(payload[EventPayload.COMPLETION].text)
+
+    def start_trace(self, trace_id=None):
+        pass
+
+    def end_trace(self, trace_id=None, trace_map=None):
+        pass
+
+
+@fake_adapter(LLM.llm_adapters, FAKE_LLM_ADAPTER_ID, StreamingLLM)
+@patch("unstract.sdk.llm.SdkHelper.is_public_adapter", return_value=True)
+class StreamCompleteJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.recorder = CompletionRecorder()
+
+    def create_llm(self) -> LLM:
+        llm = create_llm()
+        llm._llm_instance.callback_manager = CallbackManager([self.recorder])
+        return llm
+
+    def test_stops_once_json_closes(self, _):
+        llm = self.create_llm()
+        results = list(llm.stream_complete_json("prompt"))
+
+        final = results[-1]
+        self.assertTrue(final.complete)
+        self.assertEqual(final.value, {"invoice": "INV-1", "lines": [{"amount": 10}]})
+        self.assertEqual(results[0].value, {})
+        self.assertIn({"invoice": "INV-1"}, [result.value for result in results])
+        # The trailing chatter was never generated
+        self.assertLess(llm._llm_instance._sent, len(REPLY))
+        self.assertEqual(len(self.recorder.completions), 1)
+        self.assertNotIn("Anything else", self.recorder.completions[0])
+
+    def test_without_stopping(self, _):
+        llm = self.create_llm()
+        final = list(llm.stream_complete_json("prompt", stop_on_complete=False))[-1]
+        self.assertTrue(final.complete)
+        self.assertEqual(final.text, REPLY)
+        self.assertEqual(llm._llm_instance._sent, len(REPLY))
+        self.assertEqual(self.recorder.completions, [REPLY])
+
+
+@fake_adapter(LLM.llm_adapters, FAKE_LLM_ADAPTER_ID, StreamingLLM)
+@patch("unstract.sdk.llm.SdkHelper.is_public_adapter", return_value=True)
+@patch("unstract.sdk.utils.usage_handler.Audit.push_usage_data")
+class StreamUsageTest(unittest.TestCase):
+    def test_early_stop_counts_streamed_tokens(self, push_usage_data, _):
+        llm = create_llm()
+        handler = UsageHandler(
+            platform_api_key="api-key", llm_model=llm._llm_instance, kwargs={}
+        )
+        llm._llm_instance.callback_manager = CallbackManager([handler])
+
+        final = list(llm.stream_complete_json("prompt"))[-1]
+
+        push_usage_data.assert_called_once()
+        token_counter = push_usage_data.call_args.kwargs["token_counter"]
+        self.assertEqual(token_counter.prompt_llm_token_count, count_tokens("prompt"))
+        self.assertEqual(
+            token_counter.completion_llm_token_count, count_tokens(final.text)
+        )
+        self.assertGreater(token_counter.completion_llm_token_count, 0)
+
+    def test_response_without_raw(self, *_):
+        token_counter = TokenCounter.get_llm_token_counts(
+            {
+                EventPayload.PROMPT: "prompt",
+                EventPayload.COMPLETION: CompletionResponse(text="text", raw=None),
+            }
+        )
+        self.assertEqual(token_counter.total_llm_token_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
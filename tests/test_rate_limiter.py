@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llama_index.core import Document
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+from unstract.sdk.embedding import Embedding
+from unstract.sdk.utils.cache_backends import MemoryCacheBackend
+from unstract.sdk.utils.rate_limiter import (
+    MemoryRateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+    _take,
+)
+from unstract.sdk.vector_db import VectorDB
+
+from tests.fake_adapters import FAKE_EMBEDDING_ADAPTER_ID, create_embedding, fake_adapter
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+class TakeTest(unittest.TestCase):
+    def test_full_bucket(self):
+        self.assertEqual(_take(None, None, 0, 10, 1, 4), (6, 0))
+
+    def test_refills_over_time(self):
+        self.assertEqual(_take(0, 0, 3, 10, 1, 2), (1, 0))
+        self.assertEqual(_take(0, 0, 100, 10, 1, 2), (8, 0))
+
+    def test_wait_for_missing_amount(self):
+        level, wait = _take(1, 0, 0, 10, 2, 5)
+        self.assertEqual(level, 1)
+        self.assertEqual(wait, 2)
+
+    def test_amount_above_capacity(self):
+        self.assertEqual(_take(None, None, 0, 10, 1, 50), (0, 0))
+
+
+class FakeClock:
+    """Clock which only advances when sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch("time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_limiter(self, backend=None, **kwargs) -> RateLimiter:
+        return RateLimiter(
+            key="adapter",
+            backend=backend or MemoryRateLimitBackend(),
+            sleep=self.clock.sleep,
+            **kwargs,
+        )
+
+    def test_requests_per_minute(self):
+        limiter = self.create_limiter(requests_per_minute=60)
+        for _ in range(60):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertAlmostEqual(limiter.acquire(), 1)
+
+    def test_tokens_per_minute(self):
+        limiter = self.create_limiter(tokens_per_minute=1000)
+        limiter.acquire(tokens=900)
+        # 400 tokens short at 1000 / 60 tokens per second
+        self.assertAlmostEqual(limiter.acquire(tokens=500), 24)
+
+    def test_shared_by_limiters(self):
+        backend = MemoryRateLimitBackend()
+        first = self.create_limiter(backend, requests_per_minute=2)
+        second = self.create_limiter(backend, requests_per_minute=2)
+        self.assertEqual(first.acquire(), 0)
+        self.assertEqual(second.acquire(), 0)
+        self.assertAlmostEqual(first.acquire(), 30)
+
+    def test_aacquire_takes_in_thread(self):
+        backend = MemoryRateLimitBackend()
+        threads = []
+        take = backend.take
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return take(*args, **kwargs)
+
+        limiter = self.create_limiter(backend, requests_per_minute=60)
+        with patch.object(backend, "take", side_effect=record_thread):
+            self.assertEqual(asyncio.run(limiter.aacquire()), 0)
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    def test_from_adapter(self):
+        self.assertIsNone(RateLimiter.from_adapter("adapter", {}))
+        self.assertIsNone(
+            RateLimiter.from_adapter("adapter", {"requests_per_minute": ""})
+        )
+        limiter = RateLimiter.from_adapter("adapter", {"tokens_per_minute": "90000"})
+        self.assertEqual(limiter._tokens_per_minute, 90000)
+        self.assertIsNone(limiter._requests_per_minute)
+
+    @unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+    def test_redis_backend(self):
+        client = fakeredis.FakeRedis()
+        first = self.create_limiter(RedisRateLimitBackend(client), requests_per_minute=2)
+        second = self.create_limiter(RedisRateLimitBackend(client), requests_per_minute=2)
+        self.assertEqual(first.acquire(), 0)
+        self.assertEqual(second.acquire(), 0)
+        self.assertGreater(
+            RedisRateLimitBackend(client).take("adapter:requests", 2, 2 / 60, 1), 0
+        )
+
+
+class OfflineSentenceSplitter:
+    """Splits sentences without the NLTK and tiktoken data downloaded on use."""
+
+    @staticmethod
+    def from_defaults(**kwargs) -> SentenceSplitter:
+        return SentenceSplitter.from_defaults(
+            tokenizer=str.split,
+            chunking_tokenizer_fn=lambda text: text.split(". "),
+            **kwargs,
+        )
+
+
+@fake_adapter(
+    Embedding.embedding_adapters,
+    FAKE_EMBEDDING_ADAPTER_ID,
+    lambda: MockEmbedding(embed_dim=2, embed_batch_size=2),
+)
+@patch("unstract.sdk.embedding.SdkHelper.is_public_adapter", return_value=True)
+class EmbeddingRateLimitTest(unittest.TestCase):
+    def create_embedding(self, **kwargs) -> Embedding:
+        embedding = create_embedding(
+            metadata={"embedding_dimension": 2, "requests_per_minute": 1}, **kwargs
+        )
+        clock = FakeClock()
+        patcher = patch("time.monotonic", clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sleep = MagicMock(side_effect=clock.sleep)
+        embedding._rate_limiter._sleep = self.sleep
+        embedding._rate_limiter._backend = MemoryRateLimitBackend()
+        return embedding
+
+    @patch("unstract.sdk.vector_db.SentenceSplitter", OfflineSentenceSplitter)
+    def test_indexing_is_limited(self, _):
+        embedding = self.create_embedding()
+        vector_db = VectorDB(tool=MagicMock(), embedding=embedding)
+        text = " ".join(f"Sentence number {i} of the document." for i in range(40))
+        with patch.object(
+            embedding._rate_limiter, "acquire", wraps=embedding._rate_limiter.acquire
+        ) as acquire:
+            vector_db.index_document(
+                [Document(text=text)], chunk_size=32, chunk_overlap=0
+            )
+        # One request per batch of two nodes, each batch after the first waits
+        self.assertGreater(acquire.call_count, 1)
+        self.assertEqual(self.sleep.call_count, acquire.call_count - 1)
+
+    def test_cached_queries_are_not_limited(self, _):
+        embedding = self.create_embedding(cache_backend=MemoryCacheBackend())
+        with patch.object(
+            embedding._rate_limiter, "acquire", wraps=embedding._rate_limiter.acquire
+        ) as acquire:
+            first = embedding.get_query_embedding("query")
+            self.assertEqual(embedding.get_query_embedding("query"), first)
+        acquire.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from unstract.sdk import profiler
+from unstract.sdk.profiler import StartupProfiler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StartupProfilerTest(unittest.TestCase):
+    def test_import_times(self):
+        clock = FakeClock()
+        startup_profiler = StartupProfiler(clock=clock)
+        with startup_profiler.time_import("parent"):
+            clock.now += 1
+            with startup_profiler.time_import("parent.child"):
+                clock.now += 2
+            clock.now += 0.5
+
+        self.assertEqual(startup_profiler.imports["parent"], (3.5, 1.5))
+        self.assertEqual(startup_profiler.imports["parent.child"], (2, 2))
+        report = startup_profiler.report(top=1)
+        self.assertEqual(report["import_total"], 3.5)
+        self.assertEqual(report["packages"], {"parent": 3.5})
+        self.assertEqual(
+            report["imports"], [{"module": "parent", "cumulative": 3.5, "self": 1.5}]
+        )
+
+    def test_phases(self):
+        clock = FakeClock()
+        startup_profiler = StartupProfiler(clock=clock)
+        clock.now = 1
+        with self.assertRaises(ValueError), startup_profiler.phase("validate"):
+            clock.now = 3
+            raise ValueError
+
+        report = startup_profiler.report()
+        self.assertEqual(
+            report["phases"], [{"phase": "validate", "start": 1, "duration": 2}]
+        )
+        self.assertEqual(report["elapsed"], 3)
+
+    def test_times_real_imports(self):
+        package_dir = tempfile.mkdtemp()
+        with open(os.path.join(package_dir, "profiled_module.py"), "w") as f:
+            f.write("import json\nVALUE = 1\n")
+        self.addCleanup(sys.modules.pop, "profiled_module", None)
+        startup_profiler = StartupProfiler()
+        startup_profiler.install()
+        try:
+            with patch.object(sys, "path", [package_dir, *sys.path]):
+                module = importlib.import_module("profiled_module")
+        finally:
+            startup_profiler.uninstall()
+
+        self.assertEqual(module.VALUE, 1)
+        self.assertIn("profiled_module", startup_profiler.imports)
+        self.assertNotIn(startup_profiler._finder, sys.meta_path)
+
+    def test_phase_without_profiler(self):
+        with patch.object(profiler, "_profiler", None):
+            with profiler.phase("run"):
+                pass
+            self.assertIsNone(profiler.get_profiler())
+            startup_profiler = profiler.enable(time_imports=False)
+            with profiler.phase("run"):
+                pass
+        self.assertEqual(startup_profiler.phases[0][0], "run")
+
+
+if __name__ == "__main__":
+    unittest.main()
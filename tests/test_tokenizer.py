@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from llama_index.core.callbacks import CBEventType, EventPayload
+from llama_index.core.llms import CompletionResponse
+
+from unstract.sdk.utils import tokenizer
+from unstract.sdk.utils.callback_manager import BatchTokenCountingHandler
+
+# Not patched, to check the hash of cached files
+READ_ENCODING = tokenizer._read_encoding
+
+
+class FakeEncoding:
+    """Encodes each word as one token."""
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        return [len(word) for word in text.split()]
+
+    def encode_to_numpy(self, text: str, **kwargs) -> np.ndarray:
+        return np.array(self.encode_ordinary(text), dtype=np.uint32)
+
+
+class TokenizerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.read_encoding = MagicMock(side_effect=lambda *_: FakeEncoding())
+        self.read_file = MagicMock(return_value=b"encoding")
+        patchers = [
+            patch.dict(tokenizer._encodings, clear=True),
+            patch.dict(tokenizer._encodings_by_name, clear=True),
+            patch.dict(
+                os.environ,
+                {
+                    tokenizer.Constants.CACHE_DIR_ENV: self.cache_dir,
+                    tokenizer.Constants.DOWNLOAD_ENV: "",
+                },
+            ),
+            patch("unstract.sdk.utils.tokenizer._read_encoding", self.read_encoding),
+            patch("unstract.sdk.utils.tokenizer.read_file", self.read_file),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache("cl100k_base")
+
+    def cache(self, encoding_name: str, data: bytes = b"") -> str:
+        cache_path = tokenizer.get_cache_path(encoding_name)
+        with open(cache_path, "wb") as f:
+            f.write(data)
+        return cache_path
+
+
+class TokenizerRegistryTest(TokenizerTestCase):
+    def test_loaded_once_per_encoding(self):
+        first = tokenizer.get_encoding("text-embedding-3-small")
+        self.assertIs(tokenizer.get_encoding("text-embedding-3-small"), first)
+        # Both models use cl100k_base
+        self.assertIs(tokenizer.get_encoding("gpt-4"), first)
+        self.read_encoding.assert_called_once_with(
+            "cl100k_base", tokenizer.get_cache_path("cl100k_base")
+        )
+
+    def test_unknown_model_uses_fallback(self):
+        with self.assertLogs(tokenizer.logger, "WARNING"):
+            encoding = tokenizer.get_encoding("some-local-model")
+        self.assertIs(encoding, tokenizer.get_encoding("gpt-3.5-turbo"))
+        self.assertIs(tokenizer.get_encoding(None), encoding)
+        self.assertEqual(self.read_encoding.call_count, 1)
+
+    def test_not_cached_is_estimated(self):
+        with self.assertLogs(tokenizer.logger, "WARNING"):
+            encoding = tokenizer.get_encoding("gpt-4o")
+        self.assertIsInstance(encoding, tokenizer.EstimatedEncoding)
+        self.assertEqual(tokenizer.count_tokens("x" * 9, "gpt-4o"), 3)
+        self.read_file.assert_not_called()
+        self.read_encoding.assert_not_called()
+
+    def test_download(self):
+        environ = dict(os.environ, **{tokenizer.Constants.DOWNLOAD_ENV: "true"})
+        with patch.dict(os.environ, environ):
+            self.assertIsInstance(tokenizer.get_encoding("gpt-4o"), FakeEncoding)
+            self.assertEqual(os.environ, environ)
+        self.read_file.assert_called_once_with(tokenizer.ENCODING_URLS["o200k_base"])
+        with open(tokenizer.get_cache_path("o200k_base"), "rb") as f:
+            self.assertEqual(f.read(), b"encoding")
+
+    def test_download_error(self):
+        self.read_file.side_effect = ConnectionError("Name resolution failed")
+        with patch.dict(os.environ, {tokenizer.Constants.DOWNLOAD_ENV: "true"}):
+            with self.assertLogs(tokenizer.logger, "WARNING"):
+                encoding = tokenizer.get_encoding("gpt-4o")
+        self.assertIsInstance(encoding, tokenizer.EstimatedEncoding)
+
+    def test_corrupt_cache_is_estimated(self):
+        self.read_encoding.side_effect = READ_ENCODING
+        self.cache("cl100k_base", b"not an encoding")
+        with self.assertLogs(tokenizer.logger, "WARNING"):
+            encoding = tokenizer.get_encoding("gpt-4")
+        self.assertIsInstance(encoding, tokenizer.EstimatedEncoding)
+
+    def test_warm_up(self):
+        target = os.path.join(self.cache_dir, "image")
+        environ = dict(os.environ)
+        paths = tokenizer.warm_up(["o200k_base"], cache_dir=target)
+        self.assertEqual(os.environ, environ)
+        self.assertEqual(paths, [tokenizer.get_cache_path("o200k_base", target)])
+        self.read_file.assert_called_once_with(tokenizer.ENCODING_URLS["o200k_base"])
+        self.read_encoding.assert_called_once_with("o200k_base", paths[0])
+
+    def test_count_tokens_batch(self):
+        texts = [f"text {'word ' * index}" for index in range(40)]
+        expected = [tokenizer.count_tokens(text) for text in texts]
+        self.assertEqual(expected[:3], [1, 2, 3])
+        self.assertEqual(tokenizer.count_tokens_batch(texts), expected)
+        self.assertEqual(tokenizer.count_tokens_batch(texts, num_threads=1), expected)
+        self.assertEqual(tokenizer.count_tokens_batch([]), [])
+
+
+class BatchTokenCountingHandlerTest(TokenizerTestCase):
+    def test_embedding_tokens(self):
+        handler = BatchTokenCountingHandler("text-embedding-3-small")
+        handler.on_event_end(
+            CBEventType.EMBEDDING,
+            payload={EventPayload.CHUNKS: ["one two", "three"]},
+        )
+        self.assertEqual(handler.total_embedding_token_count, 3)
+        self.assertEqual(len(handler.embedding_token_counts), 2)
+
+    def test_llm_tokens(self):
+        payload = {
+            EventPayload.PROMPT: "a long prompt",
+            EventPayload.COMPLETION: CompletionResponse(
+                text="a reply", raw={"usage": {"completion_tokens": 7}}
+            ),
+        }
+        handler = BatchTokenCountingHandler()
+        handler.on_event_end(CBEventType.LLM, payload=payload)
+        # The prompt tokens weren't reported so they are counted locally
+        self.assertEqual(handler.prompt_llm_token_count, 3)
+        self.assertEqual(handler.completion_llm_token_count, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
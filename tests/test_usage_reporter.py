@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from unstract.sdk.audit import Audit
+from unstract.sdk.constants import ToolEnv
+from unstract.sdk.usage_reporter import UsageRecord, UsageReporter
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.posted: list[dict] = []
+        self.available = True
+        self.pushed = threading.Event()
+
+    def post(self, url: str, headers: dict, json: dict, timeout: float):
+        if not self.available:
+            raise requests.ConnectionError("Connection refused")
+        self.posted.append(json)
+        self.pushed.set()
+        return MagicMock(status_code=200)
+
+
+class UsageReporterTest(unittest.TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir)
+        self.reporter = self._create()
+        self.addCleanup(self.reporter.close)
+
+    def _create(self, **kwargs) -> UsageReporter:
+        kwargs = {
+            "batch_size": 3,
+            "flush_interval": 60,
+            "spool_dir": self.spool_dir,
+            "session": self.session,
+            **kwargs,
+        }
+        return UsageReporter(**kwargs)
+
+    def _report(self, reporter: UsageReporter, count: int) -> None:
+        for index in range(count):
+            reporter.report(
+                UsageRecord(
+                    url="http://platform/usage",
+                    platform_api_key="key",
+                    data={"index": index},
+                )
+            )
+
+    def test_flushed_by_size(self):
+        self._report(self.reporter, 2)
+        self.assertFalse(self.session.pushed.wait(0.2))
+        self._report(self.reporter, 1)
+        self.assertTrue(self.session.pushed.wait(5))
+        self.reporter.close()
+        self.assertEqual(self.session.posted, [{"index": 0}, {"index": 1}, {"index": 0}])
+
+    def test_flushed_by_time(self):
+        reporter = self._create(flush_interval=0.05)
+        self.addCleanup(reporter.close)
+        self._report(reporter, 1)
+        self.assertTrue(self.session.pushed.wait(5))
+
+    def test_flushed_on_close(self):
+        self._report(self.reporter, 2)
+        self.reporter.close()
+        self.assertEqual(len(self.session.posted), 2)
+        with self.assertRaises(RuntimeError):
+            self._report(self.reporter, 1)
+
+    def test_spooled_when_unavailable(self):
+        self.session.available = False
+        self._report(self.reporter, 2)
+        self.reporter.flush()
+        self.assertEqual(self.reporter.queue_size, 0)
+        self.assertEqual(len(os.listdir(self.spool_dir)), 1)
+        # Still unavailable, so kept spooled
+        self.reporter.flush()
+        self.assertEqual(len(os.listdir(self.spool_dir)), 1)
+
+        # Pushed by the next reporter to flush
+        self.session.available = True
+        reporter = self._create()
+        reporter.flush()
+        self.assertEqual(self.session.posted, [{"index": 0}, {"index": 1}])
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    def test_spooled_when_full(self):
+        reporter = self._create(max_queue_size=1)
+        self.session.available = False
+        self._report(reporter, 2)
+        self.assertEqual(reporter.queue_size, 1)
+        self.assertEqual(len(os.listdir(self.spool_dir)), 1)
+
+
+class AuditTest(unittest.TestCase):
+    def setUp(self):
+        env = {ToolEnv.PLATFORM_HOST: "http://platform", ToolEnv.PLATFORM_PORT: "3001"}
+        patcher = patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("unstract.sdk.audit.get_usage_reporter")
+    def test_page_usage_reported(self, get_usage_reporter):
+        Audit().push_page_usage_data(
+            platform_api_key="key",
+            page_count=2,
+            file_size=10,
+            file_type="application/pdf",
+            kwargs={"run_id": "run", "file_name": "file.pdf"},
+        )
+        record = get_usage_reporter.return_value.report.call_args.args[0]
+        self.assertEqual(record.url, "http://platform:3001/page-usage")
+        self.assertEqual(record.data["page_count"], 2)
+
+    @patch.dict(os.environ, {"USAGE_REPORTER_ENABLED": "false"})
+    @patch("unstract.sdk.audit.get_http_session")
+    @patch("unstract.sdk.audit.get_usage_reporter")
+    def test_pushed_when_disabled(self, get_usage_reporter, get_http_session):
+        token_counter = MagicMock()
+        Audit().push_usage_data(
+            platform_api_key="key",
+            token_counter=token_counter,
+            model_name="model",
+            event_type="llm",
+            kwargs={"run_id": "run"},
+        )
+        get_usage_reporter.assert_not_called()
+        self.assertEqual(
+            get_http_session.return_value.post.call_args.args[0],
+            "http://platform:3001/usage",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()